@@ -83,7 +83,8 @@ Ingestion:
     DocumentIngester, FixedSizeChunker, RecursiveCharacterChunker,
     SemanticChunker, SentenceChunker, ParentChildChunker, ParentExpander,
     PlainTextParser, MarkdownParser, HTMLParser, PDFParser,
-    MetadataEnricher, generate_doc_id, generate_chunk_id, extract_chunk_metadata
+    MetadataEnricher, generate_doc_id, generate_chunk_id, extract_chunk_metadata,
+    encode_chunks
 
 Exceptions:
     AstroContextError, FormatterError, IngestionError, RetrieverError,
@@ -154,6 +155,7 @@ from anchor.ingestion import (
     SemanticChunker,
     SentenceChunker,
     TableAwareChunker,
+    encode_chunks,
     extract_chunk_metadata,
     generate_chunk_id,
     generate_doc_id,
@@ -543,6 +545,7 @@ __all__ = [
     "default_agent_budget",
     "default_chat_budget",
     "default_rag_budget",
+    "encode_chunks",
     "extract_chunk_metadata",
     "filter_step",
     "generate_chunk_id",
@@ -7,10 +7,14 @@ outside this package.
 
 from __future__ import annotations
 
+from operator import attrgetter
 from typing import Any, NamedTuple
 
 from anchor.models.context import ContextItem, ContextWindow, SourceType
 
+_CREATED_AT = attrgetter("created_at")
+"""C-level sort key; avoids a Python lambda frame per item."""
+
 _ALLOWED_ROLES: frozenset[str] = frozenset({"user", "assistant", "system", "tool"})
 """Roles accepted by the Anthropic and OpenAI message APIs."""
 
@@ -91,7 +95,7 @@ def classify_window_items(window: ContextWindow) -> ClassifiedItems:
         else:
             context_parts.append(item.content)
 
-    memory_items.sort(key=lambda item: item.created_at)
+    memory_items.sort(key=_CREATED_AT)
     return ClassifiedItems(system_parts, memory_items, context_parts)
 
 
@@ -4,7 +4,13 @@ Provides chunkers, parsers, metadata utilities, and an orchestrator
 for converting raw documents into ``ContextItem`` objects.
 """
 
-from .chunkers import FixedSizeChunker, RecursiveCharacterChunker, SemanticChunker, SentenceChunker
+from .chunkers import (
+    FixedSizeChunker,
+    RecursiveCharacterChunker,
+    SemanticChunker,
+    SentenceChunker,
+    encode_chunks,
+)
 from .code_chunker import CodeChunker
 from .hierarchical import ParentChildChunker, ParentExpander
 from .ingester import DocumentIngester
@@ -27,6 +33,7 @@ __all__ = [
     "SemanticChunker",
     "SentenceChunker",
     "TableAwareChunker",
+    "encode_chunks",
     "extract_chunk_metadata",
     "generate_chunk_id",
     "generate_doc_id",
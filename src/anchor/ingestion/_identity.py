@@ -0,0 +1,22 @@
+"""Shared cache-identity helpers for chunkers and the ingester."""
+
+from __future__ import annotations
+
+
+def identity_of(obj: object) -> str | None:
+    """Return ``obj.cache_identity()``, or ``None`` if it has no such hook."""
+    method = getattr(obj, "cache_identity", None)
+    return method() if method is not None else None
+
+
+def config_identity(owner: object, tokenizer: object, *config: object) -> str | None:
+    """Build a chunker's cache identity from its class, tokenizer and *config*.
+
+    Returns ``None`` when the tokenizer cannot be identified, since its
+    counts decide where chunks are split.
+    """
+    tokenizer_identity = identity_of(tokenizer)
+    if tokenizer_identity is None:
+        return None
+    cls = type(owner)
+    return repr((f"{cls.__module__}.{cls.__qualname__}", tokenizer_identity, *config))
@@ -9,28 +9,46 @@ from __future__ import annotations
 import logging
 import math
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from typing import Any
 
+from anchor.ingestion._identity import config_identity
 from anchor.protocols.tokenizer import Tokenizer
-from anchor.tokens.counter import get_default_counter
+from anchor.tokens.counter import count_tokens_batch, get_default_counter
 
 logger = logging.getLogger(__name__)
 
 
+def _free_word_budget(chunk_size: int, max_tokens_per_word: int | None) -> int:
+    """Return how many words are guaranteed to fit without counting tokens."""
+    if max_tokens_per_word is None:
+        return 0
+    if max_tokens_per_word <= 0:
+        msg = f"max_tokens_per_word must be positive, got {max_tokens_per_word}"
+        raise ValueError(msg)
+    return chunk_size // max_tokens_per_word
+
+
 class FixedSizeChunker:
     """Split text into fixed-size chunks by token count.
 
+    When ``max_tokens_per_word`` is given, it is treated as a guaranteed
+    upper bound on tokens per whitespace-separated word: candidates whose
+    word count times that bound still fits in ``chunk_size`` are accepted
+    without calling the tokenizer.  Leave it as ``None`` (the default) when
+    the tokenizer offers no such guarantee.
+
     Implements the ``Chunker`` protocol.
     """
 
-    __slots__ = ("_chunk_size", "_overlap", "_tokenizer")
+    __slots__ = ("_chunk_size", "_free_words", "_overlap", "_tokenizer")
 
     def __init__(
         self,
         chunk_size: int = 512,
         overlap: int = 50,
         tokenizer: Tokenizer | None = None,
+        max_tokens_per_word: int | None = None,
     ) -> None:
         if chunk_size <= 0:
             msg = f"chunk_size must be positive, got {chunk_size}"
@@ -44,6 +62,7 @@ class FixedSizeChunker:
         self._chunk_size = chunk_size
         self._overlap = overlap
         self._tokenizer = tokenizer or get_default_counter()
+        self._free_words = _free_word_budget(chunk_size, max_tokens_per_word)
 
     def chunk(self, text: str, metadata: dict[str, Any] | None = None) -> list[str]:
         """Split text into fixed-size token chunks with overlap.
@@ -55,29 +74,48 @@ class FixedSizeChunker:
         Returns:
             A list of text chunks.
         """
+        return list(self.chunk_iter(text))
+
+    def chunk_iter(self, text: str) -> Iterator[str]:
+        """Lazily yield fixed-size token chunks with overlap.
+
+        Produces the same chunks as :meth:`chunk`, one at a time, so
+        streaming consumers never hold the full chunk list in memory.
+
+        Parameters:
+            text: The text to chunk.
+
+        Yields:
+            Text chunks in document order.
+        """
         if not text or not text.strip():
-            return []
+            return
 
         words = text.split()
-        chunks: list[str] = []
+        num_words = len(words)
+        count_tokens = self._tokenizer.count_tokens
+        chunk_size = self._chunk_size
+        free_words = self._free_words
         start = 0
 
-        while start < len(words):
-            # Build a chunk up to chunk_size tokens
+        while start < num_words:
+            # Build a chunk up to chunk_size tokens, extending the previous
+            # candidate by one word instead of re-joining the whole slice
             end = start
             candidate = ""
-            while end < len(words):
-                trial = " ".join(words[start : end + 1])
-                if self._tokenizer.count_tokens(trial) > self._chunk_size and end > start:
+            while end < num_words:
+                trial = f"{candidate} {words[end]}" if candidate else words[end]
+                # The first ``free_words`` words always fit; only count beyond that
+                if end - start >= free_words and count_tokens(trial) > chunk_size and end > start:
                     break
                 candidate = trial
                 end += 1
 
             if candidate:
-                chunks.append(candidate)
+                yield candidate
 
             # If this chunk reached the end of the text, we're done
-            if end >= len(words):
+            if end >= num_words:
                 break
 
             # Advance by (chunk_size - overlap) worth of words
@@ -90,22 +128,30 @@ class FixedSizeChunker:
                 step = max(1, chunk_word_count - self._overlap_words(words, start, end))
                 start += step
 
-        return chunks
-
     def _overlap_words(self, words: list[str], start: int, end: int) -> int:
         """Calculate number of trailing words that fit in overlap tokens."""
-        if self._overlap == 0:
+        overlap = self._overlap
+        if overlap == 0:
             return 0
+        count_tokens = self._tokenizer.count_tokens
         count = 0
         idx = end - 1
+        trail = ""
         while idx >= start and count < (end - start):
-            trail = " ".join(words[idx:end])
-            if self._tokenizer.count_tokens(trail) > self._overlap:
+            # Grow the trailing window leftwards by prepending one word
+            trail = f"{words[idx]} {trail}" if trail else words[idx]
+            if count_tokens(trail) > overlap:
                 break
             count += 1
             idx -= 1
         return count
 
+    def cache_identity(self) -> str | None:
+        """Identify this configuration for chunk caches (see ``Chunker``)."""
+        return config_identity(
+            self, self._tokenizer, self._chunk_size, self._overlap, self._free_words
+        )
+
     def __repr__(self) -> str:
         return (
             f"FixedSizeChunker(chunk_size={self._chunk_size}, "
@@ -162,13 +208,15 @@ class RecursiveCharacterChunker:
 
     def _split(self, text: str, sep_idx: int) -> list[str]:
         """Recursively split text, falling back to finer separators."""
-        if self._tokenizer.count_tokens(text) <= self._chunk_size:
+        count_tokens = self._tokenizer.count_tokens
+        chunk_size = self._chunk_size
+        if count_tokens(text) <= chunk_size:
             stripped = text.strip()
             return [stripped] if stripped else []
 
         if sep_idx >= len(self._separators):
             # No more separators; truncate to chunk_size
-            return [self._tokenizer.truncate_to_tokens(text, self._chunk_size)]
+            return [self._tokenizer.truncate_to_tokens(text, chunk_size)]
 
         separator = self._separators[sep_idx]
         parts = text.split(separator)
@@ -179,13 +227,13 @@ class RecursiveCharacterChunker:
         for part in parts:
             candidate = separator.join([current, part]) if current else part
 
-            if self._tokenizer.count_tokens(candidate) <= self._chunk_size:
+            if count_tokens(candidate) <= chunk_size:
                 current = candidate
             else:
                 if current.strip():
                     chunks.append(current.strip())
                 # If the part itself exceeds chunk_size, split it further
-                if self._tokenizer.count_tokens(part) > self._chunk_size:
+                if count_tokens(part) > chunk_size:
                     sub_chunks = self._split(part, sep_idx + 1)
                     chunks.extend(sub_chunks)
                     current = ""
@@ -199,23 +247,26 @@ class RecursiveCharacterChunker:
 
     def _apply_overlap(self, chunks: list[str]) -> list[str]:
         """Apply token-based overlap between adjacent chunks."""
-        if self._overlap == 0 or len(chunks) <= 1:
+        overlap = self._overlap
+        if overlap == 0 or len(chunks) <= 1:
             return chunks
 
+        count_tokens = self._tokenizer.count_tokens
+        chunk_size = self._chunk_size
         result: list[str] = [chunks[0]]
         for i in range(1, len(chunks)):
             prev_words = chunks[i - 1].split()
             overlap_text = ""
             for j in range(len(prev_words) - 1, -1, -1):
                 candidate = " ".join(prev_words[j:])
-                if self._tokenizer.count_tokens(candidate) > self._overlap:
+                if count_tokens(candidate) > overlap:
                     break
                 overlap_text = candidate
 
             if overlap_text:
                 merged = overlap_text + " " + chunks[i]
                 # Only add overlap if it doesn't exceed chunk_size
-                if self._tokenizer.count_tokens(merged) <= self._chunk_size:
+                if count_tokens(merged) <= chunk_size:
                     result.append(merged)
                 else:
                     result.append(chunks[i])
@@ -224,6 +275,12 @@ class RecursiveCharacterChunker:
 
         return result
 
+    def cache_identity(self) -> str | None:
+        """Identify this configuration for chunk caches (see ``Chunker``)."""
+        return config_identity(
+            self, self._tokenizer, self._chunk_size, self._overlap, tuple(self._separators)
+        )
+
     def __repr__(self) -> str:
         return (
             f"RecursiveCharacterChunker(chunk_size={self._chunk_size}, "
@@ -234,13 +291,27 @@ class RecursiveCharacterChunker:
 class SentenceChunker:
     """Split text at sentence boundaries, grouping sentences to fill chunks.
 
-    Uses regex-based sentence boundary detection.  Overlap is measured
-    in sentences rather than tokens.
+    Uses regex-based sentence boundary detection by default.  Pass
+    ``use_blingfire=True`` to delegate sentence detection to the compiled
+    ``blingfire`` splitter instead, which is considerably faster on
+    book-scale documents (requires the ``blingfire`` extra).  Overlap is
+    measured in sentences rather than tokens.
+
+    ``max_tokens_per_word`` has the same meaning as on
+    :class:`FixedSizeChunker`: sentence groups whose total word count is
+    provably within budget skip the tokenizer call.
 
     Implements the ``Chunker`` protocol.
     """
 
-    __slots__ = ("_chunk_size", "_overlap", "_sentence_pattern", "_tokenizer")
+    __slots__ = (
+        "_chunk_size",
+        "_free_words",
+        "_overlap",
+        "_sentence_pattern",
+        "_splitter",
+        "_tokenizer",
+    )
 
     _SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
 
@@ -249,6 +320,8 @@ class SentenceChunker:
         chunk_size: int = 512,
         overlap: int = 1,
         tokenizer: Tokenizer | None = None,
+        use_blingfire: bool = False,
+        max_tokens_per_word: int | None = None,
     ) -> None:
         if chunk_size <= 0:
             msg = f"chunk_size must be positive, got {chunk_size}"
@@ -260,6 +333,18 @@ class SentenceChunker:
         self._overlap = overlap
         self._tokenizer = tokenizer or get_default_counter()
         self._sentence_pattern = self._SENTENCE_RE
+        self._free_words = _free_word_budget(chunk_size, max_tokens_per_word)
+        self._splitter: Callable[[str], str] | None = None
+        if use_blingfire:
+            try:
+                import blingfire
+            except ImportError:
+                msg = (
+                    "blingfire is required for use_blingfire=True. "
+                    "Install it with: pip install anchor[blingfire]"
+                )
+                raise ImportError(msg) from None
+            self._splitter = blingfire.text_to_sentences
 
     def chunk(self, text: str, metadata: dict[str, Any] | None = None) -> list[str]:
         """Split text into sentence-based chunks.
@@ -271,45 +356,80 @@ class SentenceChunker:
         Returns:
             A list of text chunks, each containing one or more sentences.
         """
+        return list(self.chunk_iter(text))
+
+    def chunk_iter(self, text: str) -> Iterator[str]:
+        """Lazily yield sentence-based chunks.
+
+        Produces the same chunks as :meth:`chunk`, one at a time.
+
+        Parameters:
+            text: The text to chunk.
+
+        Yields:
+            Text chunks in document order.
+        """
         if not text or not text.strip():
-            return []
+            return
 
         sentences = self._split_sentences(text)
-        if not sentences:
-            return []
-
-        chunks: list[str] = []
+        num_sentences = len(sentences)
+        count_tokens = self._tokenizer.count_tokens
+        chunk_size = self._chunk_size
+        free_words = self._free_words
+        word_counts = [len(s.split()) for s in sentences] if free_words else []
         start = 0
 
-        while start < len(sentences):
+        while start < num_sentences:
             end = start
             current = ""
-
-            while end < len(sentences):
-                candidate = " ".join(sentences[start : end + 1])
-                if self._tokenizer.count_tokens(candidate) > self._chunk_size and end > start:
+            group_words = 0
+
+            while end < num_sentences:
+                # Extend the previous group rather than re-joining the slice
+                candidate = f"{current} {sentences[end]}" if end > start else sentences[end]
+                # Groups within the free word budget always fit; only count beyond it
+                group_words += word_counts[end] if free_words else 1
+                if (
+                    group_words > free_words
+                    and count_tokens(candidate) > chunk_size
+                    and end > start
+                ):
                     break
                 current = candidate
                 end += 1
 
             if current:
-                chunks.append(current)
+                yield current
 
             if end == start:
                 # Single sentence exceeds chunk_size; include it anyway
-                chunks.append(sentences[start])
+                yield sentences[start]
                 start = end + 1
             else:
                 step = max(1, (end - start) - self._overlap)
                 start += step
 
-        return chunks
-
     def _split_sentences(self, text: str) -> list[str]:
-        """Split text into sentences using regex."""
+        """Split text into sentences using blingfire or the regex fallback."""
+        if self._splitter is not None:
+            # blingfire emits one sentence per line
+            return [s for s in self._splitter(text).split("\n") if s]
         sentences = self._sentence_pattern.split(text)
         return [s.strip() for s in sentences if s.strip()]
 
+    def cache_identity(self) -> str | None:
+        """Identify this configuration for chunk caches (see ``Chunker``)."""
+        return config_identity(
+            self,
+            self._tokenizer,
+            self._chunk_size,
+            self._overlap,
+            self._free_words,
+            self._sentence_pattern.pattern,
+            self._splitter is not None,
+        )
+
     def __repr__(self) -> str:
         return (
             f"SentenceChunker(chunk_size={self._chunk_size}, "
@@ -317,6 +437,32 @@ class SentenceChunker:
         )
 
 
+def encode_chunks(chunks: list[str]) -> list[tuple[int, int, memoryview]]:
+    """Encode chunks into one shared UTF-8 buffer and return zero-copy views.
+
+    Downstream embedding clients typically need bytes.  Each chunk is
+    encoded exactly once, the encodings are joined into one buffer, and
+    each chunk is exposed as a ``memoryview`` slice of that buffer, with
+    offsets taken from the length of its own encoding.
+
+    Parameters:
+        chunks: Chunk strings as returned by any chunker's ``chunk()``.
+
+    Returns:
+        A list of ``(byte_start, byte_end, view)`` tuples, one per chunk,
+        where ``view`` is ``memoryview(buffer)[byte_start:byte_end]``.
+    """
+    encoded = [chunk.encode("utf-8") for chunk in chunks]
+    view = memoryview(b"".join(encoded))
+    spans: list[tuple[int, int, memoryview]] = []
+    pos = 0
+    for data in encoded:
+        end = pos + len(data)
+        spans.append((pos, end, view[pos:end]))
+        pos = end
+    return spans
+
+
 def _cosine_similarity(a: list[float], b: list[float]) -> float:
     """Compute cosine similarity between two vectors.
 
@@ -424,8 +570,9 @@ class SemanticChunker:
         fallback = FixedSizeChunker(
             chunk_size=self._chunk_size, overlap=0, tokenizer=self._tokenizer
         )
-        for group in groups:
-            if self._tokenizer.count_tokens(group) > self._chunk_size:
+        group_tokens = count_tokens_batch(self._tokenizer, groups)
+        for group, tokens in zip(groups, group_tokens, strict=True):
+            if tokens > self._chunk_size:
                 result.extend(fallback.chunk(group))
             else:
                 result.append(group)
@@ -474,16 +621,24 @@ class SemanticChunker:
         if self._min_chunk_size <= 0 or len(chunks) <= 1:
             return chunks
 
+        # Count every original chunk in one batch; only merged chunks need
+        # a fresh count afterwards.
+        chunk_tokens = count_tokens_batch(self._tokenizer, chunks)
         merged: list[str] = [chunks[0]]
-        for chunk in chunks[1:]:
-            prev_tokens = self._tokenizer.count_tokens(merged[-1])
-            cur_tokens = self._tokenizer.count_tokens(chunk)
+        prev_tokens = chunk_tokens[0]
+        for chunk, cur_tokens in zip(chunks[1:], chunk_tokens[1:], strict=True):
             if prev_tokens < self._min_chunk_size or cur_tokens < self._min_chunk_size:
                 merged[-1] = merged[-1] + " " + chunk
+                prev_tokens = self._tokenizer.count_tokens(merged[-1])
             else:
                 merged.append(chunk)
+                prev_tokens = cur_tokens
         return merged
 
+    def cache_identity(self) -> None:
+        """Always ``None``: the ``embed_fn`` cannot be identified for caching."""
+        return None
+
     def __repr__(self) -> str:
         return (
             f"SemanticChunker(threshold={self._threshold}, "
@@ -12,6 +12,7 @@ import logging
 import re
 from typing import Any
 
+from anchor.ingestion._identity import config_identity
 from anchor.ingestion.chunkers import RecursiveCharacterChunker
 from anchor.protocols.tokenizer import Tokenizer
 from anchor.tokens.counter import get_default_counter
@@ -128,20 +129,22 @@ class CodeChunker:
     def _split_and_merge(self, text: str, boundaries: list[int]) -> list[str]:
         """Split text at boundary positions, then merge small blocks."""
         # Build blocks between boundaries
-        blocks: list[str] = []
-        positions = [0, *boundaries] if boundaries[0] != 0 else list(boundaries)
-        for i, pos in enumerate(positions):
-            end = positions[i + 1] if i + 1 < len(positions) else len(text)
-            block = text[pos:end]
-            if block.strip():
-                blocks.append(block)
+        starts = boundaries if boundaries[0] == 0 else [0, *boundaries]
+        ends = [*starts[1:], len(text)]
+        blocks = [
+            block
+            for start, end in zip(starts, ends, strict=True)
+            if (block := text[start:end]).strip()
+        ]
 
         # Merge small adjacent blocks
+        count_tokens = self._tokenizer.count_tokens
+        chunk_size = self._chunk_size
         chunks: list[str] = []
         current = ""
         for block in blocks:
             candidate = current + block if current else block
-            if self._tokenizer.count_tokens(candidate) <= self._chunk_size:
+            if count_tokens(candidate) <= chunk_size:
                 current = candidate
             else:
                 if current.strip():
@@ -153,6 +156,12 @@ class CodeChunker:
 
         return chunks
 
+    def cache_identity(self) -> str | None:
+        """Identify this configuration for chunk caches (see ``Chunker``)."""
+        return config_identity(
+            self, self._tokenizer, self._language, self._chunk_size, self._overlap
+        )
+
     def __repr__(self) -> str:
         return (
             f"CodeChunker(language={self._language!r}, "
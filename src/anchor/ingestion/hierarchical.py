@@ -8,9 +8,11 @@ the full parent text after retrieval.
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable, Mapping
 from typing import Any
 
 from anchor.ingestion.chunkers import FixedSizeChunker
+from anchor.ingestion.metadata import generate_doc_id
 from anchor.models.context import ContextItem
 from anchor.models.query import QueryBundle
 from anchor.protocols.tokenizer import Tokenizer
@@ -32,21 +34,35 @@ class ParentChildChunker:
     Implements a variant of the ``Chunker`` protocol that returns
     ``(text, metadata)`` tuples via ``chunk_with_metadata()``.
 
+    By default every child's metadata carries a copy of its parent text.
+    With ``inline_parent_text=False`` the parent text is stored once on
+    the chunker instead, keyed by a content-derived ``parent_id`` that is
+    unique across documents, and is available via
+    :meth:`get_parent_text` (pass the method to ``ParentExpander`` as its
+    ``parent_lookup``).  The stored texts live only in this process and
+    grow with every document chunked; they are not persisted, so persist
+    them yourself if parents must survive a restart, and call
+    :meth:`clear_parent_texts` once they are no longer needed.
+
     Parameters:
         parent_chunk_size: Token size for parent chunks. Default 1024.
         child_chunk_size: Token size for child chunks. Default 256.
         parent_overlap: Token overlap between parent chunks. Default 100.
         child_overlap: Token overlap between child chunks. Default 25.
         tokenizer: Token counter. Uses default if not provided.
+        inline_parent_text: Copy ``parent_text`` into each child's
+            metadata. Default True.
     """
 
     __slots__ = (
         "_child_chunk_size",
         "_child_chunker",
         "_child_overlap",
+        "_inline_parent_text",
         "_parent_chunk_size",
         "_parent_chunker",
         "_parent_overlap",
+        "_parent_texts",
         "_tokenizer",
     )
 
@@ -57,6 +73,7 @@ class ParentChildChunker:
         parent_overlap: int = 100,
         child_overlap: int = 25,
         tokenizer: Tokenizer | None = None,
+        inline_parent_text: bool = True,
     ) -> None:
         if child_chunk_size >= parent_chunk_size:
             msg = (
@@ -70,6 +87,8 @@ class ParentChildChunker:
         self._parent_overlap = parent_overlap
         self._child_overlap = child_overlap
         self._tokenizer = tokenizer or get_default_counter()
+        self._inline_parent_text = inline_parent_text
+        self._parent_texts: dict[str, str] = {}
 
         self._parent_chunker = FixedSizeChunker(
             chunk_size=parent_chunk_size,
@@ -117,33 +136,70 @@ class ParentChildChunker:
 
         Returns:
             A list of ``(child_text, child_metadata)`` tuples. Each
-            metadata dict includes ``parent_id``, ``parent_text``,
-            ``parent_index``, ``child_index``, and ``is_child_chunk``.
+            metadata dict includes ``parent_id``, ``parent_index``,
+            ``child_index``, and ``is_child_chunk``, plus ``parent_text``
+            when ``inline_parent_text`` is enabled.
         """
         if not text or not text.strip():
             return []
 
         parent_chunks = self._parent_chunker.chunk(text)
         results: list[tuple[str, dict[str, Any]]] = []
+        inline = self._inline_parent_text
+        # Document metadata has always taken precedence over chunker keys
+        set_child_index = not (metadata and "child_index" in metadata)
 
         for parent_idx, parent_text in enumerate(parent_chunks):
-            parent_id = f"parent-{parent_idx}"
+            if inline:
+                parent_id = f"parent-{parent_idx}"
+            else:
+                parent_id = f"parent-{generate_doc_id(parent_text)}"
+                self._parent_texts[parent_id] = parent_text
             children = self._child_chunker.chunk(parent_text)
 
+            # Everything but child_index is shared by the parent's children,
+            # so build it once and copy per child.
+            template: dict[str, Any] = {
+                "parent_id": parent_id,
+                "parent_index": parent_idx,
+                "child_index": 0,
+                "is_child_chunk": True,
+            }
+            if inline:
+                template["parent_text"] = parent_text
+            if metadata:
+                template.update(metadata)
+
             for child_idx, child_text in enumerate(children):
-                child_meta: dict[str, Any] = {
-                    "parent_id": parent_id,
-                    "parent_text": parent_text,
-                    "parent_index": parent_idx,
-                    "child_index": child_idx,
-                    "is_child_chunk": True,
-                }
-                if metadata:
-                    child_meta.update(metadata)
+                child_meta = template.copy()
+                if set_child_index:
+                    child_meta["child_index"] = child_idx
                 results.append((child_text, child_meta))
 
         return results
 
+    @property
+    def inline_parent_text(self) -> bool:
+        """Whether parent text is copied into each child's metadata."""
+        return self._inline_parent_text
+
+    def get_parent_text(self, parent_id: str) -> str | None:
+        """Return the stored parent text for *parent_id*, if known.
+
+        Only populated when ``inline_parent_text=False``.
+
+        Parameters:
+            parent_id: The ``parent_id`` from a child chunk's metadata.
+
+        Returns:
+            The parent text, or ``None`` if the id is unknown.
+        """
+        return self._parent_texts.get(parent_id)
+
+    def clear_parent_texts(self) -> None:
+        """Forget all stored parent texts."""
+        self._parent_texts.clear()
+
     def __repr__(self) -> str:
         return (
             f"ParentChildChunker(parent_chunk_size={self._parent_chunk_size}, "
@@ -163,12 +219,29 @@ class ParentExpander:
     Parameters:
         keep_child: If True, keep the original child content in metadata
             under ``original_child_content``. Default False.
+        parent_lookup: Optional source of parent text keyed by
+            ``parent_id`` -- a mapping or a callable such as
+            ``ParentChildChunker.get_parent_text``.  Consulted before the
+            ``parent_text`` metadata key.  Resolved texts are memoized by
+            ``parent_id`` across ``process()`` calls.
+        max_cache_size: Maximum number of memoized parent texts; the
+            oldest entry is evicted when full. Default 1024.
     """
 
-    __slots__ = ("_keep_child",)
+    __slots__ = ("_keep_child", "_max_cache_size", "_parent_cache", "_parent_lookup")
 
-    def __init__(self, keep_child: bool = False) -> None:
+    def __init__(
+        self,
+        keep_child: bool = False,
+        parent_lookup: Mapping[str, str] | Callable[[str], str | None] | None = None,
+        max_cache_size: int = 1024,
+    ) -> None:
         self._keep_child = keep_child
+        if isinstance(parent_lookup, Mapping):
+            parent_lookup = parent_lookup.get
+        self._parent_lookup: Callable[[str], str | None] | None = parent_lookup
+        self._max_cache_size = max_cache_size
+        self._parent_cache: dict[str, str] = {}
 
     def process(
         self,
@@ -191,35 +264,54 @@ class ParentExpander:
         """
         seen_parents: set[str] = set()
         result: list[ContextItem] = []
+        append = result.append
+        lookup_parent = self._lookup_parent
+        keep_child = self._keep_child
 
         for item in items:
-            if not item.metadata.get("is_child_chunk"):
-                result.append(item)
+            metadata = item.metadata
+            # Non-child items are forwarded as-is; their metadata is not copied
+            if not metadata.get("is_child_chunk"):
+                append(item)
                 continue
 
-            parent_id = item.metadata.get("parent_id", "")
+            parent_id = metadata.get("parent_id", "")
             if parent_id in seen_parents:
                 continue
             seen_parents.add(parent_id)
 
-            parent_text = item.metadata.get("parent_text", item.content)
-            new_metadata = dict(item.metadata)
+            parent_text = lookup_parent(parent_id)
+            if parent_text is None:
+                parent_text = metadata.get("parent_text", item.content)
+            new_metadata = dict(metadata)
 
-            if self._keep_child:
+            if keep_child:
                 new_metadata["original_child_content"] = item.content
 
-            expanded = ContextItem(
-                id=item.id,
-                content=parent_text,
-                source=item.source,
-                score=item.score,
-                priority=item.priority,
-                token_count=item.token_count,
-                metadata=new_metadata,
-            )
-            result.append(expanded)
+            # All other fields come from an already-validated item, so copy
+            # instead of re-running model validation.
+            append(item.model_copy(update={"content": parent_text, "metadata": new_metadata}))
 
         return result
 
+    def _lookup_parent(self, parent_id: str) -> str | None:
+        """Resolve parent text via ``parent_lookup``, memoized by id."""
+        if self._parent_lookup is None:
+            return None
+        cached = self._parent_cache.get(parent_id)
+        if cached is not None:
+            return cached
+        parent_text = self._parent_lookup(parent_id)
+        if parent_text is not None and self._max_cache_size > 0:
+            if len(self._parent_cache) >= self._max_cache_size:
+                # dicts preserve insertion order; drop the oldest entry
+                del self._parent_cache[next(iter(self._parent_cache))]
+            self._parent_cache[parent_id] = parent_text
+        return parent_text
+
+    def clear_cache(self) -> None:
+        """Forget all memoized parent texts."""
+        self._parent_cache.clear()
+
     def __repr__(self) -> str:
         return f"ParentExpander(keep_child={self._keep_child})"
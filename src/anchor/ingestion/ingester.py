@@ -6,14 +6,22 @@ convert raw documents into ``ContextItem`` objects ready for indexing.
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 from anchor.exceptions import IngestionError
+from anchor.ingestion._identity import identity_of
 from anchor.ingestion.chunkers import RecursiveCharacterChunker
+from anchor.ingestion.hierarchical import ParentChildChunker
 from anchor.ingestion.metadata import (
     MetadataEnricher,
+    _prefix_doc_metadata,
     extract_chunk_metadata,
     generate_chunk_id,
     generate_doc_id,
@@ -25,22 +33,67 @@ from anchor.ingestion.parsers import (
     PlainTextParser,
 )
 from anchor.models.context import ContextItem, SourceType
+from anchor.protocols.cache import CacheBackend
 from anchor.protocols.ingestion import Chunker, DocumentParser
 from anchor.protocols.tokenizer import Tokenizer
 from anchor.tokens.counter import get_default_counter
 
 logger = logging.getLogger(__name__)
 
-_EXTENSION_PARSER_MAP: dict[str, DocumentParser] = {}
+_DEFAULT_PARSERS: Mapping[str, DocumentParser] = MappingProxyType(
+    {
+        ext: parser
+        for parser in (PlainTextParser(), MarkdownParser(), HTMLParser(), PDFParser())
+        for ext in parser.supported_extensions
+    }
+)
+"""Read-only default extension-to-parser map shared by all ingesters."""
+
+
+_worker_ingester: DocumentIngester | None = None
+
+
+def _init_worker(ingester: DocumentIngester) -> None:
+    """Install the ingester unpickled once per worker process."""
+    global _worker_ingester
+    _worker_ingester = ingester
 
 
-def _get_default_parser_map() -> dict[str, DocumentParser]:
-    """Build the default extension-to-parser mapping lazily."""
-    if not _EXTENSION_PARSER_MAP:
-        for parser in (PlainTextParser(), MarkdownParser(), HTMLParser(), PDFParser()):
-            for ext in parser.supported_extensions:
-                _EXTENSION_PARSER_MAP[ext] = parser
-    return _EXTENSION_PARSER_MAP
+def _ingest_file_in_worker(path: Path) -> tuple[list[ContextItem], str | None]:
+    """Ingest one file in a worker, returning items or a skip reason."""
+    if _worker_ingester is None:  # pragma: no cover - set by the pool initializer
+        msg = "worker ingester not initialised"
+        raise RuntimeError(msg)
+    try:
+        return _worker_ingester.ingest_file(path), None
+    except (IngestionError, FileNotFoundError) as exc:
+        return [], str(exc)
+
+
+def _iter_files(
+    root: str | os.PathLike[str], allowed_exts: frozenset[str]
+) -> Iterator[Path]:
+    """Recursively yield files under *root* whose extension is allowed.
+
+    Uses ``os.scandir`` so directory entries carry their file type and no
+    extra ``stat`` call is needed per entry.  Symlinked directories are not
+    descended into.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    # Filter on the name first: is_file() may need a stat
+                    elif (
+                        os.path.splitext(entry.name)[1].lower() in allowed_exts
+                        and entry.is_file()
+                    ):
+                        yield Path(entry.path)
+        except OSError as exc:
+            logger.warning("Skipping unreadable directory: %s", exc)
 
 
 class DocumentIngester:
@@ -48,13 +101,44 @@ class DocumentIngester:
 
     Converts raw files or text into ``ContextItem`` objects suitable
     for ``retriever.index(items)``.
+
+    When ``max_workers`` is greater than 1, :meth:`ingest_directory`
+    parses and chunks files in a process pool.  The ingester (including
+    its chunker, tokenizer, parsers, and enricher) is pickled once into
+    each worker, so all of them must be picklable -- e.g. no lambdas.
+    State a chunker records while chunking stays in the workers, so
+    ``ParentChildChunker(inline_parent_text=False)`` is rejected with a
+    ``ValueError`` in that mode.
+
+    An optional ``chunk_cache`` (any ``CacheBackend``) stores each
+    document's chunks and token counts keyed by a hash of its text, its
+    document metadata, and the ``cache_identity()`` of the chunker and
+    tokenizer, so re-ingesting unchanged documents skips chunking and
+    counting.  All built-in chunkers (except ``SemanticChunker``, whose
+    ``embed_fn`` cannot be identified) and ``TiktokenCounter`` provide
+    it; a ``ValueError`` is raised when a cache is given for a chunker
+    or tokenizer that does not.  Chunkers providing
+    ``chunk_with_metadata`` (e.g. ``ParentChildChunker``, which may
+    record parent text as a side effect) are never cached.  The cache is
+    only filled in the calling process, so it cannot be combined with
+    ``max_workers`` greater than 1 (``ValueError``).
+
+    With ``sample_doc_ids=True``, generated document IDs for texts over
+    ``DOC_ID_SAMPLE_THRESHOLD`` characters are hashed from samples (see
+    ``generate_doc_id``), so ID cost stops growing with document size.
+    Equal-length documents that differ only outside the samples then
+    share an ID, so leave it off unless documents are large and distinct.
     """
 
     __slots__ = (
+        "_cache_namespace",
+        "_chunk_cache",
         "_chunker",
         "_enricher",
+        "_max_workers",
         "_parsers",
         "_priority",
+        "_sample_doc_ids",
         "_source_type",
         "_tokenizer",
     )
@@ -67,17 +151,56 @@ class DocumentIngester:
         enricher: MetadataEnricher | None = None,
         source_type: SourceType = SourceType.RETRIEVAL,
         priority: int = 5,
+        max_workers: int | None = None,
+        chunk_cache: CacheBackend | None = None,
+        sample_doc_ids: bool = False,
     ) -> None:
+        if max_workers is not None and max_workers <= 0:
+            msg = f"max_workers must be positive, got {max_workers}"
+            raise ValueError(msg)
+        if chunk_cache is not None and max_workers is not None and max_workers > 1:
+            # Each worker would fill its own pickled copy of the cache
+            msg = "chunk_cache cannot be combined with max_workers > 1"
+            raise ValueError(msg)
+        if (
+            isinstance(chunker, ParentChildChunker)
+            and not chunker.inline_parent_text
+            and max_workers is not None
+            and max_workers > 1
+        ):
+            # Parent texts would be stored on the workers' copies of the chunker
+            msg = "ParentChildChunker(inline_parent_text=False) cannot be used with max_workers > 1"
+            raise ValueError(msg)
+        self._max_workers = max_workers
         self._chunker: Chunker = chunker or RecursiveCharacterChunker()
         self._tokenizer = tokenizer or get_default_counter()
         self._enricher = enricher
         self._source_type = source_type
         self._priority = priority
+        self._chunk_cache = chunk_cache
+        self._sample_doc_ids = sample_doc_ids
+        self._cache_namespace = (
+            self._chunk_cache_namespace() if chunk_cache is not None else None
+        )
+
+        # Share the default parsers; only allocate when overrides are given
+        self._parsers: Mapping[str, DocumentParser] = (
+            {**_DEFAULT_PARSERS, **parsers} if parsers else _DEFAULT_PARSERS
+        )
 
-        # Merge default parsers with user overrides
-        self._parsers: dict[str, DocumentParser] = dict(_get_default_parser_map())
-        if parsers:
-            self._parsers.update(parsers)
+    def __getstate__(self) -> dict[str, Any]:
+        # mappingproxy is not picklable; the shared default map is restored
+        # by identity in ``__setstate__`` (needed for ``max_workers``).
+        state = {slot: getattr(self, slot) for slot in self.__slots__}
+        if state["_parsers"] is _DEFAULT_PARSERS:
+            state["_parsers"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for slot, value in state.items():
+            setattr(self, slot, value)
+        if self._parsers is None:
+            self._parsers = _DEFAULT_PARSERS
 
     def ingest_text(
         self,
@@ -98,20 +221,9 @@ class DocumentIngester:
         if not text or not text.strip():
             return []
 
-        doc_id = doc_id or generate_doc_id(text)
-
-        if hasattr(self._chunker, "chunk_with_metadata"):
-            chunks_with_meta = self._chunker.chunk_with_metadata(text, doc_metadata)
-            if not chunks_with_meta:
-                return []
-            return self._build_items_with_metadata(chunks_with_meta, doc_id, doc_metadata)
-
-        chunks = self._chunker.chunk(text, doc_metadata)
-
-        if not chunks:
-            return []
-
-        return self._build_items(chunks, doc_id, doc_metadata)
+        return self._chunk_into(
+            text, doc_id or self._generate_doc_id(text, None), doc_metadata, []
+        )
 
     def ingest_file(
         self,
@@ -134,7 +246,15 @@ class DocumentIngester:
             IngestionError: If no parser is found for the file extension.
             FileNotFoundError: If the file does not exist.
         """
-        path = Path(path)
+        return self._ingest_file_into(Path(path), doc_id, [])
+
+    def _ingest_file_into(
+        self,
+        path: Path,
+        doc_id: str | None,
+        out: list[ContextItem],
+    ) -> list[ContextItem]:
+        """Ingest *path*, appending its items to *out* and returning it."""
         if not path.exists():
             msg = f"File not found: {path}"
             raise FileNotFoundError(msg)
@@ -148,40 +268,62 @@ class DocumentIngester:
         text, doc_metadata = parser.parse(path)
         if not text or not text.strip():
             logger.warning("Parser returned empty text for %s", path)
-            return []
-
-        doc_id = doc_id or generate_doc_id(text, str(path))
-
-        if hasattr(self._chunker, "chunk_with_metadata"):
-            chunks_with_meta = self._chunker.chunk_with_metadata(text, doc_metadata)
-            if not chunks_with_meta:
-                return []
-            return self._build_items_with_metadata(chunks_with_meta, doc_id, doc_metadata)
+            return out
 
-        chunks = self._chunker.chunk(text, doc_metadata)
-
-        if not chunks:
-            return []
-
-        return self._build_items(chunks, doc_id, doc_metadata)
+        return self._chunk_into(
+            text, doc_id or self._generate_doc_id(text, str(path)), doc_metadata, out
+        )
 
     def ingest_directory(
         self,
         directory: Path | str,
         glob_pattern: str = "**/*",
         extensions: list[str] | None = None,
+        deterministic: bool = False,
     ) -> list[ContextItem]:
         """Ingest all matching files in a directory.
 
+        With the default recursive pattern the tree is walked with
+        ``os.scandir`` and files are ingested as they are discovered.
+        See :meth:`iter_ingest_directory` for a streaming variant.
+
         Parameters:
             directory: Root directory to scan.
             glob_pattern: Glob pattern for file discovery. Defaults to recursive.
             extensions: Optional list of extensions to filter (e.g. ``[".md", ".txt"]``).
                 If ``None``, uses all registered parser extensions.
+            deterministic: If ``True``, ingest files in sorted path order.
+                Otherwise files are visited in filesystem order.
 
         Returns:
             A list of ``ContextItem`` objects from all ingested files.
 
+        Raises:
+            IngestionError: If the directory does not exist.
+        """
+        items = list(
+            self.iter_ingest_directory(directory, glob_pattern, extensions, deterministic)
+        )
+        logger.info("Ingested %d items from %s", len(items), directory)
+        return items
+
+    def iter_ingest_directory(
+        self,
+        directory: Path | str,
+        glob_pattern: str = "**/*",
+        extensions: list[str] | None = None,
+        deterministic: bool = False,
+    ) -> Iterator[ContextItem]:
+        """Lazily ingest all matching files in a directory.
+
+        Takes the same arguments as :meth:`ingest_directory` but yields
+        items file by file, so only one file's items (or, with
+        ``max_workers``, the pool's in-flight results) are held at once.
+        The directory is checked eagerly, before iteration starts.
+
+        Returns:
+            An iterator of ``ContextItem`` objects.
+
         Raises:
             IngestionError: If the directory does not exist.
         """
@@ -190,44 +332,161 @@ class DocumentIngester:
             msg = f"Directory not found: {directory}"
             raise IngestionError(msg)
 
-        allowed_exts = set(extensions) if extensions else set(self._parsers)
-        items: list[ContextItem] = []
-
-        for file_path in sorted(directory.glob(glob_pattern)):
-            if not file_path.is_file():
-                continue
-            if file_path.suffix.lower() not in allowed_exts:
-                continue
+        # Suffixes are compared lowercased, so normalise the filter once
+        allowed_exts = frozenset(
+            ext.lower() for ext in (extensions if extensions else self._parsers)
+        )
+        paths: Iterator[Path] | list[Path]
+        if glob_pattern == "**/*":
+            paths = _iter_files(directory, allowed_exts)
+        else:
+            paths = (
+                file_path
+                for file_path in directory.glob(glob_pattern)
+                if file_path.suffix.lower() in allowed_exts and file_path.is_file()
+            )
+        if deterministic:
+            paths = sorted(paths)
+        return self._iter_paths(paths)
+
+    def _iter_paths(self, paths: Iterator[Path] | list[Path]) -> Iterator[ContextItem]:
+        """Yield the items of each path, serially or in a process pool."""
+        pool_paths: list[Path] = []
+        if self._max_workers is not None and self._max_workers > 1:
+            # Paths are needed again to label skipped files, so materialise them.
+            paths = pool_paths = list(paths)
+        if len(pool_paths) > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                initializer=_init_worker,
+                initargs=(self,),
+            )
+            try:
+                results = executor.map(_ingest_file_in_worker, pool_paths, chunksize=4)
+                for file_path, (file_items, error) in zip(pool_paths, results, strict=True):
+                    if error is not None:
+                        logger.warning("Skipping %s: %s", file_path, error)
+                    yield from file_items
+            finally:
+                # Don't run the rest of the corpus if the consumer stops early
+                executor.shutdown(wait=True, cancel_futures=True)
+            return
+
+        # One buffer is filled and drained per file instead of a new list each.
+        buffer: list[ContextItem] = []
+        for file_path in paths:
+            buffer.clear()
             try:
-                file_items = self.ingest_file(file_path)
-                items.extend(file_items)
+                self._ingest_file_into(file_path, None, buffer)
             except (IngestionError, FileNotFoundError) as exc:
                 logger.warning("Skipping %s: %s", file_path, exc)
+                continue
+            yield from buffer
 
-        logger.info("Ingested %d items from %s", len(items), directory)
-        return items
+    def _chunk_into(
+        self,
+        text: str,
+        doc_id: str,
+        doc_metadata: dict[str, Any] | None,
+        out: list[ContextItem],
+    ) -> list[ContextItem]:
+        """Chunk *text* and append the resulting items to *out*."""
+        if hasattr(self._chunker, "chunk_with_metadata"):
+            chunks_with_meta = self._chunker.chunk_with_metadata(text, doc_metadata)
+            if chunks_with_meta:
+                self._build_items_with_metadata(chunks_with_meta, doc_id, doc_metadata, out)
+            return out
+
+        if self._chunk_cache is None or self._cache_namespace is None:
+            chunks = self._chunker.chunk(text, doc_metadata)
+            if chunks:
+                self._build_items(chunks, doc_id, doc_metadata, out)
+            return out
+
+        key = self._chunk_cache_key(self._cache_namespace, text, doc_metadata)
+        cached = self._chunk_cache.get(key)
+        if cached is not None:
+            chunks, token_counts = cached
+        else:
+            chunks = self._chunker.chunk(text, doc_metadata)
+            count = self._tokenizer.count_tokens
+            token_counts = [count(chunk) for chunk in chunks]
+            self._chunk_cache.set(key, (tuple(chunks), tuple(token_counts)))
+        if chunks:
+            self._build_items(list(chunks), doc_id, doc_metadata, out, list(token_counts))
+        return out
+
+    def _generate_doc_id(self, text: str, source_path: str | None) -> str:
+        """Generate a document ID, sampling large texts if configured."""
+        return generate_doc_id(text, source_path, sample=self._sample_doc_ids)
+
+    def _chunk_cache_namespace(self) -> str | None:
+        """Identify the chunker and tokenizer configuration for cache keys.
+
+        Returns ``None`` for chunkers providing ``chunk_with_metadata``,
+        which are never cached.
+
+        Raises:
+            ValueError: If the chunker or tokenizer has no usable
+                ``cache_identity()``; keying on anything weaker could hand
+                one configuration's chunks to another sharing the cache.
+        """
+        if hasattr(self._chunker, "chunk_with_metadata"):
+            return None
+        chunker_identity = identity_of(self._chunker)
+        tokenizer_identity = identity_of(self._tokenizer)
+        if chunker_identity is None or tokenizer_identity is None:
+            msg = (
+                "chunk_cache requires a chunker and tokenizer that implement "
+                f"cache_identity(); got {self._chunker!r} and {self._tokenizer!r}"
+            )
+            raise ValueError(msg)
+        return repr((chunker_identity, tokenizer_identity))
+
+    @staticmethod
+    def _chunk_cache_key(
+        namespace: str, text: str, doc_metadata: dict[str, Any] | None
+    ) -> str:
+        """Derive the chunk cache key for *text* under *namespace*."""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(namespace.encode("utf-8"))
+        h.update(b"\0")
+        h.update(repr(doc_metadata).encode("utf-8"))
+        h.update(b"\0")
+        h.update(text.encode("utf-8"))
+        return f"chunks:{h.hexdigest()}"
 
     def _build_items(
         self,
         chunks: list[str],
         doc_id: str,
         doc_metadata: dict[str, Any] | None,
+        out: list[ContextItem] | None = None,
+        token_counts: list[int] | None = None,
     ) -> list[ContextItem]:
-        """Convert text chunks into ContextItem objects."""
-        items: list[ContextItem] = []
+        """Convert text chunks into ContextItem objects.
+
+        Items are appended to *out* when given (and *out* is returned),
+        so callers collecting many documents can share one list.
+        Precomputed *token_counts* (e.g. from the chunk cache) skip
+        re-counting.
+        """
+        items: list[ContextItem] = [] if out is None else out
         total = len(chunks)
+        if token_counts is None:
+            count = self._tokenizer.count_tokens
+            token_counts = [count(chunk) for chunk in chunks]
+        # Document-level fields are identical for every chunk; prefix once
+        doc_fields = _prefix_doc_metadata(doc_metadata)
 
-        for idx, chunk_text in enumerate(chunks):
+        for idx, (chunk_text, token_count) in enumerate(zip(chunks, token_counts, strict=True)):
             chunk_id = generate_chunk_id(doc_id, idx)
-            metadata = extract_chunk_metadata(
-                chunk_text, idx, total, doc_id, doc_metadata,
-            )
+            metadata = extract_chunk_metadata(chunk_text, idx, total, doc_id)
+            metadata.update(doc_fields)
 
             if self._enricher:
                 metadata = self._enricher.enrich(chunk_text, idx, total, metadata)
 
-            token_count = self._tokenizer.count_tokens(chunk_text)
-
             item = ContextItem(
                 id=chunk_id,
                 content=chunk_text,
@@ -245,6 +504,7 @@ class DocumentIngester:
         chunks_with_meta: list[tuple[str, dict[str, Any]]],
         doc_id: str,
         doc_metadata: dict[str, Any] | None,
+        out: list[ContextItem] | None = None,
     ) -> list[ContextItem]:
         """Convert (text, metadata) tuples into ContextItem objects.
 
@@ -255,27 +515,30 @@ class DocumentIngester:
             chunks_with_meta: List of ``(text, metadata)`` tuples.
             doc_id: The parent document ID.
             doc_metadata: Optional document-level metadata.
+            out: Optional list to append the items to.
 
         Returns:
-            A list of ``ContextItem`` objects.
+            *out* (or a new list) holding the ``ContextItem`` objects.
         """
-        items: list[ContextItem] = []
+        items: list[ContextItem] = [] if out is None else out
         total = len(chunks_with_meta)
+        count = self._tokenizer.count_tokens
+        token_counts = [count(text) for text, _ in chunks_with_meta]
+        doc_fields = _prefix_doc_metadata(doc_metadata)
 
-        for idx, (chunk_text, chunk_meta) in enumerate(chunks_with_meta):
+        for idx, ((chunk_text, chunk_meta), token_count) in enumerate(
+            zip(chunks_with_meta, token_counts, strict=True)
+        ):
             chunk_id = generate_chunk_id(doc_id, idx)
 
             # Start with standard metadata, then layer chunker metadata on top
-            metadata = extract_chunk_metadata(
-                chunk_text, idx, total, doc_id, doc_metadata,
-            )
+            metadata = extract_chunk_metadata(chunk_text, idx, total, doc_id)
+            metadata.update(doc_fields)
             metadata.update(chunk_meta)
 
             if self._enricher:
                 metadata = self._enricher.enrich(chunk_text, idx, total, metadata)
 
-            token_count = self._tokenizer.count_tokens(chunk_text)
-
             item = ContextItem(
                 id=chunk_id,
                 content=chunk_text,
@@ -11,25 +11,120 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Any
+from bisect import bisect_right
+from collections.abc import Iterator
+from itertools import accumulate
+from typing import Any, Protocol
 
+from anchor.ingestion._identity import config_identity, identity_of
 from anchor.ingestion.chunkers import RecursiveCharacterChunker
 from anchor.protocols.tokenizer import Tokenizer
 from anchor.tokens.counter import get_default_counter
 
 logger = logging.getLogger(__name__)
 
-# Matches consecutive lines that look like markdown table rows (start and end with ``|``).
-_MARKDOWN_TABLE_RE = re.compile(
-    r"(?:^[ \t]*\|.+\|[ \t]*$\n?){2,}",
-    re.MULTILINE,
+# Matches ``<table>...</table>`` blocks (non-greedy, case-insensitive) or
+# consecutive lines that look like markdown table rows (start and end with
+# ``|``), so the document is scanned once.  HTML is tried first at each
+# position since its rows may contain pipes.  Flags are inline so the same
+# pattern compiles under both ``re`` and RE2.
+_TABLE_PATTERN = (
+    r"(?m)(?is:<table[\s>].*?</table>)"
+    r"|(?:^[ \t]*\|.+\|[ \t]*$\n?){2,}"
 )
+_TABLE_RE = re.compile(_TABLE_PATTERN)
 
-# Matches ``<table>...</table>`` blocks (non-greedy, case-insensitive).
-_HTML_TABLE_RE = re.compile(
-    r"<table[\s>].*?</table>",
-    re.DOTALL | re.IGNORECASE,
-)
+
+class _TablePattern(Protocol):
+    """The part of a compiled ``re`` or RE2 pattern the chunker uses."""
+
+    @property
+    def pattern(self) -> str: ...
+
+    def finditer(self, string: str) -> Iterator[Any]: ...
+
+
+_PLACEHOLDER_RE = re.compile(r"__TABLE_(\d+)__")
+_PLACEHOLDER_ONLY_RE = re.compile(r"\s*__TABLE_(\d+)__\s*")
+_MD_SEPARATOR_RE = re.compile(r"^\s*\|[\s\-:|]+\|\s*$")
+_HTML_TR_SPLIT_RE = re.compile(r"(?=<tr[\s>])", re.IGNORECASE)
+_HTML_CELL_SPLIT_RE = re.compile(r"(?=<t[dh][\s>])", re.IGNORECASE)
+
+
+def _utf8_size(text: str) -> int:
+    """Return the UTF-8 length of *text* without encoding ASCII strings."""
+    return len(text) if text.isascii() else len(text.encode())
+
+
+def _split_around(text: str, matches: list[re.Match[str]]) -> list[str]:
+    """Return the pieces of *text* before, between and after *matches*."""
+    pieces: list[str] = []
+    pos = 0
+    for m in matches:
+        pieces.append(text[pos : m.start()])
+        pos = m.end()
+    pieces.append(text[pos:])
+    return pieces
+
+
+def _md_cells(line: str) -> list[str]:
+    """Split a markdown table line into stripped cell values."""
+    inner = line.strip()
+    if inner.startswith("|"):
+        inner = inner[1:]
+    if inner.endswith("|"):
+        inner = inner[:-1]
+    return [cell.strip() for cell in inner.split("|")]
+
+
+def _md_line(cells: list[str]) -> str:
+    """Render cell values as a markdown table line."""
+    return "| " + " | ".join(cells) + " |"
+
+
+def _balanced_spans(weights: list[int], budget: int) -> list[tuple[int, int]]:
+    """Partition *weights* into contiguous ``(start, end)`` spans within *budget*.
+
+    Spans keep the count a greedy packing would need, but the largest
+    span is made as small as possible, so row groups come out evenly
+    sized instead of leaving a short tail.  Packing walks a prefix sum
+    with ``bisect``, so every item is counted once.  An item that alone
+    exceeds the budget becomes its own span for the caller to split.
+    """
+    prefix = [0, *accumulate(weights)]
+
+    def pack(lo: int, hi: int, cap: int) -> list[tuple[int, int]]:
+        spans: list[tuple[int, int]] = []
+        while lo < hi:
+            end = max(lo + 1, bisect_right(prefix, prefix[lo] + cap, lo + 1, hi + 1) - 1)
+            spans.append((lo, end))
+            lo = end
+        return spans
+
+    def balance(lo: int, hi: int) -> list[tuple[int, int]]:
+        spans = pack(lo, hi, budget)
+        if len(spans) < 2:
+            return spans
+        # Smallest capacity that still packs into as few spans.
+        low = -(-(prefix[hi] - prefix[lo]) // len(spans))
+        high = budget
+        while low < high:
+            mid = (low + high) // 2
+            if len(pack(lo, hi, mid)) <= len(spans):
+                high = mid
+            else:
+                low = mid + 1
+        return pack(lo, hi, low)
+
+    result: list[tuple[int, int]] = []
+    start = 0
+    for i, weight in enumerate(weights):
+        if weight > budget:
+            result.extend(balance(start, i))
+            result.append((i, i + 1))
+            start = i + 1
+    result.extend(balance(start, len(weights)))
+    return result
 
 
 class TableAwareChunker:
@@ -38,25 +133,56 @@ class TableAwareChunker:
     Markdown and HTML tables are extracted from the document, replaced
     with unique placeholders, and the remaining text is chunked by the
     inner chunker.  Each table is then either kept whole (if it fits
-    within ``chunk_size`` tokens) or split row-by-row, preserving the
-    header row for markdown tables.
+    within ``chunk_size`` tokens) or split into evenly sized row groups,
+    preserving the header row for markdown tables.  A row that alone
+    exceeds ``chunk_size`` is split by columns or cells.
+
+    When ``max_tokens_per_byte`` is given, it is treated as a guaranteed
+    upper bound on tokens per UTF-8 byte (see ``Tokenizer``): text whose
+    byte size times that bound fits in ``chunk_size`` is kept without
+    calling the tokenizer.  Leave it as ``None`` (the default) for
+    tokenizers that add special tokens such as BOS/EOS to every count.
+
+    Pass ``use_re2=True`` to detect tables with the linear-time RE2
+    engine instead of ``re`` (requires the ``re2`` extra).  This bounds
+    scanning time on adversarial input such as many unclosed ``<table``
+    tags.  Matches are the same as with ``re`` except that RE2's ``\\s``
+    is ASCII-only and excludes ``\\v``, so an HTML table whose ``<table``
+    tag is followed by a vertical tab or Unicode whitespace is not found.
 
     Implements the ``Chunker`` protocol.
     """
 
-    __slots__ = ("_chunk_size", "_inner", "_tokenizer")
+    __slots__ = ("_chunk_size", "_free_bytes", "_inner", "_table_re", "_tokenizer")
 
     def __init__(
         self,
         inner_chunker: Any | None = None,
         chunk_size: int = 512,
         tokenizer: Tokenizer | None = None,
+        use_re2: bool = False,
+        max_tokens_per_byte: int | None = None,
     ) -> None:
+        if max_tokens_per_byte is not None and max_tokens_per_byte <= 0:
+            msg = f"max_tokens_per_byte must be positive, got {max_tokens_per_byte}"
+            raise ValueError(msg)
         self._chunk_size = chunk_size
+        self._free_bytes = chunk_size // max_tokens_per_byte if max_tokens_per_byte else 0
         self._tokenizer = tokenizer or get_default_counter()
         self._inner = inner_chunker or RecursiveCharacterChunker(
             chunk_size=chunk_size, overlap=0, tokenizer=self._tokenizer
         )
+        self._table_re: _TablePattern = _TABLE_RE
+        if use_re2:
+            try:
+                import re2
+            except ImportError:
+                msg = (
+                    "google-re2 is required for use_re2=True. "
+                    "Install it with: pip install anchor[re2]"
+                )
+                raise ImportError(msg) from None
+            self._table_re = re2.compile(_TABLE_PATTERN)
 
     def chunk(self, text: str, metadata: dict[str, Any] | None = None) -> list[str]:
         """Chunk text while preserving tables as atomic units.
@@ -74,40 +200,43 @@ class TableAwareChunker:
         tables: list[str] = []
         processed = text
 
-        # Extract HTML tables first (they may contain pipes that look
-        # like markdown table rows).
-        def _replace_html(m: re.Match[str]) -> str:
-            idx = len(tables)
-            tables.append(m.group(0))
-            return f"__TABLE_{idx}__"
-
-        processed = _HTML_TABLE_RE.sub(_replace_html, processed)
-
-        # Extract markdown tables.
-        def _replace_md(m: re.Match[str]) -> str:
-            idx = len(tables)
-            tables.append(m.group(0))
-            return f"__TABLE_{idx}__"
-
-        processed = _MARKDOWN_TABLE_RE.sub(_replace_md, processed)
+        # A markdown table needs at least two rows of two pipes; skip the
+        # regex entirely for prose that cannot contain either table kind.
+        if text.count("|") >= 4 or ("<" in text and "<table" in text.lower()):
+            # Extract HTML and markdown tables in a single pass, replacing
+            # each with a placeholder.  Built from finditer so the same code
+            # serves ``re`` and RE2 patterns.
+            pieces: list[str] = []
+            pos = 0
+            for m in self._table_re.finditer(text):
+                pieces.append(text[pos : m.start()])
+                pieces.append(f"__TABLE_{len(tables)}__")
+                tables.append(m.group(0))
+                pos = m.end()
+            if tables:
+                pieces.append(text[pos:])
+                processed = "".join(pieces)
 
         # Chunk the remaining text (with placeholders).
         text_chunks = self._inner.chunk(processed, metadata) if processed.strip() else []
+        if not tables:
+            return [tc.strip() or tc for tc in text_chunks]
 
-        # Expand placeholders and build final chunk list.
+        # Expand placeholders and build final chunk list.  Each chunk is
+        # scanned for placeholders once; the same indices drive expansion
+        # and the check for tables no chunk referenced.
         result: list[str] = []
+        referenced: set[int] = set()
         for tc in text_chunks:
-            expanded = self._expand_placeholders(tc, tables)
-            result.extend(expanded)
+            # Most chunks of a long document reference no table; a substring
+            # check is cheaper than running the regex over them.
+            matches = list(_PLACEHOLDER_RE.finditer(tc)) if "__TABLE_" in tc else []
+            referenced.update(int(m.group(1)) for m in matches)
+            result.extend(self._expand_placeholders(tc, tables, matches))
 
         # Any tables referenced by placeholders that did NOT appear in
         # any text chunk (e.g. the entire document was a table) are
         # appended directly.
-        referenced: set[int] = set()
-        for tc in text_chunks:
-            for i in range(len(tables)):
-                if f"__TABLE_{i}__" in tc:
-                    referenced.add(i)
         for i, table in enumerate(tables):
             if i not in referenced:
                 result.extend(self._chunk_table(table))
@@ -118,47 +247,104 @@ class TableAwareChunker:
     # Private helpers
     # ------------------------------------------------------------------
 
-    def _expand_placeholders(self, chunk: str, tables: list[str]) -> list[str]:
+    def _expand_placeholders(
+        self,
+        chunk: str,
+        tables: list[str],
+        matches: list[re.Match[str]],
+    ) -> list[str]:
         """Replace placeholders in *chunk* with table content.
 
+        *matches* holds the placeholder matches in *chunk*, in order.
+
         If a chunk is *only* a placeholder, the table is returned
         (possibly row-split).  If it is mixed, the placeholder is
         replaced inline only when the result still fits within the
         token budget; otherwise the table is emitted as a separate
         chunk.
         """
-        parts: list[str] = []
-
         # Check if the chunk is just a placeholder (possibly with whitespace).
-        placeholder_only = re.fullmatch(r"\s*__TABLE_(\d+)__\s*", chunk)
-        if placeholder_only:
-            idx = int(placeholder_only.group(1))
-            return self._chunk_table(tables[idx])
+        if len(matches) == 1 and _PLACEHOLDER_ONLY_RE.fullmatch(chunk):
+            return self._chunk_table(tables[int(matches[0].group(1))])
+
+        if not matches:
+            remaining = chunk.strip()
+            return [remaining] if remaining else [chunk]
+
+        segments = _split_around(chunk, matches)
+
+        # Small enough to inline every table without counting tokens.
+        expanded = [segments[0]]
+        for m, segment in zip(matches, segments[1:], strict=True):
+            expanded.extend((tables[int(m.group(1))], segment))
+        if self._fits_by_size(*expanded):
+            return ["".join(expanded).strip()]
+
+        # Walk the chunk once.  Each prose segment, tag and table is
+        # counted once; the budget check sums the text kept so far, the
+        # table and everything after it, as the joined chunk would be.
+        count = self._tokenizer.count_tokens
+        segment_tokens = [count(segment) for segment in segments]
+        tag_tokens = [count(m.group(0)) for m in matches]
+        rest_tokens = [0] * len(matches)
+        rest = segment_tokens[-1]
+        for j in range(len(matches) - 1, -1, -1):
+            rest_tokens[j] = rest
+            rest += tag_tokens[j] + segment_tokens[j]
 
-        # Otherwise try inline replacement.
-        current = chunk
-        for i, table in enumerate(tables):
-            tag = f"__TABLE_{i}__"
-            if tag in current:
-                replaced = current.replace(tag, table)
-                if self._tokenizer.count_tokens(replaced) <= self._chunk_size:
-                    current = replaced
-                else:
-                    # Emit text before placeholder, then table separately.
-                    before, after = current.split(tag, 1)
-                    if before.strip():
-                        parts.append(before.strip())
-                    parts.extend(self._chunk_table(table))
-                    current = after
-
-        remaining = current.strip()
+        parts: list[str] = []
+        current = [segments[0]]
+        current_tokens = segment_tokens[0]
+        for j, m in enumerate(matches):
+            table = tables[int(m.group(1))]
+            table_tokens = count(table)
+            if current_tokens + table_tokens + rest_tokens[j] <= self._chunk_size:
+                current.append(table)
+                current_tokens += table_tokens
+            else:
+                # Emit text before placeholder, then table separately.
+                before = "".join(current).strip()
+                if before:
+                    parts.append(before)
+                parts.extend(self._chunk_table(table, table_tokens))
+                current = []
+                current_tokens = 0
+            current.append(segments[j + 1])
+            current_tokens += segment_tokens[j + 1]
+
+        remaining = "".join(current).strip()
         if remaining:
             parts.append(remaining)
         return parts if parts else [chunk]
 
-    def _chunk_table(self, table: str) -> list[str]:
-        """Return the table as-is or split by rows if too large."""
-        if self._tokenizer.count_tokens(table) <= self._chunk_size:
+    def _fits_by_size(self, *texts: str) -> bool:
+        """Return ``True`` when *texts* surely fit the budget without counting.
+
+        Only used with ``max_tokens_per_byte``: text no larger than
+        ``chunk_size // max_tokens_per_byte`` bytes is within budget.  A
+        ``False`` result is inconclusive and the caller counts tokens.
+        """
+        budget = self._free_bytes
+        if not budget:
+            return False
+        total = 0
+        for text in texts:
+            total += _utf8_size(text)
+            if total > budget:
+                return False
+        return True
+
+    def _chunk_table(self, table: str, table_tokens: int | None = None) -> list[str]:
+        """Return the table as-is or split by rows if too large.
+
+        *table_tokens* is the table's token count when the caller already
+        has it.
+        """
+        if self._fits_by_size(table):
+            return [table.strip()] if table.strip() else []
+        if table_tokens is None:
+            table_tokens = self._tokenizer.count_tokens(table)
+        if table_tokens <= self._chunk_size:
             return [table.strip()] if table.strip() else []
 
         # Determine if it's a markdown or HTML table.
@@ -167,7 +353,11 @@ class TableAwareChunker:
         return self._split_markdown_table(table)
 
     def _split_markdown_table(self, table: str) -> list[str]:
-        """Split a markdown table by rows, preserving the header."""
+        """Split a markdown table into balanced row groups, preserving the header.
+
+        A row that alone exceeds ``chunk_size`` is split by columns
+        instead, each piece carrying the matching slice of the header.
+        """
         lines = [ln for ln in table.strip().splitlines() if ln.strip()]
         if len(lines) < 2:
             return [table.strip()]
@@ -175,54 +365,125 @@ class TableAwareChunker:
         # First line is the header, second is the separator.
         header_lines: list[str] = [lines[0]]
         data_start = 1
-        if len(lines) > 1 and re.match(r"^\s*\|[\s\-:|]+\|\s*$", lines[1]):
+        if len(lines) > 1 and _MD_SEPARATOR_RE.match(lines[1]):
             header_lines.append(lines[1])
             data_start = 2
 
         header = "\n".join(header_lines)
-        chunks: list[str] = []
-        current = header
+        rows = lines[data_start:]
+        if not rows:
+            return [header.strip()]
+
+        # Count each row once; for BPE tokenizers the sum is an upper
+        # bound on the joined count, so chunks stay within budget.
+        count = self._tokenizer.count_tokens
+        chunk_size = self._chunk_size
+        header_tokens = count(header)
+        newline_tokens = count("\n")
+        weights = [newline_tokens + count(row) for row in rows]
 
-        for line in lines[data_start:]:
-            candidate = current + "\n" + line
-            if self._tokenizer.count_tokens(candidate) <= self._chunk_size:
-                current = candidate
+        chunks: list[str] = []
+        for lo, hi in _balanced_spans(weights, chunk_size - header_tokens):
+            if hi - lo == 1 and weights[lo] > chunk_size:
+                chunks.extend(self._split_markdown_row(header_lines, rows[lo]))
             else:
-                if current.strip():
-                    chunks.append(current.strip())
-                current = header + "\n" + line
-
-        if current.strip():
-            chunks.append(current.strip())
-
+                chunks.append("\n".join([header, *rows[lo:hi]]).strip())
         return chunks
 
+    def _split_markdown_row(self, header_lines: list[str], row: str) -> list[str]:
+        """Split one oversized markdown row into column slices of the table."""
+        table_lines = [*header_lines, row]
+        cells = [_md_cells(line) for line in table_lines]
+        width = len(cells[-1])
+        if width < 2 or any(len(line_cells) != width for line_cells in cells):
+            return ["\n".join(table_lines).strip()]
+
+        count = self._tokenizer.count_tokens
+        chunk_size = self._chunk_size
+        weights = [
+            sum(count(_md_line([line_cells[col]])) for line_cells in cells)
+            for col in range(width)
+        ]
+        if max(weights) > chunk_size:
+            # Even a single column does not fit; slicing would not help.
+            return ["\n".join(table_lines).strip()]
+        return [
+            "\n".join(_md_line(line_cells[lo:hi]) for line_cells in cells)
+            for lo, hi in _balanced_spans(weights, chunk_size)
+        ]
+
     def _split_html_table(self, table: str) -> list[str]:
-        """Naively split an HTML table by ``<tr>`` rows."""
-        rows = re.split(r"(?=<tr[\s>])", table, flags=re.IGNORECASE)
+        """Split an HTML table into balanced groups of ``<tr>`` rows.
+
+        A row that alone exceeds ``chunk_size`` is split between its cells.
+        """
+        rows = _HTML_TR_SPLIT_RE.split(table)
         if len(rows) <= 1:
             return [table.strip()]
 
-        # The first element is everything before the first <tr>.
+        # The first element is everything before the first <tr>; the last
+        # row carries the original closing tag, which every chunk re-adds.
         preamble = rows[0]
-        # Find closing tag.
         closing = "</table>"
-        chunks: list[str] = []
-        current = preamble
+        body = rows[1:]
+        end = body[-1].lower().rfind("</table")
+        if end != -1:
+            body[-1] = body[-1][:end]
 
-        for row in rows[1:]:
-            candidate = current + row
-            if self._tokenizer.count_tokens(candidate + closing) <= self._chunk_size:
-                current = candidate
-            else:
-                if current.strip():
-                    chunks.append((current + closing).strip())
-                current = preamble + row
-
-        if current.strip():
-            chunks.append((current + closing).strip())
+        count = self._tokenizer.count_tokens
+        budget = self._chunk_size - count(closing) - count(preamble)
+        weights = [count(row) for row in body]
 
+        chunks: list[str] = []
+        for lo, hi in _balanced_spans(weights, budget):
+            if hi - lo == 1 and weights[lo] > self._chunk_size:
+                pieces = self._split_html_row(body[lo], budget)
+            else:
+                pieces = ["".join(body[lo:hi])]
+            chunks.extend((preamble + piece + closing).strip() for piece in pieces)
         return chunks
 
+    def _split_html_row(self, row: str, budget: int) -> list[str]:
+        """Split one oversized ``<tr>`` row into rows holding subsets of its cells."""
+        parts = _HTML_CELL_SPLIT_RE.split(row)
+        if len(parts) < 3:
+            return [row]
+
+        prefix, cells = parts[0], parts[1:]
+        suffix = ""
+        end = cells[-1].lower().rfind("</tr")
+        if end != -1:
+            cells[-1], suffix = cells[-1][:end], cells[-1][end:]
+
+        count = self._tokenizer.count_tokens
+        cell_budget = budget - count(prefix) - count(suffix)
+        weights = [count(cell) for cell in cells]
+        if max(weights) > cell_budget:
+            # Even a single cell does not fit; splitting would not help.
+            return [row]
+        return [
+            prefix + "".join(cells[lo:hi]) + suffix
+            for lo, hi in _balanced_spans(weights, cell_budget)
+        ]
+
+    def cache_identity(self) -> str | None:
+        """Identify this configuration for chunk caches (see ``Chunker``).
+
+        ``None`` when the inner chunker cannot be identified.
+        """
+        inner = identity_of(self._inner)
+        if inner is None:
+            return None
+        engine = type(self._table_re).__module__
+        return config_identity(
+            self,
+            self._tokenizer,
+            inner,
+            self._chunk_size,
+            engine,
+            self._table_re.pattern,
+            self._free_bytes,
+        )
+
     def __repr__(self) -> str:
         return f"TableAwareChunker(inner={self._inner!r}, chunk_size={self._chunk_size})"
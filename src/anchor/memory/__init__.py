@@ -2,7 +2,15 @@
 
 from .callbacks import MemoryCallback
 from .consolidator import SimilarityConsolidator
-from .decay import EbbinghausDecay, ExponentialRecencyScorer, LinearDecay, LinearRecencyScorer
+from .decay import (
+    EbbinghausDecay,
+    ExponentialRecencyScorer,
+    LinearDecay,
+    LinearRecencyScorer,
+    compute_retention_batch,
+    decayed_indices,
+    recency_scores,
+)
 from .eviction import FIFOEviction, ImportanceEviction, PairedEviction
 from .extractor import CallbackExtractor
 from .gc import GCStats, MemoryGarbageCollector
@@ -28,4 +36,7 @@ __all__ = [
     "SimpleGraphMemory",
     "SlidingWindowMemory",
     "SummaryBufferMemory",
+    "compute_retention_batch",
+    "decayed_indices",
+    "recency_scores",
 ]
@@ -7,17 +7,77 @@ deduplication and cosine similarity of embeddings.
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import functools
+import math
+import operator
+from array import array
+from collections.abc import Callable, Sequence
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from anchor._math import cosine_similarity as _cosine_similarity
 from anchor.protocols.memory import MemoryOperation
 
 if TYPE_CHECKING:
     from anchor.models.memory import MemoryEntry
 
 
+def _unit_vector(vec: list[float]) -> list[float]:
+    """Scale *vec* to unit length.
+
+    Zero vectors are returned unscaled.
+    """
+    norm = math.sqrt(sum(map(operator.mul, vec, vec)))
+    if norm == 0:
+        return list(vec)
+    return [x / norm for x in vec]
+
+
+def _dot(a: Sequence[float], b: Sequence[float]) -> float:
+    """Dot product of two equal-length vectors in pure Python."""
+    total: float = sum(map(operator.mul, a, b))
+    return total
+
+
+def _float32_dot(a: Any, b: Any) -> float:
+    """Dot product over two float32 NumPy vectors; compiled by :func:`_numba_dot`."""
+    total = 0.0
+    for i in range(a.shape[0]):
+        total += a[i] * b[i]
+    return total
+
+
+@functools.cache
+def _numba_dot() -> tuple[Callable[[Any], Any], Callable[[Any, Any], float]]:
+    """Compile a float32 dot-product kernel with Numba.
+
+    Returns a ``(as_vector, dot)`` pair: *as_vector* wraps a cached
+    ``array('f')`` as a zero-copy NumPy view and *dot* is the JIT-compiled
+    reduction over two such views.  The pair is built once per process
+    and shared by every consolidator; ``cache=True`` also keeps the
+    compiled kernel on disk across processes.
+    """
+    try:
+        import numpy as np
+        from numba import njit
+    except ImportError:
+        msg = "numba is required for use_numba=True. Install it with: pip install anchor[numba]"
+        raise ImportError(msg) from None
+
+    dot: Callable[[Any, Any], float] = njit(cache=True, fastmath=True)(_float32_dot)
+
+    def as_vector(vec: array[float]) -> Any:
+        return np.frombuffer(vec, dtype=np.float32)
+
+    return as_vector, dot
+
+
+def _merge_ordered(first: list[str], second: list[str]) -> list[str]:
+    """Return the union of *first* and *second*, keeping first-seen order."""
+    merged = dict.fromkeys(first)
+    merged.update(dict.fromkeys(second))
+    return list(merged)
+
+
 class SimilarityConsolidator:
     """Consolidates memories using embedding cosine similarity and content hashing.
 
@@ -28,20 +88,42 @@ class SimilarityConsolidator:
     2. Embeds the new entry and compares it against cached embeddings of
        existing entries using cosine similarity.
     3. If similarity exceeds the threshold the entries are merged
-       (``"update"``).
+       (``"update"``).  The scan stops at the first existing entry that
+       reaches the threshold, so the merge target is the earliest match
+       in *existing* order rather than the single most similar entry.
     4. Otherwise the new entry is added as-is (``"add"``).
 
     The library never calls an LLM. The user-provided ``embed_fn``
     handles all embedding logic.
+
+    Embeddings are cached as unit vectors, so each comparison is a single
+    dot product rather than a full cosine computation.  If ``embed_fn``
+    also exposes an ``embed_batch(texts) -> list[list[float]]`` attribute,
+    all entries needing an embedding in one ``consolidate()`` call are
+    embedded with a single batch call.
+
+    Pass ``use_numba=True`` to compute similarities with a Numba-compiled
+    float32 kernel (requires the ``numba`` extra).  Cached vectors are then
+    packed into float32 ``array.array`` buffers, four bytes per dimension,
+    and read through zero-copy NumPy views; the pure-Python path keeps
+    plain lists, which it iterates faster.  This pays off for
+    high-dimensional embeddings; the kernel is compiled on first use.
     """
 
-    __slots__ = ("_embed_fn", "_embedding_cache", "_max_cache_size", "_similarity_threshold")
+    __slots__ = (
+        "_embed_fn",
+        "_embedding_cache",
+        "_kernel",
+        "_max_cache_size",
+        "_similarity_threshold",
+    )
 
     def __init__(
         self,
         embed_fn: Callable[[str], list[float]],
         similarity_threshold: float = 0.85,
         max_cache_size: int = 1000,
+        use_numba: bool = False,
     ) -> None:
         if not 0.0 <= similarity_threshold <= 1.0:
             msg = "similarity_threshold must be in [0.0, 1.0]"
@@ -49,36 +131,66 @@ class SimilarityConsolidator:
         self._embed_fn = embed_fn
         self._similarity_threshold = similarity_threshold
         self._max_cache_size = max_cache_size
-        self._embedding_cache: dict[str, list[float]] = {}
+        self._embedding_cache: dict[str, Sequence[float]] = {}
+        self._kernel = _numba_dot() if use_numba else None
+
+    def _cache_embedding(self, entry_id: str, embedding: Sequence[float]) -> None:
+        """Store a unit embedding, resetting the cache when it is full."""
+        if (
+            entry_id not in self._embedding_cache
+            and len(self._embedding_cache) >= self._max_cache_size
+        ):
+            self._embedding_cache.clear()
+        self._embedding_cache[entry_id] = embedding
+
+    def _compact_cache(self, existing: list[MemoryEntry], incoming: int) -> None:
+        """Drop cached vectors of entries that are no longer in *existing*.
 
-    def _get_embedding(self, entry: MemoryEntry) -> list[float]:
-        """Return a cached embedding for the entry, computing if necessary."""
-        if entry.id not in self._embedding_cache:
-            if len(self._embedding_cache) >= self._max_cache_size:
-                self._embedding_cache.clear()
-            self._embedding_cache[entry.id] = self._embed_fn(entry.content)
-        return self._embedding_cache[entry.id]
+        Runs only when *incoming* new vectors would overflow the cache, so
+        rows for deleted entries are reclaimed before ``_cache_embedding``
+        falls back to clearing everything and the store is re-embedded.
+        """
+        cache = self._embedding_cache
+        if len(cache) + incoming <= self._max_cache_size:
+            return
+        live_ids = {e.id for e in existing}
+        for entry_id in [k for k in cache if k not in live_ids]:
+            del cache[entry_id]
+
+    def _embed_entries(self, entries: list[MemoryEntry]) -> list[Sequence[float]]:
+        """Embed entries as unit vectors, in one call when ``embed_batch`` exists.
+
+        Vectors are packed as float32 arrays only for the Numba kernel.
+        """
+        if not entries:
+            return []
+        texts = [entry.content for entry in entries]
+        embed_batch = getattr(self._embed_fn, "embed_batch", None)
+        if embed_batch is not None:
+            vectors: list[list[float]] = embed_batch(texts)
+        else:
+            embed = self._embed_fn
+            vectors = [embed(text) for text in texts]
+        if self._kernel is not None:
+            return [array("f", _unit_vector(vec)) for vec in vectors]
+        return [_unit_vector(vec) for vec in vectors]
 
     @staticmethod
     def _merge_entries(new_entry: MemoryEntry, existing: MemoryEntry) -> MemoryEntry:
         """Merge a new entry into an existing one, preserving the richer metadata."""
-        merged_tags = list(dict.fromkeys([*existing.tags, *new_entry.tags]))
-        merged_links = list(dict.fromkeys([*existing.links, *new_entry.links]))
-        merged_source_turns = list(
-            dict.fromkeys([*existing.source_turns, *new_entry.source_turns])
-        )
-        merged_metadata = {**existing.metadata, **new_entry.metadata}
+        merged_tags = _merge_ordered(existing.tags, new_entry.tags)
+        merged_links = _merge_ordered(existing.links, new_entry.links)
+        merged_source_turns = _merge_ordered(existing.source_turns, new_entry.source_turns)
+        merged_metadata = existing.metadata | new_entry.metadata
 
-        # Keep the longer or newer content
-        content = (
-            new_entry.content
-            if len(new_entry.content) >= len(existing.content)
-            else existing.content
-        )
+        # Keep the longer or newer content.  model_copy does not re-run
+        # validators, so carry over the hash that matches it.
+        source = new_entry if len(new_entry.content) >= len(existing.content) else existing
 
         return existing.model_copy(
             update={
-                "content": content,
+                "content": source.content,
+                "content_hash": source.content_hash,
                 "tags": merged_tags,
                 "links": merged_links,
                 "source_turns": merged_source_turns,
@@ -89,6 +201,28 @@ class SimilarityConsolidator:
             }
         )
 
+    @staticmethod
+    def _find_match(
+        new_vec: Any,
+        existing_embeddings: list[tuple[MemoryEntry, Any]],
+        dot: Callable[[Any, Any], float],
+        threshold: float,
+    ) -> MemoryEntry | None:
+        """Return the first existing entry whose similarity reaches *threshold*."""
+        dim = len(new_vec)
+        for ex_entry, ex_emb in existing_embeddings:
+            if len(ex_emb) != dim:
+                msg = "vectors must have the same dimensionality"
+                raise ValueError(msg)
+            if dim == 0:
+                msg = "vectors must not be empty"
+                raise ValueError(msg)
+            # Cosine similarity of unit vectors is their dot product
+            sim = dot(new_vec, ex_emb)
+            if sim > 0.0 and sim >= threshold:
+                return ex_entry
+        return None
+
     def consolidate(
         self,
         new_entries: list[MemoryEntry],
@@ -109,8 +243,35 @@ class SimilarityConsolidator:
             - ``MemoryOperation.NONE`` -- exact duplicate, skip.
         """
         existing_hashes = {e.content_hash for e in existing}
-        existing_embeddings = [(e, self._get_embedding(e)) for e in existing]
 
+        # Reuse unit vectors cached by earlier calls and embed only what is
+        # missing: uncached existing entries and new entries that are not
+        # exact duplicates.
+        cache = self._embedding_cache
+        vectors = [cache.get(e.id) for e in existing]
+        uncached = [e for e, vec in zip(existing, vectors, strict=True) if vec is None]
+        candidates = [e for e in new_entries if e.content_hash not in existing_hashes]
+        self._compact_cache(existing, len(uncached) + len(candidates))
+
+        fresh = self._embed_entries(uncached)
+        for entry, embedding in zip(uncached, fresh, strict=True):
+            self._cache_embedding(entry.id, embedding)
+        fresh_iter = iter(fresh)
+        existing_embeddings = [
+            (e, next(fresh_iter) if vec is None else vec)
+            for e, vec in zip(existing, vectors, strict=True)
+        ]
+        new_embeddings = iter(self._embed_entries(candidates))
+
+        kernel = self._kernel
+        dot: Callable[[Any, Any], float]
+        if kernel is None:
+            dot = _dot
+        else:
+            as_vector, dot = kernel
+            existing_embeddings = [(e, as_vector(vec)) for e, vec in existing_embeddings]
+
+        threshold = self._similarity_threshold
         results: list[tuple[MemoryOperation, MemoryEntry | None]] = []
 
         for new_entry in new_entries:
@@ -120,20 +281,14 @@ class SimilarityConsolidator:
                 continue
 
             # 2. Semantic similarity check
-            new_emb = self._embed_fn(new_entry.content)
-            self._embedding_cache[new_entry.id] = new_emb  # Cache for future consolidation rounds
-            best_sim = 0.0
-            best_existing: MemoryEntry | None = None
-
-            for ex_entry, ex_emb in existing_embeddings:
-                sim = _cosine_similarity(new_emb, ex_emb)
-                if sim > best_sim:
-                    best_sim = sim
-                    best_existing = ex_entry
+            new_emb = next(new_embeddings)
+            self._cache_embedding(new_entry.id, new_emb)  # Reused in later rounds
+            new_vec = new_emb if kernel is None else as_vector(new_emb)
+            match = self._find_match(new_vec, existing_embeddings, dot, threshold)
 
             # 3. Merge or add
-            if best_sim >= self._similarity_threshold and best_existing is not None:
-                merged = self._merge_entries(new_entry, best_existing)
+            if match is not None:
+                merged = self._merge_entries(new_entry, match)
                 results.append((MemoryOperation.UPDATE, merged))
             else:
                 results.append((MemoryOperation.ADD, new_entry))
@@ -7,11 +7,118 @@ and recency scorers for ordering conversation turns within a window.
 from __future__ import annotations
 
 import math
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from anchor.models.memory import MemoryEntry
+    from anchor.protocols.memory import MemoryDecay, RecencyScorer
+
+
+def compute_retention_batch(
+    decay: MemoryDecay,
+    entries: list[MemoryEntry],
+    now: datetime | None = None,
+) -> list[float]:
+    """Compute retention scores for many entries against one clock reading.
+
+    Decays may optionally implement ``compute_retention_batch(entries,
+    now=None)`` (as the built-in curves do) to read the clock once per
+    batch.  Decays without it fall back to one ``compute_retention``
+    call per entry, and *now* is then ignored.
+
+    Parameters:
+        decay: Any :class:`~anchor.protocols.memory.MemoryDecay`.
+        entries: The memory entries to score.
+        now: Reference time; defaults to the current UTC time.
+
+    Returns:
+        Retention scores in the same order as ``entries``.
+    """
+    batch = getattr(decay, "compute_retention_batch", None)
+    if batch is not None:
+        result: list[float] = batch(entries, now)
+        return result
+    compute = decay.compute_retention
+    return [compute(entry) for entry in entries]
+
+
+def decayed_indices(
+    decay: MemoryDecay,
+    entries: list[MemoryEntry],
+    threshold: float,
+    now: datetime | None = None,
+) -> list[int]:
+    """Return the indices of entries whose retention is below *threshold*.
+
+    Decays may optionally implement ``decayed_indices(entries, threshold,
+    now=None)`` (as the built-in curves do) to answer without scoring
+    every entry.  Decays with only ``compute_retention_batch`` are scored
+    in one batch; plain decays are scored and filtered in a single pass.
+
+    Parameters:
+        decay: Any :class:`~anchor.protocols.memory.MemoryDecay`.
+        entries: The memory entries to check.
+        threshold: Retention score below which an entry counts as decayed.
+        now: Reference time; defaults to the current UTC time.
+
+    Returns:
+        Ascending indices into ``entries``.
+    """
+    select = getattr(decay, "decayed_indices", None)
+    if select is not None:
+        result: list[int] = select(entries, threshold, now)
+        return result
+    if getattr(decay, "compute_retention_batch", None) is not None:
+        scores = compute_retention_batch(decay, entries, now)
+        return [i for i, score in enumerate(scores) if score < threshold]
+    compute = decay.compute_retention
+    return [i for i, entry in enumerate(entries) if compute(entry) < threshold]
+
+
+def _accessed_before(
+    entries: list[MemoryEntry],
+    cutoff_for: Callable[[MemoryEntry], datetime | None],
+) -> list[int]:
+    """Return indices of entries last accessed before their cutoff time."""
+    indices: list[int] = []
+    for i, entry in enumerate(entries):
+        cutoff = cutoff_for(entry)
+        if cutoff is not None and entry.last_accessed < cutoff:
+            indices.append(i)
+    return indices
+
+
+def _cutoff(now: datetime, hours: float) -> datetime | None:
+    """Return ``now - hours``, or ``None`` when that predates ``datetime.min``."""
+    try:
+        return now - timedelta(hours=hours)
+    except OverflowError:
+        return None
+
+
+def recency_scores(scorer: RecencyScorer, total: int) -> list[float]:
+    """Score every position ``0..total-1`` of a window at once.
+
+    Scorers may optionally implement ``score_all(total)`` (as the
+    built-in scorers do) to hoist per-window constants out of the loop.
+    Scorers without it fall back to one ``score`` call per position.
+
+    Parameters:
+        scorer: Any :class:`~anchor.protocols.memory.RecencyScorer`.
+        total: Number of items in the window.
+
+    Returns:
+        Scores indexed by position, oldest first.
+    """
+    score_all = getattr(scorer, "score_all", None)
+    if score_all is not None:
+        result: list[float] = score_all(total)
+        return result
+    score = scorer.score
+    return [score(i, total) for i in range(total)]
 
 
 class EbbinghausDecay:
@@ -47,7 +154,74 @@ class EbbinghausDecay:
         Returns:
             A float in [0.0, 1.0] representing how well the memory is retained.
         """
-        now = datetime.now(UTC)
+        return self._retention(entry, datetime.now(UTC))
+
+    def compute_retention_batch(
+        self, entries: list[MemoryEntry], now: datetime | None = None
+    ) -> list[float]:
+        """Compute retention scores for many entries, reading the clock once.
+
+        The curve is evaluated inline rather than through ``_retention``:
+        per-entry call overhead, not ``exp``, dominates the cost here.
+
+        Parameters:
+            entries: Memory entries with ``last_accessed`` and ``access_count``.
+            now: Reference time; defaults to the current UTC time.
+
+        Returns:
+            Retention scores in the same order as ``entries``.
+        """
+        now = now or datetime.now(UTC)
+        exp = math.exp
+        base = self._base_strength
+        factor = self._reinforcement_factor
+        scores: list[float] = []
+        for entry in entries:
+            elapsed_hours = (now - entry.last_accessed).total_seconds() / 3600.0
+            retention = exp(-elapsed_hours / (base + entry.access_count * factor))
+            # exp() is never negative, so only the upper bound needs clamping.
+            scores.append(retention if retention < 1.0 else 1.0)
+        return scores
+
+    def decayed_indices(
+        self,
+        entries: list[MemoryEntry],
+        threshold: float,
+        now: datetime | None = None,
+    ) -> list[int]:
+        """Return indices of entries whose retention is below *threshold*.
+
+        ``e^(-t/S) < threshold`` holds exactly when ``t > -ln(threshold) * S``,
+        so each entry's last access is compared against a cutoff time
+        computed once per distinct ``access_count``; no exponential is
+        evaluated.
+
+        Parameters:
+            entries: Memory entries with ``last_accessed`` and ``access_count``.
+            threshold: Retention score below which an entry counts as decayed.
+            now: Reference time; defaults to the current UTC time.
+
+        Returns:
+            Ascending indices into ``entries``.
+        """
+        if threshold <= 0.0:
+            return []
+        if threshold > 1.0:
+            return list(range(len(entries)))
+        now = now or datetime.now(UTC)
+        hours_per_strength = -math.log(threshold)
+        cutoffs: dict[int, datetime | None] = {}
+
+        def cutoff_for(entry: MemoryEntry) -> datetime | None:
+            count = entry.access_count
+            if count not in cutoffs:
+                strength = self._base_strength + count * self._reinforcement_factor
+                cutoffs[count] = _cutoff(now, hours_per_strength * strength)
+            return cutoffs[count]
+
+        return _accessed_before(entries, cutoff_for)
+
+    def _retention(self, entry: MemoryEntry, now: datetime) -> float:
         elapsed_hours = (now - entry.last_accessed).total_seconds() / 3600.0
         strength = self._base_strength + entry.access_count * self._reinforcement_factor
         retention = math.exp(-elapsed_hours / strength)
@@ -79,7 +253,58 @@ class LinearDecay:
             A float in [0.0, 1.0] where 1.0 means just accessed
             and 0.0 means fully decayed.
         """
-        now = datetime.now(UTC)
+        return self._retention(entry, datetime.now(UTC))
+
+    def compute_retention_batch(
+        self, entries: list[MemoryEntry], now: datetime | None = None
+    ) -> list[float]:
+        """Compute retention scores for many entries, reading the clock once.
+
+        Parameters:
+            entries: Memory entries with ``last_accessed``.
+            now: Reference time; defaults to the current UTC time.
+
+        Returns:
+            Retention scores in the same order as ``entries``.
+        """
+        now = now or datetime.now(UTC)
+        span = 2.0 * self._half_life_hours
+        scores: list[float] = []
+        for entry in entries:
+            elapsed_hours = (now - entry.last_accessed).total_seconds() / 3600.0
+            retention = 1.0 - (elapsed_hours / span)
+            scores.append(max(0.0, min(1.0, retention)))
+        return scores
+
+    def decayed_indices(
+        self,
+        entries: list[MemoryEntry],
+        threshold: float,
+        now: datetime | None = None,
+    ) -> list[int]:
+        """Return indices of entries whose retention is below *threshold*.
+
+        Retention falls below *threshold* exactly when the entry was last
+        accessed more than ``2 * half_life_hours * (1 - threshold)`` hours
+        ago, so every entry is compared against a single cutoff time.
+
+        Parameters:
+            entries: Memory entries with ``last_accessed``.
+            threshold: Retention score below which an entry counts as decayed.
+            now: Reference time; defaults to the current UTC time.
+
+        Returns:
+            Ascending indices into ``entries``.
+        """
+        if threshold <= 0.0:
+            return []
+        if threshold > 1.0:
+            return list(range(len(entries)))
+        now = now or datetime.now(UTC)
+        cutoff = _cutoff(now, 2.0 * self._half_life_hours * (1.0 - threshold))
+        return _accessed_before(entries, lambda _entry: cutoff)
+
+    def _retention(self, entry: MemoryEntry, now: datetime) -> float:
         elapsed_hours = (now - entry.last_accessed).total_seconds() / 3600.0
         # At half_life_hours -> 0.5, at 2*half_life_hours -> 0.0
         retention = 1.0 - (elapsed_hours / (2.0 * self._half_life_hours))
@@ -115,10 +340,30 @@ class ExponentialRecencyScorer:
         if total <= 1:
             return 1.0
         normalized = index / max(1, total - 1)
-        denominator = math.exp(self._decay_rate) - 1.0
+        # expm1 keeps precision for small rates where exp(x) - 1 cancels
+        denominator = math.expm1(self._decay_rate)
         if denominator == 0:
             return normalized
-        return (math.exp(self._decay_rate * normalized) - 1.0) / denominator
+        return math.expm1(self._decay_rate * normalized) / denominator
+
+    def score_all(self, total: int) -> list[float]:
+        """Compute scores for every position ``0..total-1`` in one pass.
+
+        Parameters:
+            total: Total number of turns in the window.
+
+        Returns:
+            Scores indexed by position, equal to ``score(i, total)``.
+        """
+        if total <= 1:
+            return [1.0] * total
+        span = total - 1
+        rate = self._decay_rate
+        denominator = math.expm1(rate)
+        if denominator == 0:
+            return [i / span for i in range(total)]
+        expm1 = math.expm1
+        return [expm1(rate * (i / span)) / denominator for i in range(total)]
 
 
 class LinearRecencyScorer:
@@ -149,3 +394,19 @@ class LinearRecencyScorer:
         if total <= 1:
             return 1.0
         return self._min_score + (1.0 - self._min_score) * (index / max(1, total - 1))
+
+    def score_all(self, total: int) -> list[float]:
+        """Compute scores for every position ``0..total-1`` in one pass.
+
+        Parameters:
+            total: Total number of turns in the window.
+
+        Returns:
+            Scores indexed by position, equal to ``score(i, total)``.
+        """
+        if total <= 1:
+            return [1.0] * total
+        span = total - 1
+        base = self._min_score
+        scale = 1.0 - base
+        return [base + scale * (i / span) for i in range(total)]
@@ -7,7 +7,10 @@ when the memory window exceeds its token budget.
 
 from __future__ import annotations
 
+import heapq
+from bisect import bisect_left
 from collections.abc import Callable
+from itertools import accumulate, chain
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -38,14 +41,12 @@ class FIFOEviction:
         Returns:
             A list of zero-based indices into *turns* that should be evicted.
         """
-        indices: list[int] = []
-        freed = 0
-        for i, turn in enumerate(turns):
-            if freed >= tokens_to_free:
-                break
-            indices.append(i)
-            freed += turn.token_count
-        return indices
+        if tokens_to_free <= 0:
+            return []
+        # The running token total is non-decreasing, so the shortest prefix
+        # that frees enough tokens is found by bisection.
+        freed = list(accumulate(turn.token_count for turn in turns))
+        return list(range(min(bisect_left(freed, tokens_to_free) + 1, len(turns))))
 
 
 class ImportanceEviction:
@@ -76,18 +77,25 @@ class ImportanceEviction:
             A list of zero-based indices into *turns* ordered by ascending
             importance (least important first).
         """
-        scored = sorted(
-            enumerate(turns),
-            key=lambda pair: self._importance_fn(pair[1]),
-        )
-        indices: list[int] = []
-        freed = 0
-        for idx, turn in scored:
-            if freed >= tokens_to_free:
-                break
-            indices.append(idx)
-            freed += turn.token_count
-        return indices
+        if tokens_to_free <= 0 or not turns:
+            return []
+        importance_fn = self._importance_fn
+        # The index breaks score ties, matching a stable sort by importance.
+        scored = [(importance_fn(turn), i, turn.token_count) for i, turn in enumerate(turns)]
+        # Evictions usually free a small slice of the window, so rank only
+        # the k least important turns and widen k until the target is met.
+        k = max(8, len(scored) // 16)
+        while True:
+            indices: list[int] = []
+            freed = 0
+            for _, idx, token_count in heapq.nsmallest(k, scored):
+                if freed >= tokens_to_free:
+                    return indices
+                indices.append(idx)
+                freed += token_count
+            if freed >= tokens_to_free or k >= len(scored):
+                return indices
+            k *= 2
 
 
 class PairedEviction:
@@ -132,11 +140,8 @@ class PairedEviction:
                 groups.append(([i], turns[i].token_count))
                 i += 1
 
-        indices: list[int] = []
-        freed = 0
-        for group_indices, group_tokens in groups:
-            if freed >= tokens_to_free:
-                break
-            indices.extend(group_indices)
-            freed += group_tokens
-        return indices
+        if tokens_to_free <= 0:
+            return []
+        freed = list(accumulate(group_tokens for _, group_tokens in groups))
+        cut = min(bisect_left(freed, tokens_to_free) + 1, len(groups))
+        return list(chain.from_iterable(group_indices for group_indices, _ in groups[:cut]))
@@ -15,6 +15,14 @@ from anchor.models.memory import MemoryEntry, MemoryType
 if TYPE_CHECKING:
     from anchor.models.memory import ConversationTurn
 
+# ``MemoryType`` is a ``StrEnum``, so members also match their plain
+# string values as keys.
+_MEMORY_TYPES: dict[str, MemoryType] = {m.value: m for m in MemoryType}
+
+# Keys the extractor resolves itself; everything else is forwarded to
+# ``MemoryEntry`` unchanged.
+_RESERVED_KEYS = frozenset({"content", "memory_type", "source_turns"})
+
 
 class CallbackExtractor:
     """Delegates memory extraction to a user-provided function.
@@ -59,32 +67,42 @@ class CallbackExtractor:
                 ``"content"`` key.
         """
         raw_results = self._extract_fn(turns)
-        entries: list[MemoryEntry] = []
-
-        for raw_original in raw_results:
-            raw = dict(raw_original)  # defensive copy
-            if "content" not in raw:
-                msg = "extraction result must contain a 'content' key"
-                raise ValueError(msg)
-
-            # Resolve memory_type: use provided string/enum or fall back to default
-            memory_type_raw = raw.pop("memory_type", None)
-            if memory_type_raw is not None:
-                memory_type = MemoryType(memory_type_raw)
-            else:
-                memory_type = self._default_type
-
-            # Build the source_turns list from turn timestamps if not provided
-            source_turns: list[str] = raw.pop("source_turns", [])
-            if not source_turns:
-                source_turns = [t.timestamp.isoformat() for t in turns]
-
-            entry = MemoryEntry(
-                content=raw.pop("content"),
-                memory_type=memory_type,
-                source_turns=source_turns,
-                **raw,
-            )
-            entries.append(entry)
-
-        return entries
+        if not raw_results:
+            return []
+        # Turn timestamps are formatted once; entries without explicit
+        # source_turns each receive a copy.
+        default_source_turns = [t.timestamp.isoformat() for t in turns]
+        return [self._build_entry(raw, default_source_turns) for raw in raw_results]
+
+    def _build_entry(self, raw: dict[str, Any], default_source_turns: list[str]) -> MemoryEntry:
+        """Build one ``MemoryEntry`` from an extraction result dictionary.
+
+        The caller's dict is only read, never mutated, so no copy is made.
+        A single sweep splits it into the reserved keys resolved here and
+        the extra fields forwarded to ``MemoryEntry``.
+        """
+        known: dict[str, Any] = {}
+        extra: dict[str, Any] = {}
+        for key, value in raw.items():
+            (known if key in _RESERVED_KEYS else extra)[key] = value
+
+        if "content" not in known:
+            msg = "extraction result must contain a 'content' key"
+            raise ValueError(msg)
+
+        # Resolve memory_type: use provided string/enum or fall back to default
+        memory_type_raw = known.get("memory_type")
+        if memory_type_raw is None:
+            memory_type = self._default_type
+        elif isinstance(memory_type_raw, str) and memory_type_raw in _MEMORY_TYPES:
+            memory_type = _MEMORY_TYPES[memory_type_raw]
+        else:
+            memory_type = MemoryType(memory_type_raw)
+
+        source_turns: list[str] = known.get("source_turns") or list(default_source_turns)
+        return MemoryEntry(
+            content=known["content"],
+            memory_type=memory_type,
+            source_turns=source_turns,
+            **extra,
+        )
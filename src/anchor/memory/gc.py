@@ -13,18 +13,63 @@ garbage collector can identify and delete them.
 from __future__ import annotations
 
 import logging
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
 from anchor.memory.callbacks import MemoryCallback, _fire_memory_callback
+from anchor.memory.decay import decayed_indices
 from anchor.protocols.storage import GarbageCollectableStore
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from concurrent.futures import Executor
+
     from anchor.models.memory import MemoryEntry
     from anchor.protocols.memory import MemoryDecay
 
 logger = logging.getLogger(__name__)
 
 
+def _delete_entries(store: GarbageCollectableStore, entries: list[MemoryEntry]) -> None:
+    """Delete *entries* from *store*, in one batch when the store supports it."""
+    delete_many = getattr(store, "delete_many", None)
+    if delete_many is not None:
+        delete_many([entry.id for entry in entries])
+        return
+    for entry in entries:
+        store.delete(entry.id)
+
+
+def _iter_entries(store: GarbageCollectableStore) -> Iterator[MemoryEntry]:
+    """Iterate every entry in *store*, streaming when the store supports it."""
+    iter_all = getattr(store, "iter_all_unfiltered", None)
+    if iter_all is not None:
+        result: Iterator[MemoryEntry] = iter_all()
+        return result
+    return iter(store.list_all_unfiltered())
+
+
+def _split_expired(
+    entries: Iterable[MemoryEntry], now: datetime, keep_live: bool = True
+) -> tuple[list[MemoryEntry], list[MemoryEntry], int]:
+    """Partition *entries* into ``(expired, live, total)`` in a single pass.
+
+    With ``keep_live=False`` live entries are only counted, so a streamed
+    store never has more than its expired entries held in memory.
+    """
+    expired: list[MemoryEntry] = []
+    live: list[MemoryEntry] = []
+    total = 0
+    for entry in entries:
+        total += 1
+        expires_at = entry.expires_at
+        if expires_at is not None and now >= expires_at:
+            expired.append(entry)
+        elif keep_live:
+            live.append(entry)
+    return expired, live, total
+
+
 class GCStats:
     """Statistics from a garbage collection run.
 
@@ -91,20 +136,37 @@ class MemoryGarbageCollector:
        compute the retention score of every remaining entry and remove
        those whose score falls below ``retention_threshold``.
 
-    Both phases fire the appropriate ``MemoryCallback`` hooks.
+    Both phases fire the appropriate ``MemoryCallback`` hooks.  By default
+    the hooks run inline before ``collect`` returns; pass
+    ``callback_executor`` to hand them to an executor instead, so slow
+    callbacks (metrics pushes, audit logs, webhooks) do not hold up
+    collection.  Such callbacks run after the entries are already gone
+    and must not assume anything about the store's state at that point.
+    The collector never shuts the executor down.
     """
 
-    __slots__ = ("_callbacks", "_decay", "_store")
+    __slots__ = ("_callback_executor", "_callbacks", "_decay", "_store")
 
     def __init__(
         self,
         store: GarbageCollectableStore,
         decay: MemoryDecay | None = None,
         callbacks: list[MemoryCallback] | None = None,
+        callback_executor: Executor | None = None,
     ) -> None:
         self._store = store
         self._decay = decay
         self._callbacks = callbacks or []
+        self._callback_executor = callback_executor
+
+    def _notify(self, method: str, *args: object) -> None:
+        """Fire *method* on the callbacks, inline or via the executor."""
+        if self._callback_executor is None:
+            _fire_memory_callback(self._callbacks, method, *args)
+        else:
+            self._callback_executor.submit(
+                _fire_memory_callback, list(self._callbacks), method, *args
+            )
 
     def collect(
         self,
@@ -128,15 +190,27 @@ class MemoryGarbageCollector:
         Returns:
             A ``GCStats`` instance summarising what was (or would be) pruned.
         """
-        all_entries = self._store.list_all_unfiltered()
-        expired = self.collect_expired(dry_run=dry_run, _entries=all_entries)
-        decayed = self.collect_decayed(
-            retention_threshold=retention_threshold, dry_run=dry_run, _entries=all_entries
-        ) if self._decay is not None else []
-
-        expired_ids = {e.id for e in expired}
-        decayed_ids = {e.id for e in decayed}
-        total_remaining = len(all_entries) - len(expired_ids) - len(decayed_ids)
+        # One clock reading serves both phases, so an entry cannot expire
+        # between them and is never counted twice.
+        now = datetime.now(UTC)
+        # A single expiry scan feeds both phases: the expired entries are
+        # pruned directly and the rest become the decay candidates.  With
+        # no decay phase the live entries are only counted.
+        decay = self._decay
+        expired_entries, live_entries, total = _split_expired(
+            _iter_entries(self._store), now, keep_live=decay is not None
+        )
+        expired = self._prune_expired(expired_entries, dry_run)
+        decayed = (
+            self._prune_decayed(decay, live_entries, retention_threshold, dry_run, now)
+            if decay is not None
+            else []
+        )
+
+        # The phases are disjoint (decay only scores live entries), so the
+        # remainder is plain arithmetic on the single listing above.  In a
+        # dry run it is what *would* remain.
+        total_remaining = total - len(expired) - len(decayed)
         return GCStats(
             expired_pruned=len(expired),
             decayed_pruned=len(decayed),
@@ -158,19 +232,11 @@ class MemoryGarbageCollector:
         Returns:
             The list of entries that were (or would be) pruned.
         """
-        all_entries = _entries if _entries is not None else self._store.list_all_unfiltered()
-        expired = [e for e in all_entries if e.is_expired]
-
-        if expired and not dry_run:
-            for entry in expired:
-                self._store.delete(entry.id)
-
-        if expired:
-            _fire_memory_callback(
-                self._callbacks, "on_expiry_prune", expired
-            )
-
-        return expired
+        all_entries = _entries if _entries is not None else _iter_entries(self._store)
+        expired, _live, _total = _split_expired(
+            all_entries, datetime.now(UTC), keep_live=False
+        )
+        return self._prune_expired(expired, dry_run)
 
     def collect_decayed(
         self,
@@ -196,23 +262,40 @@ class MemoryGarbageCollector:
             msg = "Cannot collect decayed entries without a decay function"
             raise ValueError(msg)
 
-        all_entries = _entries if _entries is not None else self._store.list_all_unfiltered()
+        now = datetime.now(UTC)
+        all_entries = _entries if _entries is not None else _iter_entries(self._store)
         # Only consider non-expired entries for decay scoring
-        candidates = [e for e in all_entries if not e.is_expired]
+        candidates = [e for e in all_entries if e.expires_at is None or now < e.expires_at]
+        return self._prune_decayed(self._decay, candidates, retention_threshold, dry_run, now)
+
+    def _prune_expired(
+        self, expired: list[MemoryEntry], dry_run: bool
+    ) -> list[MemoryEntry]:
+        """Delete *expired* (unless *dry_run*) and fire the expiry hook."""
+        if expired and not dry_run:
+            _delete_entries(self._store, expired)
 
-        decayed: list[MemoryEntry] = []
-        for entry in candidates:
-            retention = self._decay.compute_retention(entry)
-            if retention < retention_threshold:
-                decayed.append(entry)
+        if expired:
+            self._notify("on_expiry_prune", expired)
+
+        return expired
+
+    def _prune_decayed(
+        self,
+        decay: MemoryDecay,
+        candidates: list[MemoryEntry],
+        retention_threshold: float,
+        dry_run: bool,
+        now: datetime,
+    ) -> list[MemoryEntry]:
+        """Prune the unexpired *candidates* whose retention at *now* is too low."""
+        indices = decayed_indices(decay, candidates, retention_threshold, now)
+        decayed = [candidates[i] for i in indices]
 
         if decayed and not dry_run:
-            for entry in decayed:
-                self._store.delete(entry.id)
+            _delete_entries(self._store, decayed)
 
         if decayed:
-            _fire_memory_callback(
-                self._callbacks, "on_decay_prune", decayed, retention_threshold
-            )
+            self._notify("on_decay_prune", decayed, retention_threshold)
 
         return decayed
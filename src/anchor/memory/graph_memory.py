@@ -7,9 +7,56 @@ without requiring an external graph database.
 
 from __future__ import annotations
 
-from collections import deque
+from collections import defaultdict
+from collections.abc import Iterator
+from itertools import chain, count
 from typing import Any
 
+# Traversals switch from the dict-of-sets adjacency to an integer
+# snapshot only for graphs at least this large, and only once this many
+# traversals have run since the last mutation, so interleaved
+# write/read workloads never pay for a rebuild per query.
+_SNAPSHOT_MIN_ENTITIES = 256
+_SNAPSHOT_MIN_READS = 4
+
+
+class _IntAdjacency:
+    """Read-only integer copy of an adjacency index.
+
+    Entity IDs are mapped to contiguous ints and each row lists a node's
+    neighbours in the same order the source set iterates, so traversal
+    order is unchanged.  A ``bytearray`` replaces the visited set.
+    """
+
+    __slots__ = ("ids", "position", "rows")
+
+    def __init__(self, adjacency: dict[str, set[str]]) -> None:
+        self.ids = list(adjacency)
+        self.position = {eid: i for i, eid in enumerate(self.ids)}
+        position = self.position
+        self.rows = [[position[n] for n in adjacency[eid]] for eid in self.ids]
+
+    def walk(self, entity_id: str, max_depth: int) -> Iterator[str]:
+        """Yield entities within *max_depth* hops of *entity_id* in BFS order."""
+        start = self.position.get(entity_id)
+        if start is None:
+            return
+        ids, rows = self.ids, self.rows
+        visited = bytearray(len(ids))
+        visited[start] = 1
+        frontier = [start]
+        for _ in range(max_depth):
+            discovered: list[int] = []
+            for u in frontier:
+                for v in rows[u]:
+                    if not visited[v]:
+                        visited[v] = 1
+                        discovered.append(v)
+                        yield ids[v]
+            if not discovered:
+                return
+            frontier = discovered
+
 
 class SimpleGraphMemory:
     """In-memory graph for entity-relationship tracking.
@@ -38,18 +85,27 @@ class SimpleGraphMemory:
 
     __slots__ = (
         "_adjacency",
-        "_adjacency_dirty",
+        "_edge_ids",
+        "_edge_seq",
         "_edges",
         "_entity_to_memories",
         "_nodes",
+        "_reads_since_write",
+        "_snapshot",
     )
 
     def __init__(self) -> None:
         self._nodes: dict[str, dict[str, Any]] = {}
-        self._edges: list[tuple[str, str, str]] = []
-        self._entity_to_memories: dict[str, list[str]] = {}
+        # Edges keyed by insertion sequence number, plus the ids of the
+        # edges incident to each entity, so removal is O(degree).
+        self._edges: dict[int, tuple[str, str, str]] = {}
+        self._edge_ids: dict[str, set[int]] = {}
+        self._edge_seq = count()
+        # Only ever read with .get() so lookups never insert empty lists.
+        self._entity_to_memories: defaultdict[str, list[str]] = defaultdict(list)
         self._adjacency: dict[str, set[str]] = {}
-        self._adjacency_dirty: bool = True
+        self._snapshot: _IntAdjacency | None = None
+        self._reads_since_write = 0
 
     def add_entity(self, entity_id: str, metadata: dict[str, Any] | None = None) -> None:
         """Add an entity node to the graph.
@@ -81,8 +137,13 @@ class SimpleGraphMemory:
             self._nodes[source] = {}
         if target not in self._nodes:
             self._nodes[target] = {}
-        self._edges.append((source, relation, target))
-        self._adjacency_dirty = True
+        edge_id = next(self._edge_seq)
+        self._edges[edge_id] = (source, relation, target)
+        self._edge_ids.setdefault(source, set()).add(edge_id)
+        self._edge_ids.setdefault(target, set()).add(edge_id)
+        self._adjacency.setdefault(source, set()).add(target)
+        self._adjacency.setdefault(target, set()).add(source)
+        self._invalidate_snapshot()
 
     def link_memory(self, entity_id: str, memory_id: str) -> None:
         """Link a memory entry ID to an entity.
@@ -97,15 +158,7 @@ class SimpleGraphMemory:
         if entity_id not in self._nodes:
             msg = f"Entity '{entity_id}' does not exist in the graph"
             raise KeyError(msg)
-        self._entity_to_memories.setdefault(entity_id, []).append(memory_id)
-
-    def _rebuild_adjacency(self) -> None:
-        """Rebuild the cached adjacency index from edges."""
-        self._adjacency = {}
-        for src, _rel, tgt in self._edges:
-            self._adjacency.setdefault(src, set()).add(tgt)
-            self._adjacency.setdefault(tgt, set()).add(src)
-        self._adjacency_dirty = False
+        self._entity_to_memories[entity_id].append(memory_id)
 
     def get_related_entities(self, entity_id: str, max_depth: int = 2) -> list[str]:
         """Find entities related to *entity_id* via BFS traversal.
@@ -124,24 +177,47 @@ class SimpleGraphMemory:
         if entity_id not in self._nodes:
             return []
 
-        if self._adjacency_dirty:
-            self._rebuild_adjacency()
+        if max_depth <= 1:
+            if max_depth < 1:
+                return []
+            return [n for n in self._adjacency.get(entity_id, ()) if n != entity_id]
+        return list(self._iter_related(entity_id, max_depth))
 
-        visited: set[str] = {entity_id}
-        queue: deque[tuple[str, int]] = deque([(entity_id, 0)])
-        result: list[str] = []
+    def _invalidate_snapshot(self) -> None:
+        """Drop the integer snapshot after the adjacency index changed."""
+        self._snapshot = None
+        self._reads_since_write = 0
 
-        while queue:
-            current, depth = queue.popleft()
-            if depth >= max_depth:
-                continue
-            for neighbor in self._adjacency.get(current, set()):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    result.append(neighbor)
-                    queue.append((neighbor, depth + 1))
+    def _iter_related(self, entity_id: str, max_depth: int) -> Iterator[str]:
+        """Yield entities within *max_depth* hops of *entity_id* in BFS order.
 
-        return result
+        Level-order traversal: each hop expands the entities discovered by
+        the previous one, so no (entity, depth) queue is needed.  The
+        starting entity is not yielded.  Large, read-mostly graphs are
+        walked over an integer snapshot (``_IntAdjacency``) instead.
+        """
+        adjacency = self._adjacency
+        if self._snapshot is None and len(adjacency) >= _SNAPSHOT_MIN_ENTITIES:
+            self._reads_since_write += 1
+            if self._reads_since_write >= _SNAPSHOT_MIN_READS:
+                self._snapshot = _IntAdjacency(adjacency)
+        if self._snapshot is not None:
+            yield from self._snapshot.walk(entity_id, max_depth)
+            return
+
+        visited: set[str] = {entity_id}
+        frontier = [entity_id]
+        for _ in range(max_depth):
+            discovered: list[str] = []
+            for current in frontier:
+                for neighbor in adjacency.get(current, ()):
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        discovered.append(neighbor)
+                        yield neighbor
+            if not discovered:
+                return
+            frontier = discovered
 
     def get_memory_ids_for_entity(self, entity_id: str) -> list[str]:
         """Get all memory IDs linked to a specific entity.
@@ -169,11 +245,16 @@ class SimpleGraphMemory:
             A deduplicated list of memory IDs from the entity and its
             neighbors.
         """
-        all_entities = [entity_id, *self.get_related_entities(entity_id, max_depth)]
+        entity_to_memories = self._entity_to_memories
         seen: set[str] = set()
         result: list[str] = []
-        for eid in all_entities:
-            for mid in self._entity_to_memories.get(eid, []):
+        entities: Iterator[str] = iter(())
+        if entity_id in self._nodes:
+            entities = self._iter_related(entity_id, max_depth)
+        # Memories are collected while the traversal runs, so the related
+        # entities are never materialised as a separate list.
+        for eid in chain((entity_id,), entities):
+            for mid in entity_to_memories.get(eid, ()):
                 if mid not in seen:
                     seen.add(mid)
                     result.append(mid)
@@ -188,18 +269,28 @@ class SimpleGraphMemory:
             entity_id: The entity to remove.
         """
         self._nodes.pop(entity_id, None)
-        self._edges = [
-            (s, r, t) for s, r, t in self._edges if s != entity_id and t != entity_id
-        ]
         self._entity_to_memories.pop(entity_id, None)
-        self._adjacency_dirty = True
+        edge_ids = self._edge_ids.pop(entity_id, ())
+        neighbors = self._adjacency.pop(entity_id, None)
+        if neighbors is None:
+            return
+        self._invalidate_snapshot()
+        for neighbor in neighbors - {entity_id}:
+            self._adjacency[neighbor].discard(entity_id)
+        for edge_id in edge_ids:
+            source, _relation, target = self._edges.pop(edge_id)
+            other = target if source == entity_id else source
+            if other != entity_id:
+                self._edge_ids[other].discard(edge_id)
 
     def clear(self) -> None:
         """Remove all entities, relationships, and memory linkages."""
         self._nodes.clear()
         self._edges.clear()
+        self._edge_ids.clear()
         self._entity_to_memories.clear()
-        self._adjacency_dirty = True
+        self._adjacency.clear()
+        self._invalidate_snapshot()
 
     @property
     def entities(self) -> list[str]:
@@ -209,7 +300,7 @@ class SimpleGraphMemory:
     @property
     def relationships(self) -> list[tuple[str, str, str]]:
         """List all relationships as ``(source, relation, target)`` tuples."""
-        return list(self._edges)
+        return list(self._edges.values())
 
     def get_entity_metadata(self, entity_id: str) -> dict[str, Any]:
         """Get metadata for an entity.
@@ -18,7 +18,7 @@ from anchor.models.memory import (
 from anchor.protocols.memory import ConversationMemory
 from anchor.protocols.storage import MemoryEntryStore
 from anchor.protocols.tokenizer import Tokenizer
-from anchor.tokens.counter import get_default_counter
+from anchor.tokens.counter import count_tokens_batch, get_default_counter
 
 from .sliding_window import SlidingWindowMemory
 from .summary_buffer import SummaryBufferMemory
@@ -37,7 +37,13 @@ class MemoryManager:
     created from those parameters (backwards-compatible default).
     """
 
-    __slots__ = ("_conversation", "_persistent_store", "_tokenizer")
+    __slots__ = (
+        "_add_impl",
+        "_conversation",
+        "_fact_items",
+        "_persistent_store",
+        "_tokenizer",
+    )
 
     def __init__(
         self,
@@ -59,7 +65,19 @@ class MemoryManager:
                 tokenizer=self._tokenizer,
                 on_evict=on_evict,
             )
+        # The backend's append method, resolved once instead of per message.
+        self._add_impl: Callable[[Role, str], object] | None
+        if isinstance(self._conversation, SummaryBufferMemory):
+            self._add_impl = self._conversation.add_message
+        elif isinstance(self._conversation, SlidingWindowMemory):
+            self._add_impl = self._conversation.add_turn
+        else:
+            self._add_impl = None
         self._persistent_store = persistent_store
+        # entry id -> item from the last get_context_items() call.  Entries
+        # are mutable, so an item is only handed out again while the fields
+        # it was built from still match the entry.
+        self._fact_items: dict[str, ContextItem] = {}
 
     def __repr__(self) -> str:
         has_store = self._persistent_store is not None
@@ -95,16 +113,13 @@ class MemoryManager:
 
     def _add_message(self, role: Role, content: str) -> None:
         """Add a message to the conversation backend (works with both types)."""
-        if isinstance(self._conversation, SummaryBufferMemory):
-            self._conversation.add_message(role, content)
-        elif isinstance(self._conversation, SlidingWindowMemory):
-            self._conversation.add_turn(role, content)
-        else:
+        if self._add_impl is None:
             msg = (
                 f"ConversationMemory implementation {type(self._conversation).__name__!r} "
                 "does not support add_turn() or add_message()"
             )
             raise TypeError(msg)
+        self._add_impl(role, content)
 
     def add_user_message(self, content: str) -> None:
         """Add a user message to the conversation history."""
@@ -154,17 +169,25 @@ class MemoryManager:
             msg = "No persistent_store configured. Pass a MemoryEntryStore to MemoryManager."
             raise StorageError(msg)
 
-        # Content-hash deduplication: check for existing entry with same content
+        # Content-hash deduplication: check for existing entry with same content.
+        # Stores with a hash index answer directly; others are scanned.
         content_hash = _compute_content_hash(content)
-        for existing in self._persistent_store.list_all():
-            if existing.content_hash == content_hash:
-                return existing
+        find = getattr(self._persistent_store, "find_by_content_hash", None)
+        if find is not None:
+            found: MemoryEntry | None = find(content_hash)
+            if found is not None:
+                return found
+        else:
+            for existing in self._persistent_store.list_all():
+                if existing.content_hash == content_hash:
+                    return existing
 
         entry = MemoryEntry(
             content=content,
             tags=tags or [],
             memory_type=memory_type,
             metadata=metadata or {},
+            content_hash=content_hash,
         )
         self._persistent_store.add(entry)
         return entry
@@ -210,17 +233,29 @@ class MemoryManager:
         """
         if self._persistent_store is None:
             return None
+        # Stores with ``get`` look the id up directly; others are scanned.
         existing: MemoryEntry | None = None
-        for entry in self._persistent_store.list_all():
-            if entry.id == entry_id:
-                existing = entry
-                break
+        get = getattr(self._persistent_store, "get", None)
+        if get is not None:
+            existing = get(entry_id)
+            if existing is not None and existing.is_expired:
+                existing = None
+        else:
+            for entry in self._persistent_store.list_all():
+                if entry.id == entry_id:
+                    existing = entry
+                    break
         if existing is None:
             return None
+        # Upserts often resend the same text; its hash is already known.
+        if content == existing.content and existing.content_hash:
+            content_hash = existing.content_hash
+        else:
+            content_hash = _compute_content_hash(content)
         updated = existing.model_copy(
             update={
                 "content": content,
-                "content_hash": _compute_content_hash(content),
+                "content_hash": content_hash,
                 "updated_at": datetime.now(UTC),
             }
         )
@@ -235,34 +270,87 @@ class MemoryManager:
         Persistent memory facts are included at priority 8 (between
         system=10 and conversation=7).  Conversation turns use the
         caller-supplied *priority* (default 7).
+
+        Fact items are reused across calls while their stored entry is
+        unchanged, so repeated assembly does not re-tokenize facts.
         """
-        items: list[ContextItem] = []
+        if self._persistent_store is None:
+            # Conversation only: the backend already returns a fresh list.
+            return self._conversation.to_context_items(priority=priority)
 
-        # Persistent facts first (higher priority)
-        if self._persistent_store is not None:
-            for entry in self._persistent_store.list_all():
-                if entry.is_expired:
-                    continue
-                token_count = self._tokenizer.count_tokens(entry.content)
-                item = ContextItem(
-                    content=entry.content,
-                    source=SourceType.MEMORY,
-                    score=entry.relevance_score,
-                    priority=8,
-                    token_count=token_count,
-                    metadata={
-                        "memory_entry_id": entry.id,
-                        "memory_type": str(entry.memory_type),
-                        "tags": entry.tags,
-                    },
-                    created_at=entry.created_at,
-                )
-                items.append(item)
-
-        # Conversation turns
+        # Persistent facts first (higher priority), then conversation turns
+        items = self._fact_context_items(self._persistent_store)
         items.extend(self._conversation.to_context_items(priority=priority))
         return items
 
+    def _fact_context_items(self, store: MemoryEntryStore) -> list[ContextItem]:
+        """Context items for the live persistent facts, reusing cached ones.
+
+        Only facts whose content is new or changed are tokenized.  Several
+        at once go through one batched call when the tokenizer supports
+        it; the usual single changed fact is counted directly.
+        """
+        previous = self._fact_items
+        entries = store.list_all()
+
+        def known_count(entry: MemoryEntry) -> int | None:
+            cached = previous.get(entry.id)
+            if cached is not None and cached.content == entry.content:
+                return cached.token_count
+            return None
+
+        pending = [e.content for e in entries if known_count(e) is None]
+        if len(pending) <= 1:
+            counts = [self._tokenizer.count_tokens(text) for text in pending]
+        else:
+            counts = count_tokens_batch(self._tokenizer, pending)
+        new_counts = dict(zip(pending, counts, strict=True))
+
+        current: dict[str, ContextItem] = {}
+        items: list[ContextItem] = []
+        for entry in entries:
+            cached = previous.get(entry.id)
+            if cached is not None and self._fact_item_matches(cached, entry):
+                item = cached
+            else:
+                token_count = known_count(entry)
+                if token_count is None:
+                    token_count = new_counts[entry.content]
+                item = self._fact_item(entry, token_count)
+            current[entry.id] = item
+            items.append(item)
+        self._fact_items = current
+        return items
+
+    @staticmethod
+    def _fact_item_matches(item: ContextItem, entry: MemoryEntry) -> bool:
+        """Whether *item* still reflects every field it was built from *entry*."""
+        metadata = item.metadata
+        return (
+            item.content == entry.content
+            and item.score == entry.relevance_score
+            and item.created_at == entry.created_at
+            and metadata["memory_type"] == str(entry.memory_type)
+            and metadata["tags"] == entry.tags
+        )
+
+    @staticmethod
+    def _fact_item(entry: MemoryEntry, token_count: int) -> ContextItem:
+        """Build the context item for a persistent fact."""
+        return ContextItem(
+            content=entry.content,
+            source=SourceType.MEMORY,
+            score=entry.relevance_score,
+            priority=8,
+            token_count=token_count,
+            metadata={
+                "memory_entry_id": entry.id,
+                "memory_type": str(entry.memory_type),
+                "tags": entry.tags,
+            },
+            created_at=entry.created_at,
+        )
+
     def clear(self) -> None:
         """Clear conversation history and persistent store (if present)."""
         self._conversation.clear()
@@ -8,6 +8,7 @@ from collections import deque
 from collections.abc import Callable
 from typing import TYPE_CHECKING
 
+from anchor.memory.decay import recency_scores
 from anchor.models.context import ContextItem, SourceType
 from anchor.models.memory import ConversationTurn, Role
 from anchor.protocols.tokenizer import Tokenizer
@@ -29,13 +30,16 @@ class SlidingWindowMemory:
     """
 
     __slots__ = (
+        "_default_scores",
         "_eviction_policy",
+        "_items_cache",
         "_lock",
         "_max_tokens",
         "_on_evict",
         "_recency_scorer",
         "_tokenizer",
         "_total_tokens",
+        "_turn_items",
         "_turns",
     )
 
@@ -57,6 +61,17 @@ class SlidingWindowMemory:
         self._recency_scorer = recency_scorer
         self._turns: deque[ConversationTurn] = deque()
         self._total_tokens: int = 0
+        # Context items per priority for the current turns; cleared on
+        # every mutation.  Items are frozen, so they can be handed out again
+        # while they still match their turn (turns are mutable).
+        self._items_cache: dict[int, list[ContextItem]] = {}
+        # id(turn) -> (turn, item) from the last build.  After a mutation the
+        # surviving, unedited turns' items are copied with their new score
+        # instead of being validated from scratch.
+        self._turn_items: dict[int, tuple[ConversationTurn, ContextItem]] = {}
+        # Default recency scores depend only on the turn count, so the last
+        # table is reused while the window length is unchanged.
+        self._default_scores: list[float] = []
         self._lock = threading.Lock()
 
     def __repr__(self) -> str:
@@ -72,8 +87,8 @@ class SlidingWindowMemory:
 
     @property
     def total_tokens(self) -> int:
-        with self._lock:
-            return self._total_tokens
+        # Lock-free: writers publish the total with a single assignment.
+        return self._total_tokens
 
     @property
     def max_tokens(self) -> int:
@@ -82,53 +97,54 @@ class SlidingWindowMemory:
     def add_turn(self, role: Role, content: str, **metadata: object) -> ConversationTurn:
         """Add a conversation turn, evicting old turns if necessary."""
         token_count = self._tokenizer.count_tokens(content)
+
+        # If this single turn exceeds the budget, truncate it.  ``metadata``
+        # is a fresh dict per call, so it can be tagged in place.
+        if token_count > self._max_tokens:
+            content = self._tokenizer.truncate_to_tokens(content, self._max_tokens)
+            token_count = self._max_tokens
+            metadata["truncated"] = True
+
         turn = ConversationTurn(
             role=role,
             content=content,
             token_count=token_count,
-            metadata=dict(metadata),
+            metadata=metadata,
         )
 
-        # If this single turn exceeds the budget, truncate it
-        if token_count > self._max_tokens:
-            truncated = self._tokenizer.truncate_to_tokens(content, self._max_tokens)
-            content = truncated
-            token_count = self._max_tokens
-            turn = ConversationTurn(
-                role=role,
-                content=content,
-                token_count=token_count,
-                metadata={**dict(metadata), "truncated": True},
-            )
-
         with self._lock:
-            # Evict turns until the new turn fits
+            # Evict turns until the new turn fits.  The running total is kept
+            # in a local and published once, after the append, so lock-free
+            # readers of ``total_tokens`` never see a half-applied update.
+            total = self._total_tokens
             evicted_turns: list[ConversationTurn] = []
             if (
                 self._eviction_policy is not None
                 and self._turns
-                and (self._total_tokens + turn.token_count > self._max_tokens)
+                and (total + turn.token_count > self._max_tokens)
             ):
-                tokens_to_free = (self._total_tokens + turn.token_count) - self._max_tokens
-                indices = self._eviction_policy.select_for_eviction(
-                    list(self._turns), tokens_to_free
-                )
-                # Sort descending so we can pop from highest index first
-                # to avoid index shifting
-                for idx in sorted(indices, reverse=True):
-                    evicted = self._turns[idx]
-                    del self._turns[idx]
-                    self._total_tokens -= evicted.token_count
-                    evicted_turns.append(evicted)
-                # Reverse so evicted_turns is in original order (oldest first)
-                evicted_turns.reverse()
+                tokens_to_free = (total + turn.token_count) - self._max_tokens
+                snapshot = list(self._turns)
+                indices = self._eviction_policy.select_for_eviction(snapshot, tokens_to_free)
+                # Resolve indices against the snapshot the policy saw (range()
+                # normalises negatives and rejects out-of-range ones), then
+                # refill the deque in one pass instead of deleting from its
+                # middle once per index.
+                positions = range(len(snapshot))
+                drop = {positions[idx] for idx in indices}
+                if drop:
+                    evicted_turns = [snapshot[idx] for idx in sorted(drop)]
+                    self._turns.clear()
+                    self._turns.extend(t for i, t in enumerate(snapshot) if i not in drop)
+                    total -= sum(t.token_count for t in evicted_turns)
             else:
-                # Default FIFO eviction
-                while self._turns and (
-                    self._total_tokens + turn.token_count > self._max_tokens
-                ):
-                    evicted = self._turns.popleft()
-                    self._total_tokens -= evicted.token_count
+                # Default FIFO eviction.  Every turn is evicted at most once,
+                # so this is amortised O(1) per add; keep the loop on locals.
+                turns = self._turns
+                limit = self._max_tokens - turn.token_count
+                while turns and total > limit:
+                    evicted = turns.popleft()
+                    total -= evicted.token_count
                     evicted_turns.append(evicted)
 
             if evicted_turns and self._on_evict is not None:
@@ -140,7 +156,8 @@ class SlidingWindowMemory:
                     )
 
             self._turns.append(turn)
-            self._total_tokens += turn.token_count
+            self._total_tokens = total + turn.token_count
+            self._items_cache.clear()
         return turn
 
     def to_context_items(self, priority: int = 7) -> list[ContextItem]:
@@ -151,28 +168,83 @@ class SlidingWindowMemory:
         downstream formatters (Anthropic, OpenAI) can set the role via
         their own message structure and avoid the double-role bug
         (e.g. ``{"role": "user", "content": "user: Hello"}``).
+
+        Items are cached per *priority* until the next mutation, so
+        repeated calls on an unchanged window return the same items.  A
+        turn edited in place after it was added gets a rebuilt item.
         """
         with self._lock:
-            items: list[ContextItem] = []
+            cached = self._items_cache.get(priority)
+            if cached is not None and all(map(self._item_matches, cached, self._turns)):
+                return list(cached)
             num_turns = len(self._turns)
-            for i, turn in enumerate(self._turns):
-                # Recency-weighted score: use custom scorer or default linear 0.5-1.0
-                if self._recency_scorer is not None:
-                    recency_score = self._recency_scorer.score(i, num_turns)
+            # Recency-weighted scores for all turns at once: custom scorer
+            # or default linear 0.5-1.0, rounded for stable output.
+            if self._recency_scorer is not None:
+                raw_scores = recency_scores(self._recency_scorer, num_turns)
+                scores = [round(score, 4) for score in raw_scores]
+            else:
+                scores = self._default_scores
+                if len(scores) != num_turns:
+                    denom = max(1, num_turns - 1)
+                    scores = [round(0.5 + 0.5 * (i / denom), 4) for i in range(num_turns)]
+                    self._default_scores = scores
+            previous = self._turn_items
+            current: dict[int, tuple[ConversationTurn, ContextItem]] = {}
+            items: list[ContextItem] = []
+            for turn, score in zip(self._turns, scores, strict=True):
+                known = previous.get(id(turn))
+                if known is not None and known[0] is turn and self._item_matches(known[1], turn):
+                    item = self._rescore(known[1], score, priority, turn)
                 else:
-                    recency_score = 0.5 + 0.5 * (i / max(1, num_turns - 1))
-                item = ContextItem(
-                    content=turn.content,
-                    source=SourceType.CONVERSATION,
-                    score=round(recency_score, 4),
-                    priority=priority,
-                    token_count=turn.token_count,
-                    metadata={"role": turn.role, **turn.metadata},
-                    created_at=turn.timestamp,
-                )
+                    item = self._turn_item(turn, score, priority)
+                current[id(turn)] = (turn, item)
                 items.append(item)
-            return items
+            self._turn_items = current
+            self._items_cache[priority] = items
+            return list(items)
+
+    @staticmethod
+    def _turn_item(turn: ConversationTurn, score: float, priority: int) -> ContextItem:
+        return ContextItem(
+            content=turn.content,
+            source=SourceType.CONVERSATION,
+            score=score,
+            priority=priority,
+            token_count=turn.token_count,
+            metadata={"role": turn.role, **turn.metadata},
+            created_at=turn.timestamp,
+        )
+
+    @staticmethod
+    def _item_matches(item: ContextItem, turn: ConversationTurn) -> bool:
+        """Whether *item* still reflects every field it was built from *turn*."""
+        return (
+            item.content == turn.content
+            and item.token_count == turn.token_count
+            and item.created_at == turn.timestamp
+            and item.metadata == {"role": turn.role, **turn.metadata}
+        )
+
+    @classmethod
+    def _rescore(
+        cls, item: ContextItem, score: float, priority: int, turn: ConversationTurn
+    ) -> ContextItem:
+        """Reuse *item* for *turn* with a new *score*.
+
+        ``model_copy`` skips validation, so it is only used when the
+        priority matches the (already validated) item and the score is in
+        range; anything else is rebuilt and validated normally.
+        """
+        if item.priority != priority or not 0.0 <= score <= 1.0:
+            return cls._turn_item(turn, score, priority)
+        if item.score == score:
+            return item
+        return item.model_copy(update={"score": score})
 
     def clear(self) -> None:
-        self._turns.clear()
-        self._total_tokens = 0
+        with self._lock:
+            self._turns.clear()
+            self._total_tokens = 0
+            self._items_cache.clear()
+            self._turn_items = {}
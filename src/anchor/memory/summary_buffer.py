@@ -107,6 +107,7 @@ class SummaryBufferMemory:
 
     def _handle_eviction(self, evicted_turns: list[ConversationTurn]) -> None:
         """Callback invoked by the sliding window when turns are evicted."""
+        previous = self._summary
         try:
             if self._progressive_compact_fn is not None:
                 self._summary = self._progressive_compact_fn(evicted_turns, self._summary)
@@ -121,10 +122,12 @@ class SummaryBufferMemory:
                 self._summary = fallback
             logger.exception("Compaction failed; using raw turn content as fallback summary")
 
-        if self._summary is not None:
-            self._summary_tokens = self._tokenizer.count_tokens(self._summary)
-        else:
+        # A compaction that leaves the summary unchanged keeps its count;
+        # only new summary text is tokenized.
+        if self._summary is None:
             self._summary_tokens = 0
+        elif self._summary != previous:
+            self._summary_tokens = self._tokenizer.count_tokens(self._summary)
 
     def add_turn(self, turn: ConversationTurn) -> None:
         """Add a pre-built conversation turn to the memory.
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import uuid
+import os
 from datetime import UTC, datetime
 from enum import StrEnum
 from typing import Any
@@ -36,6 +36,20 @@ class PipelineDiagnostics(TypedDict, total=False):
     shared_pool_usage: int
 
 
+def _new_id() -> str:
+    """Return a random RFC 4122 version-4 UUID string.
+
+    Same format and entropy source as ``str(uuid.uuid4())``, but without
+    building an intermediate ``UUID`` object, which made id generation
+    the largest single cost of constructing a ``ContextItem``.
+    """
+    raw = bytearray(os.urandom(16))
+    raw[6] = raw[6] & 0x0F | 0x40  # version 4
+    raw[8] = raw[8] & 0x3F | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
 class SourceType(StrEnum):
     """The origin type of a context item."""
 
@@ -54,7 +68,7 @@ class ContextItem(BaseModel):
     Items are immutable after creation to prevent context poisoning bugs.
     """
 
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_new_id)
     content: str
     source: SourceType
     score: float = Field(default=0.0, ge=0.0, le=1.0)
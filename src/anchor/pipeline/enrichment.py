@@ -6,10 +6,13 @@ with memory context before retrieval steps execute.
 
 from __future__ import annotations
 
+from operator import attrgetter
 from typing import Protocol, runtime_checkable
 
 from anchor.models.context import ContextItem
 
+_CREATED_AT = attrgetter("created_at")
+
 
 @runtime_checkable
 class ContextQueryEnricher(Protocol):
@@ -74,7 +77,7 @@ class MemoryContextEnricher:
             return query
 
         # Sort by created_at ascending (oldest first) and take the last N
-        sorted_items = sorted(context_items, key=lambda i: i.created_at)
+        sorted_items = sorted(context_items, key=_CREATED_AT)
         recent = sorted_items[-self._max_items :]
 
         # Build a concise context string from item contents
@@ -21,6 +21,13 @@ class Chunker(Protocol):
 
     Parameters accepted by ``chunk`` are deliberately minimal so that
     implementations stay focused on splitting logic.
+
+    Implementations may additionally provide an optional
+    ``cache_identity() -> str | None`` method.  It returns a string that
+    changes whenever the configuration would change the chunks produced
+    (including the chunker's tokenizer), or ``None`` when the
+    configuration cannot be identified.  ``DocumentIngester`` requires it
+    to use a ``chunk_cache``.
     """
 
     def chunk(self, text: str, metadata: dict[str, Any] | None = None) -> list[str]:
@@ -172,6 +172,14 @@ class MemoryDecay(Protocol):
     """Computes a retention score for a memory entry.
 
     Returns a float from 0.0 (forget) to 1.0 (perfect retention).
+
+    Implementations may additionally provide
+    ``compute_retention_batch(entries, now=None) -> list[float]`` to
+    score many entries against a single clock reading, and
+    ``decayed_indices(entries, threshold, now=None) -> list[int]`` to
+    select entries below a retention threshold without scoring each one;
+    see :func:`anchor.memory.decay.compute_retention_batch` and
+    :func:`anchor.memory.decay.decayed_indices`.
     """
 
     def compute_retention(self, entry: MemoryEntry) -> float:
@@ -273,6 +273,13 @@ class GarbageCollectableStore(Protocol):
     Extends the base ``MemoryEntryStore`` contract with
     ``list_all_unfiltered`` so that expired entries can be discovered
     and deleted by the ``MemoryGarbageCollector``.
+
+    Stores may optionally implement ``delete_many(entry_ids) -> int`` to
+    remove a whole batch in one call (as the built-in entry stores do);
+    the collector then uses it once per phase instead of calling
+    ``delete`` per entry.  Likewise, an optional ``iter_all_unfiltered()``
+    returning an iterator lets the collector stream a large store (for
+    example from a database cursor) instead of materialising it.
     """
 
     def list_all_unfiltered(self) -> list[MemoryEntry]:
@@ -11,6 +11,30 @@ class Tokenizer(Protocol):
 
     The default implementation uses tiktoken, but users can provide
     any tokenizer (e.g., HuggingFace tokenizers, sentencepiece).
+
+    Implementations may additionally provide an optional
+    ``count_tokens_batch(texts: list[str]) -> list[int]`` method.  It is
+    not part of the protocol (so existing tokenizers keep satisfying
+    ``isinstance`` checks), but
+    :func:`~anchor.tokens.counter.count_tokens_batch` uses it when present
+    to count many strings in one call.
+
+    Likewise, an optional ``cache_identity() -> str`` method returns a
+    string that identifies the tokenizer's counting behaviour (e.g. its
+    encoding).  Components that cache token counts across instances,
+    such as ``DocumentIngester(chunk_cache=...)``, require it.
+
+    Chunkers assume counts are subadditive: the count of joined texts is
+    at most the sum of their separate counts.  ``TableAwareChunker`` sums
+    per-row, per-segment and per-table counts instead of re-counting the
+    joined chunk, so a tokenizer that breaks this may see chunks exceed
+    ``chunk_size``.  BPE tokenizers satisfy it, and tokenizers that add
+    special tokens (e.g. BOS/EOS) to every count only overestimate.
+
+    No bound on tokens per byte is assumed by default.  Byte-level BPE
+    emits at most one token per UTF-8 byte, but special tokens break
+    that for short texts; chunkers only rely on such a bound when given
+    one explicitly (``TableAwareChunker(max_tokens_per_byte=...)``).
     """
 
     def count_tokens(self, text: str) -> int:
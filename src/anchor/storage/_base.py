@@ -22,6 +22,8 @@ from anchor.storage._filters import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from anchor.models.memory import MemoryEntry, MemoryType
 
 
@@ -33,16 +35,21 @@ class BaseEntryStoreMixin:
     and optionally override ``_after_mutation()`` to persist changes.
 
     The ``_after_mutation()`` hook is called after any mixin method that
-    modifies ``self._entries`` (currently ``delete_by_user``).  The default
+    modifies ``self._entries`` (currently ``delete_by_user`` and ``delete_many``).  The default
     implementation is a no-op; file-backed stores override it to flush to disk.
 
     Subclasses **must** initialise ``self._lock = threading.Lock()`` in their
-    ``__init__`` so that mixin methods can synchronise access.
+    ``__init__`` so that mixin methods can synchronise access, and
+    ``self._hash_index = None``.  They mutate ``self._entries`` only through
+    ``_put_entry``, ``_pop_entry``, and ``_reset_entries`` so that the
+    content-hash index behind ``find_by_content_hash`` stays in sync.
     """
 
     # Declared here for type-checkers; concrete classes actually create them.
     _entries: dict[str, MemoryEntry]
     _lock: threading.Lock
+    # content_hash -> ids in insertion order; None until the first lookup.
+    _hash_index: dict[str, dict[str, None]] | None
 
     # ------------------------------------------------------------------
     # Mutation hook
@@ -55,10 +62,64 @@ class BaseEntryStoreMixin:
         The default implementation does nothing.
         """
 
+    # ------------------------------------------------------------------
+    # Entry bookkeeping (caller must hold the lock)
+    # ------------------------------------------------------------------
+
+    def _put_entry(self, entry: MemoryEntry) -> None:
+        """Insert or overwrite *entry*, keeping the hash index in sync."""
+        index = self._hash_index
+        if index is not None:
+            previous = self._entries.get(entry.id)
+            if previous is not None:
+                self._unindex(index, previous)
+            index.setdefault(entry.content_hash, {})[entry.id] = None
+        self._entries[entry.id] = entry
+
+    def _pop_entry(self, entry_id: str) -> MemoryEntry | None:
+        """Remove and return the entry with *entry_id*, if present."""
+        entry = self._entries.pop(entry_id, None)
+        if entry is not None and self._hash_index is not None:
+            self._unindex(self._hash_index, entry)
+        return entry
+
+    def _reset_entries(self) -> None:
+        """Remove every entry and drop the hash index."""
+        self._entries.clear()
+        self._hash_index = None
+
+    @staticmethod
+    def _unindex(index: dict[str, dict[str, None]], entry: MemoryEntry) -> None:
+        ids = index.get(entry.content_hash)
+        if ids is not None:
+            ids.pop(entry.id, None)
+            if not ids:
+                del index[entry.content_hash]
+
     # ------------------------------------------------------------------
     # Read / query methods
     # ------------------------------------------------------------------
 
+    def find_by_content_hash(self, content_hash: str) -> MemoryEntry | None:
+        """Return a non-expired entry with *content_hash*, or ``None``.
+
+        The hash index is built on the first call and then maintained by
+        every mutation, so repeated lookups (e.g. deduplicating facts on
+        insert) cost O(1) instead of a scan over all entries.
+        """
+        with self._lock:
+            index = self._hash_index
+            if index is None:
+                index = {}
+                for entry in self._entries.values():
+                    index.setdefault(entry.content_hash, {})[entry.id] = None
+                self._hash_index = index
+            for eid in index.get(content_hash, ()):
+                entry = self._entries[eid]
+                if not entry.is_expired:
+                    return entry
+            return None
+
     def search(self, query: str, top_k: int = 5) -> list[MemoryEntry]:
         """Search entries by substring match, excluding expired entries.
 
@@ -126,6 +187,21 @@ class BaseEntryStoreMixin:
     # Mutation methods delegated from concrete stores
     # ------------------------------------------------------------------
 
+    def delete_many(self, entry_ids: Iterable[str]) -> int:
+        """Delete several entries by id. Returns count deleted.
+
+        The mutation hook fires once for the whole batch rather than once
+        per entry, so file-backed stores persist a single time.
+        """
+        with self._lock:
+            removed = 0
+            for eid in entry_ids:
+                if self._pop_entry(eid) is not None:
+                    removed += 1
+            if removed:
+                self._after_mutation()
+            return removed
+
     def delete_by_user(self, user_id: str) -> int:
         """Delete all entries belonging to a user. Returns count deleted."""
         with self._lock:
@@ -134,7 +210,7 @@ class BaseEntryStoreMixin:
                 if entry.user_id == user_id
             ]
             for eid in to_delete:
-                del self._entries[eid]
+                self._pop_entry(eid)
             if to_delete:
                 self._after_mutation()
             return len(to_delete)
@@ -37,11 +37,12 @@ class JsonFileMemoryStore(BaseEntryStoreMixin):
         entries = store.search("hello")
     """
 
-    __slots__ = ("_auto_save", "_dirty", "_entries", "_file_path", "_lock")
+    __slots__ = ("_auto_save", "_dirty", "_entries", "_file_path", "_hash_index", "_lock")
 
     def __init__(self, file_path: str | Path, *, auto_save: bool = True) -> None:
         self._file_path = Path(file_path).resolve()
         self._entries: dict[str, MemoryEntry] = {}
+        self._hash_index = None
         self._dirty: bool = False
         self._auto_save: bool = auto_save
         self._lock = threading.Lock()
@@ -49,7 +50,7 @@ class JsonFileMemoryStore(BaseEntryStoreMixin):
             self.load()
 
     # ------------------------------------------------------------------
-    # Mutation hook (called by BaseEntryStoreMixin.delete_by_user)
+    # Mutation hook (called by BaseEntryStoreMixin.delete_by_user/delete_many)
     # ------------------------------------------------------------------
 
     def _after_mutation(self) -> None:
@@ -65,7 +66,7 @@ class JsonFileMemoryStore(BaseEntryStoreMixin):
     def add(self, entry: MemoryEntry) -> None:
         """Add or overwrite a memory entry and optionally persist to disk."""
         with self._lock:
-            self._entries[entry.id] = entry
+            self._put_entry(entry)
             self._dirty = True
             if self._auto_save:
                 self._maybe_save()
@@ -73,7 +74,7 @@ class JsonFileMemoryStore(BaseEntryStoreMixin):
     def delete(self, entry_id: str) -> bool:
         """Delete an entry by id, persist to disk. Returns True if found."""
         with self._lock:
-            removed = self._entries.pop(entry_id, None) is not None
+            removed = self._pop_entry(entry_id) is not None
             if removed:
                 self._dirty = True
                 if self._auto_save:
@@ -83,7 +84,7 @@ class JsonFileMemoryStore(BaseEntryStoreMixin):
     def clear(self) -> None:
         """Remove all entries and persist the empty state to disk."""
         with self._lock:
-            self._entries.clear()
+            self._reset_entries()
             self._dirty = True
             if self._auto_save:
                 self._maybe_save()
@@ -141,13 +142,13 @@ class JsonFileMemoryStore(BaseEntryStoreMixin):
     def _load_unlocked(self) -> None:
         """Load entries from disk without acquiring the lock (caller must hold it)."""
         if not self._file_path.exists():
-            self._entries.clear()
+            self._reset_entries()
             self._dirty = False
             return
 
         text = self._file_path.read_text(encoding="utf-8")
         if not text.strip():
-            self._entries.clear()
+            self._reset_entries()
             self._dirty = False
             return
 
@@ -157,7 +158,7 @@ class JsonFileMemoryStore(BaseEntryStoreMixin):
             msg = f"Failed to load memory store from {self._file_path}: invalid JSON"
             raise StorageError(msg) from e
 
-        self._entries.clear()
+        self._reset_entries()
         for raw in raw_list:
             try:
                 entry = MemoryEntry.model_validate(raw)
@@ -168,7 +169,7 @@ class JsonFileMemoryStore(BaseEntryStoreMixin):
                     raw.get("id", "<unknown>"),
                 )
                 continue
-            self._entries[entry.id] = entry
+            self._put_entry(entry)
         self._dirty = False
 
     # ------------------------------------------------------------------
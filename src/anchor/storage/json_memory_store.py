@@ -18,10 +18,11 @@ class InMemoryEntryStore(BaseEntryStoreMixin):
     For persistence across sessions, use ``JsonFileMemoryStore``.
     """
 
-    __slots__ = ("_entries", "_lock")
+    __slots__ = ("_entries", "_hash_index", "_lock")
 
     def __init__(self) -> None:
         self._entries: dict[str, MemoryEntry] = {}
+        self._hash_index = None
         self._lock = threading.Lock()
 
     # ------------------------------------------------------------------
@@ -31,17 +32,17 @@ class InMemoryEntryStore(BaseEntryStoreMixin):
     def add(self, entry: MemoryEntry) -> None:
         """Add or overwrite a memory entry."""
         with self._lock:
-            self._entries[entry.id] = entry
+            self._put_entry(entry)
 
     def delete(self, entry_id: str) -> bool:
         """Delete an entry by id. Returns True if found and deleted."""
         with self._lock:
-            return self._entries.pop(entry_id, None) is not None
+            return self._pop_entry(entry_id) is not None
 
     def clear(self) -> None:
         """Remove all entries."""
         with self._lock:
-            self._entries.clear()
+            self._reset_entries()
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}(entries={len(self._entries)})"
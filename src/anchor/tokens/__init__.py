@@ -1,5 +1,5 @@
 """Token counting utilities."""
 
-from .counter import TiktokenCounter, get_default_counter
+from .counter import TiktokenCounter, count_tokens_batch, get_default_counter
 
-__all__ = ["TiktokenCounter", "get_default_counter"]
+__all__ = ["TiktokenCounter", "count_tokens_batch", "get_default_counter"]
@@ -4,6 +4,14 @@ from __future__ import annotations
 
 import functools
 
+from anchor.protocols.tokenizer import Tokenizer
+
+# tiktoken's ``encode_batch`` starts a fresh thread pool on every call
+# (~70 us) and still encodes one string per task, so misses only go through
+# it when there are enough of them, with enough text, to run in parallel.
+_BATCH_MIN_TEXTS = 8
+_BATCH_MIN_CHARS = 256 * 1024
+
 
 class TiktokenCounter:
     """Token counter using OpenAI's tiktoken library.
@@ -49,6 +57,48 @@ class TiktokenCounter:
             self._cache[text] = count
         return count
 
+    def count_tokens_batch(self, texts: list[str]) -> list[int]:
+        """Count tokens for many strings, serving repeats from the cache.
+
+        Cache hits are served from the per-instance cache.  The remaining
+        strings are encoded one by one; only a large batch (at least
+        ``_BATCH_MIN_TEXTS`` strings and ``_BATCH_MIN_CHARS`` characters)
+        goes through tiktoken's threaded ``encode_batch``, whose per-call
+        pool start-up would dominate a small one.
+        """
+        cache = self._cache
+        counts: list[int] = [0] * len(texts)
+        misses: list[int] = []
+        for i, text in enumerate(texts):
+            cached = cache.get(text)
+            if cached is None:
+                misses.append(i)
+            else:
+                counts[i] = cached
+        if not misses:
+            return counts
+
+        missed = [texts[i] for i in misses]
+        encoded: list[list[int]]
+        if len(missed) >= _BATCH_MIN_TEXTS and sum(map(len, missed)) >= _BATCH_MIN_CHARS:
+            encoded = self._encoding.encode_batch(missed)
+        else:
+            encode = self._encoding.encode
+            encoded = [encode(text) for text in missed]
+        for i, tokens in zip(misses, encoded, strict=True):
+            text = texts[i]
+            count = len(tokens)
+            counts[i] = count
+            if len(text) < 10_000:
+                if len(cache) >= self._max_cache_size:
+                    cache.clear()
+                cache[text] = count
+        return counts
+
+    def cache_identity(self) -> str:
+        """Identify this tokenizer's counting behaviour for result caches."""
+        return f"tiktoken:{self._encoding.name}"
+
     def truncate_to_tokens(self, text: str, max_tokens: int) -> str:
         """Truncate text to fit within a token limit."""
         tokens = self._encoding.encode(text)
@@ -82,3 +132,26 @@ def get_default_counter() -> TiktokenCounter:
             "or pip install tiktoken"
         )
         raise ImportError(msg) from None
+
+
+def count_tokens_batch(tokenizer: Tokenizer, texts: list[str]) -> list[int]:
+    """Count tokens for each string, batching when the tokenizer supports it.
+
+    Tokenizers may optionally implement ``count_tokens_batch(texts)``
+    (as :class:`TiktokenCounter` does) to amortise per-call overhead.
+    Tokenizers without it fall back to one ``count_tokens`` call per
+    string.
+
+    Parameters:
+        tokenizer: Any :class:`~anchor.protocols.tokenizer.Tokenizer`.
+        texts: The strings to count.
+
+    Returns:
+        Token counts in the same order as ``texts``.
+    """
+    batch = getattr(tokenizer, "count_tokens_batch", None)
+    if batch is not None:
+        result: list[int] = batch(texts)
+        return result
+    count_tokens = tokenizer.count_tokens
+    return [count_tokens(text) for text in texts]
@@ -42,6 +42,10 @@ class FakeTokenizer:
             return 0
         return len(text.split())
 
+    def cache_identity(self) -> str:
+        """Identify this tokenizer for chunk caches."""
+        return "fake-whitespace"
+
     def truncate_to_tokens(self, text: str, max_tokens: int) -> str:
         """Truncate text to fit within a token limit."""
         if max_tokens <= 0:
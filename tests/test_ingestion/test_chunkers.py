@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import types
+from unittest.mock import patch
+
 import pytest
 
 from anchor.ingestion.chunkers import (
     FixedSizeChunker,
     RecursiveCharacterChunker,
     SentenceChunker,
+    encode_chunks,
 )
 from anchor.protocols.ingestion import Chunker
 from tests.conftest import FakeTokenizer
@@ -69,6 +73,39 @@ class TestFixedSizeChunker:
         chunks = fixed_chunker.chunk("hello world", metadata={"lang": "en"})
         assert len(chunks) == 1
 
+    def test_max_tokens_per_word_skips_tokenizer(self) -> None:
+        """Candidates within the word budget are accepted without counting."""
+        calls: list[str] = []
+
+        class CountingTokenizer(FakeTokenizer):
+            def count_tokens(self, text: str) -> int:
+                calls.append(text)
+                return super().count_tokens(text)
+
+        text = " ".join(f"w{i}" for i in range(40))
+        plain = FixedSizeChunker(chunk_size=10, overlap=0, tokenizer=CountingTokenizer())
+        expected = plain.chunk(text)
+        baseline_calls = len(calls)
+
+        calls.clear()
+        fast = FixedSizeChunker(
+            chunk_size=10, overlap=0, tokenizer=CountingTokenizer(), max_tokens_per_word=2
+        )
+        assert fast.chunk(text) == expected
+        assert len(calls) < baseline_calls
+
+    def test_chunk_iter_matches_chunk(self, fake_tokenizer: FakeTokenizer) -> None:
+        chunker = FixedSizeChunker(chunk_size=5, overlap=2, tokenizer=fake_tokenizer)
+        text = " ".join(f"w{i}" for i in range(23))
+        stream = chunker.chunk_iter(text)
+        assert not isinstance(stream, list)
+        assert list(stream) == chunker.chunk(text)
+        assert list(chunker.chunk_iter("  ")) == []
+
+    def test_invalid_max_tokens_per_word(self, fake_tokenizer: FakeTokenizer) -> None:
+        with pytest.raises(ValueError, match="max_tokens_per_word must be positive"):
+            FixedSizeChunker(tokenizer=fake_tokenizer, max_tokens_per_word=0)
+
 
 class TestRecursiveCharacterChunker:
     """Tests for RecursiveCharacterChunker."""
@@ -156,3 +193,56 @@ class TestSentenceChunker:
 
     def test_repr(self, sentence_chunker: SentenceChunker) -> None:
         assert "SentenceChunker" in repr(sentence_chunker)
+
+    def test_max_tokens_per_word_preserves_output(
+        self, fake_tokenizer: FakeTokenizer
+    ) -> None:
+        text = "One two three. Four five six. Seven eight nine. Ten eleven twelve."
+        plain = SentenceChunker(chunk_size=7, overlap=0, tokenizer=fake_tokenizer)
+        fast = SentenceChunker(
+            chunk_size=7, overlap=0, tokenizer=fake_tokenizer, max_tokens_per_word=1
+        )
+        assert fast.chunk(text) == plain.chunk(text)
+
+    def test_chunk_iter_matches_chunk(self, fake_tokenizer: FakeTokenizer) -> None:
+        chunker = SentenceChunker(chunk_size=5, overlap=1, tokenizer=fake_tokenizer)
+        text = "One two three. Four five six. Seven eight nine. Ten."
+        assert list(chunker.chunk_iter(text)) == chunker.chunk(text)
+
+    def test_blingfire_splitter_used(self, fake_tokenizer: FakeTokenizer) -> None:
+        fake_blingfire = types.SimpleNamespace(
+            text_to_sentences=lambda text: "One two three.\nFour five six.\n"
+        )
+        with patch.dict("sys.modules", {"blingfire": fake_blingfire}):
+            chunker = SentenceChunker(
+                chunk_size=3, overlap=0, tokenizer=fake_tokenizer, use_blingfire=True
+            )
+        chunks = chunker.chunk("ignored by the fake splitter")
+        assert chunks == ["One two three.", "Four five six."]
+
+    def test_blingfire_missing_raises(self, fake_tokenizer: FakeTokenizer) -> None:
+        with (
+            patch.dict("sys.modules", {"blingfire": None}),
+            pytest.raises(ImportError, match="blingfire"),
+        ):
+            SentenceChunker(tokenizer=fake_tokenizer, use_blingfire=True)
+
+
+class TestEncodeChunks:
+    """Tests for encode_chunks."""
+
+    def test_empty(self) -> None:
+        assert encode_chunks([]) == []
+
+    def test_views_match_per_chunk_encoding(self) -> None:
+        chunks = ["hello world", "caf\u00e9 na\u00efve", "", "\u6f22\u5b57 ok"]
+        spans = encode_chunks(chunks)
+        assert len(spans) == len(chunks)
+        for chunk, (start, end, view) in zip(chunks, spans, strict=True):
+            assert bytes(view) == chunk.encode("utf-8")
+            assert end - start == len(view)
+
+    def test_views_share_one_buffer(self) -> None:
+        spans = encode_chunks(["ab", "cd"])
+        assert spans[0][2].obj is spans[1][2].obj
+        assert [(s, e) for s, e, _ in spans] == [(0, 2), (2, 4)]
@@ -63,6 +63,54 @@ class TestParentChildChunker:
             assert meta["is_child_chunk"] is True
             assert meta["parent_id"].startswith("parent-")
 
+    def test_out_of_line_parent_text(self, fake_tokenizer: FakeTokenizer) -> None:
+        chunker = ParentChildChunker(
+            parent_chunk_size=10,
+            child_chunk_size=3,
+            parent_overlap=0,
+            child_overlap=0,
+            tokenizer=fake_tokenizer,
+            inline_parent_text=False,
+        )
+        text = " ".join(f"w{i}" for i in range(25))
+        pairs = chunker.chunk_with_metadata(text)
+        assert pairs
+        for child_text, meta in pairs:
+            assert "parent_text" not in meta
+            parent_text = chunker.get_parent_text(meta["parent_id"])
+            assert parent_text is not None
+            assert child_text in parent_text
+        assert chunker.get_parent_text("parent-unknown") is None
+
+    def test_out_of_line_parent_ids_unique_across_documents(
+        self, fake_tokenizer: FakeTokenizer,
+    ) -> None:
+        chunker = ParentChildChunker(
+            parent_chunk_size=10,
+            child_chunk_size=3,
+            parent_overlap=0,
+            child_overlap=0,
+            tokenizer=fake_tokenizer,
+            inline_parent_text=False,
+        )
+        first = chunker.chunk_with_metadata("alpha beta gamma")
+        second = chunker.chunk_with_metadata("delta epsilon zeta")
+        assert first[0][1]["parent_id"] != second[0][1]["parent_id"]
+        assert chunker.get_parent_text(first[0][1]["parent_id"]) == "alpha beta gamma"
+
+    def test_clear_parent_texts(self, fake_tokenizer: FakeTokenizer) -> None:
+        chunker = ParentChildChunker(
+            parent_chunk_size=10,
+            child_chunk_size=3,
+            parent_overlap=0,
+            child_overlap=0,
+            tokenizer=fake_tokenizer,
+            inline_parent_text=False,
+        )
+        parent_id = chunker.chunk_with_metadata("alpha beta gamma")[0][1]["parent_id"]
+        chunker.clear_parent_texts()
+        assert chunker.get_parent_text(parent_id) is None
+
     def test_chunk_returns_strings_only(
         self, parent_child_chunker: ParentChildChunker,
     ) -> None:
@@ -133,6 +181,22 @@ class TestParentChildChunker:
             assert meta["source"] == "test_doc"
             assert meta["lang"] == "en"
 
+    def test_child_metadata_dicts_are_independent(
+        self, fake_tokenizer: FakeTokenizer
+    ) -> None:
+        chunker = ParentChildChunker(
+            parent_chunk_size=20,
+            child_chunk_size=5,
+            parent_overlap=0,
+            child_overlap=0,
+            tokenizer=fake_tokenizer,
+        )
+        text = " ".join(f"w{i}" for i in range(15))
+        pairs = chunker.chunk_with_metadata(text, {"lang": "en"})
+        assert [meta["child_index"] for _, meta in pairs] == list(range(len(pairs)))
+        pairs[0][1]["lang"] = "fr"
+        assert all(meta["lang"] == "en" for _, meta in pairs[1:])
+
 
 class TestParentExpander:
     """Tests for ParentExpander."""
@@ -242,6 +306,98 @@ class TestParentExpander:
         assert result[0].content == "full parent text"
         assert result[0].metadata["original_child_content"] == "child text"
 
+    def test_parent_lookup_mapping(self) -> None:
+        expander = ParentExpander(parent_lookup={"parent-x": "looked up parent"})
+        item = ContextItem(
+            content="child text",
+            source=SourceType.RETRIEVAL,
+            metadata={"is_child_chunk": True, "parent_id": "parent-x"},
+        )
+        result = expander.process([item])
+        assert result[0].content == "looked up parent"
+
+    def test_parent_lookup_falls_back_to_metadata(self) -> None:
+        expander = ParentExpander(parent_lookup=lambda _pid: None)
+        item = ContextItem(
+            content="child text",
+            source=SourceType.RETRIEVAL,
+            metadata={
+                "is_child_chunk": True,
+                "parent_id": "parent-0",
+                "parent_text": "inline parent",
+            },
+        )
+        result = expander.process([item])
+        assert result[0].content == "inline parent"
+
+    def test_parent_lookup_memoized_across_calls(self) -> None:
+        calls: list[str] = []
+
+        def lookup(parent_id: str) -> str:
+            calls.append(parent_id)
+            return f"text of {parent_id}"
+
+        expander = ParentExpander(parent_lookup=lookup, max_cache_size=1)
+        item = ContextItem(
+            content="child",
+            source=SourceType.RETRIEVAL,
+            metadata={"is_child_chunk": True, "parent_id": "p1"},
+        )
+        other = ContextItem(
+            content="child",
+            source=SourceType.RETRIEVAL,
+            metadata={"is_child_chunk": True, "parent_id": "p2"},
+        )
+        expander.process([item])
+        expander.process([item])
+        assert calls == ["p1"]
+
+        expander.process([other])  # evicts p1 (max_cache_size=1)
+        expander.process([item])
+        assert calls == ["p1", "p2", "p1"]
+
+        expander.clear_cache()
+        expander.process([item])
+        assert calls == ["p1", "p2", "p1", "p1"]
+
+    def test_expanded_item_keeps_item_fields(self, parent_expander: ParentExpander) -> None:
+        item = ContextItem(
+            id="child-1",
+            content="child text",
+            source=SourceType.RETRIEVAL,
+            score=0.7,
+            priority=8,
+            token_count=3,
+            metadata={"is_child_chunk": True, "parent_id": "p", "parent_text": "parent"},
+        )
+        (expanded,) = parent_expander.process([item])
+        assert (expanded.id, expanded.score, expanded.priority, expanded.token_count) == (
+            "child-1",
+            0.7,
+            8,
+            3,
+        )
+        assert expanded.content == "parent"
+        assert item.metadata is not expanded.metadata
+
+    def test_round_trip_with_chunker_lookup(self, fake_tokenizer: FakeTokenizer) -> None:
+        chunker = ParentChildChunker(
+            parent_chunk_size=10,
+            child_chunk_size=3,
+            parent_overlap=0,
+            child_overlap=0,
+            tokenizer=fake_tokenizer,
+            inline_parent_text=False,
+        )
+        text = " ".join(f"w{i}" for i in range(12))
+        items = [
+            ContextItem(content=child, source=SourceType.RETRIEVAL, metadata=meta)
+            for child, meta in chunker.chunk_with_metadata(text)
+        ]
+        expander = ParentExpander(parent_lookup=chunker.get_parent_text)
+        result = expander.process(items)
+        assert [item.content for item in result] == chunker._parent_chunker.chunk(text)
+
     def test_empty_input(self, parent_expander: ParentExpander) -> None:
         result = parent_expander.process([])
         assert result == []
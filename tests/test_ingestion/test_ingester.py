@@ -7,9 +7,15 @@ from typing import Any
 
 import pytest
 
-from anchor.ingestion.chunkers import FixedSizeChunker
+from anchor.ingestion.chunkers import (
+    FixedSizeChunker,
+    RecursiveCharacterChunker,
+    SemanticChunker,
+)
+from anchor.ingestion.hierarchical import ParentChildChunker
 from anchor.ingestion.ingester import DocumentIngester
 from anchor.ingestion.metadata import MetadataEnricher, generate_doc_id
+from anchor.ingestion.parsers import PlainTextParser
 from anchor.models.context import ContextItem, SourceType
 from tests.conftest import FakeTokenizer
 
@@ -43,6 +49,20 @@ class TestIngestText:
         items = ingester.ingest_text("hello world", doc_id="my-doc")
         assert items[0].id == "my-doc-chunk-0"
 
+    def test_sample_doc_ids(self, fake_tokenizer: FakeTokenizer) -> None:
+        from anchor.ingestion.metadata import DOC_ID_SAMPLE_THRESHOLD
+
+        text = "word " * DOC_ID_SAMPLE_THRESHOLD
+        chunker = FixedSizeChunker(chunk_size=1000, overlap=0, tokenizer=fake_tokenizer)
+        full = DocumentIngester(chunker=chunker, tokenizer=fake_tokenizer)
+        sampled = DocumentIngester(
+            chunker=chunker, tokenizer=fake_tokenizer, sample_doc_ids=True
+        )
+        assert full.ingest_text(text)[0].metadata["parent_doc_id"] == generate_doc_id(text)
+        assert sampled.ingest_text(text)[0].metadata["parent_doc_id"] == generate_doc_id(
+            text, sample=True
+        )
+
     def test_source_type(self, ingester: DocumentIngester) -> None:
         items = ingester.ingest_text("hello world")
         assert all(item.source == SourceType.RETRIEVAL for item in items)
@@ -60,6 +80,12 @@ class TestIngestText:
         for item in items:
             assert item.token_count > 0
 
+    def test_token_counts_per_chunk(self, fake_tokenizer: FakeTokenizer) -> None:
+        chunker = FixedSizeChunker(chunk_size=3, overlap=0, tokenizer=fake_tokenizer)
+        ingester = DocumentIngester(chunker=chunker, tokenizer=fake_tokenizer)
+        items = ingester.ingest_text("one two three four five six seven")
+        assert [item.token_count for item in items] == [3, 3, 1]
+
     def test_chunk_metadata_fields(self, ingester: DocumentIngester) -> None:
         items = ingester.ingest_text("hello world")
         meta = items[0].metadata
@@ -183,6 +209,38 @@ class TestIngestDirectory:
         contents = " ".join(item.content for item in items)
         assert "Text file" in contents
 
+    def test_extension_filter_is_case_insensitive(
+        self, tmp_path: Path, fake_tokenizer: FakeTokenizer
+    ) -> None:
+        (tmp_path / "upper.TXT").write_text("Upper case suffix", encoding="utf-8")
+        (tmp_path / "b.md").write_text("Markdown file", encoding="utf-8")
+
+        chunker = FixedSizeChunker(chunk_size=50, overlap=0, tokenizer=fake_tokenizer)
+        ingester = DocumentIngester(chunker=chunker, tokenizer=fake_tokenizer)
+        items = ingester.ingest_directory(tmp_path, extensions=[".Txt"])
+        assert [item.content for item in items] == ["Upper case suffix"]
+
+    def test_iter_ingest_directory_streams(
+        self, tmp_path: Path, fake_tokenizer: FakeTokenizer
+    ) -> None:
+        for name in ("a.txt", "b.txt"):
+            (tmp_path / name).write_text(f"content of {name}", encoding="utf-8")
+
+        chunker = FixedSizeChunker(chunk_size=50, overlap=0, tokenizer=fake_tokenizer)
+        ingester = DocumentIngester(chunker=chunker, tokenizer=fake_tokenizer)
+        stream = ingester.iter_ingest_directory(tmp_path, deterministic=True)
+        assert not isinstance(stream, list)
+        assert next(stream).content == "content of a.txt"
+        assert [item.content for item in stream] == ["content of b.txt"]
+
+    def test_iter_ingest_directory_checks_directory_eagerly(
+        self, ingester: DocumentIngester
+    ) -> None:
+        from anchor.exceptions import IngestionError
+
+        with pytest.raises(IngestionError, match="Directory not found"):
+            ingester.iter_ingest_directory(Path("/nonexistent/dir"))
+
     def test_directory_not_found(self, ingester: DocumentIngester) -> None:
         from anchor.exceptions import IngestionError
 
@@ -202,6 +260,240 @@ class TestIngestDirectory:
         contents = " ".join(item.content for item in items)
         assert "Nested content" in contents
 
+    def test_deterministic_order(
+        self, tmp_path: Path, fake_tokenizer: FakeTokenizer
+    ) -> None:
+        for name in ("c.txt", "a.txt", "b.md"):
+            (tmp_path / name).write_text(f"content of {name}", encoding="utf-8")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "d.txt").write_text("content of d.txt", encoding="utf-8")
+
+        chunker = FixedSizeChunker(chunk_size=50, overlap=0, tokenizer=fake_tokenizer)
+        ingester = DocumentIngester(chunker=chunker, tokenizer=fake_tokenizer)
+        items = ingester.ingest_directory(tmp_path, deterministic=True)
+        assert [item.content for item in items] == [
+            "content of a.txt",
+            "content of b.md",
+            "content of c.txt",
+            "content of d.txt",
+        ]
+
+    def test_matches_per_file_ingestion(
+        self, tmp_path: Path, fake_tokenizer: FakeTokenizer
+    ) -> None:
+        for i in range(3):
+            (tmp_path / f"doc{i}.txt").write_text(
+                " ".join(f"w{i}-{j}" for j in range(25)), encoding="utf-8"
+            )
+        (tmp_path / "blank.txt").write_text("   ", encoding="utf-8")
+
+        chunker = FixedSizeChunker(chunk_size=10, overlap=0, tokenizer=fake_tokenizer)
+        ingester = DocumentIngester(chunker=chunker, tokenizer=fake_tokenizer)
+        expected = [
+            (item.id, item.content, item.metadata)
+            for path in sorted(tmp_path.iterdir())
+            for item in ingester.ingest_file(path)
+        ]
+        actual = ingester.ingest_directory(tmp_path, deterministic=True)
+        assert [(item.id, item.content, item.metadata) for item in actual] == expected
+
+    def test_custom_glob_pattern(
+        self, tmp_path: Path, fake_tokenizer: FakeTokenizer
+    ) -> None:
+        (tmp_path / "top.txt").write_text("Top level", encoding="utf-8")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "nested.txt").write_text("Nested", encoding="utf-8")
+
+        chunker = FixedSizeChunker(chunk_size=50, overlap=0, tokenizer=fake_tokenizer)
+        ingester = DocumentIngester(chunker=chunker, tokenizer=fake_tokenizer)
+        items = ingester.ingest_directory(tmp_path, glob_pattern="*")
+        assert [item.content for item in items] == ["Top level"]
+
+    def test_process_pool_matches_serial(
+        self, tmp_path: Path, fake_tokenizer: FakeTokenizer
+    ) -> None:
+        for i in range(6):
+            (tmp_path / f"doc{i}.txt").write_text(
+                " ".join(f"w{i}-{j}" for j in range(30)), encoding="utf-8"
+            )
+        (tmp_path / "empty.md").write_text("", encoding="utf-8")
+
+        chunker = FixedSizeChunker(chunk_size=10, overlap=0, tokenizer=fake_tokenizer)
+        serial = DocumentIngester(chunker=chunker, tokenizer=fake_tokenizer)
+        parallel = DocumentIngester(chunker=chunker, tokenizer=fake_tokenizer, max_workers=2)
+        expected = serial.ingest_directory(tmp_path)
+        actual = parallel.ingest_directory(tmp_path)
+        assert [(i.id, i.content) for i in actual] == [(i.id, i.content) for i in expected]
+
+    def test_invalid_max_workers(self, fake_tokenizer: FakeTokenizer) -> None:
+        with pytest.raises(ValueError, match="max_workers must be positive"):
+            DocumentIngester(tokenizer=fake_tokenizer, max_workers=0)
+
+    def test_process_pool_refuses_stored_parent_texts(
+        self, fake_tokenizer: FakeTokenizer
+    ) -> None:
+        chunker = ParentChildChunker(tokenizer=fake_tokenizer, inline_parent_text=False)
+        with pytest.raises(ValueError, match="inline_parent_text"):
+            DocumentIngester(chunker=chunker, tokenizer=fake_tokenizer, max_workers=2)
+        # Inline parents and serial ingestion are unaffected
+        DocumentIngester(
+            chunker=ParentChildChunker(tokenizer=fake_tokenizer),
+            tokenizer=fake_tokenizer,
+            max_workers=2,
+        )
+        DocumentIngester(chunker=chunker, tokenizer=fake_tokenizer, max_workers=1)
+
+
+class TestParserRegistry:
+    """Tests for the default parser map sharing."""
+
+    def test_default_parsers_shared_between_ingesters(
+        self, ingester: DocumentIngester, fake_tokenizer: FakeTokenizer
+    ) -> None:
+        other = DocumentIngester(
+            chunker=FixedSizeChunker(tokenizer=fake_tokenizer), tokenizer=fake_tokenizer
+        )
+        assert other._parsers is ingester._parsers
+        with pytest.raises(TypeError):
+            ingester._parsers[".log"] = PlainTextParser()  # type: ignore[index]
+
+    def test_overrides_do_not_leak_into_defaults(
+        self, ingester: DocumentIngester, fake_tokenizer: FakeTokenizer
+    ) -> None:
+        custom = DocumentIngester(
+            chunker=FixedSizeChunker(tokenizer=fake_tokenizer),
+            tokenizer=fake_tokenizer,
+            parsers={".log": PlainTextParser()},
+        )
+        assert ".log" in custom._parsers
+        assert ".txt" in custom._parsers
+        assert ".log" not in ingester._parsers
+
+    def test_pickle_round_trip_keeps_shared_defaults(
+        self, ingester: DocumentIngester
+    ) -> None:
+        import pickle
+
+        clone = pickle.loads(pickle.dumps(ingester))  # noqa: S301
+        assert clone._parsers is ingester._parsers
+
+
+class _CountingChunker(FixedSizeChunker):
+    calls = 0
+
+    def chunk(self, text: str, metadata: dict[str, Any] | None = None) -> list[str]:
+        type(self).calls += 1
+        return super().chunk(text, metadata)
+
+
+class TestChunkCache:
+    """Tests for the optional chunk cache."""
+
+    def test_cache_skips_rechunking(self, fake_tokenizer: FakeTokenizer) -> None:
+        from anchor.cache import InMemoryCacheBackend
+
+        _CountingChunker.calls = 0
+        chunker = _CountingChunker(chunk_size=5, overlap=0, tokenizer=fake_tokenizer)
+        ingester = DocumentIngester(
+            chunker=chunker,
+            tokenizer=fake_tokenizer,
+            chunk_cache=InMemoryCacheBackend(default_ttl=None),
+        )
+        text = " ".join(f"word{i}" for i in range(12))
+
+        first = ingester.ingest_text(text, doc_id="a")
+        second = ingester.ingest_text(text, doc_id="b")
+        assert _CountingChunker.calls == 1
+        assert [(i.content, i.token_count) for i in first] == [
+            (i.content, i.token_count) for i in second
+        ]
+        assert second[0].id.startswith("b-")
+
+        ingester.ingest_text(text + " extra", doc_id="a")
+        assert _CountingChunker.calls == 2
+
+    def test_cache_key_depends_on_chunker_config(self, fake_tokenizer: FakeTokenizer) -> None:
+        from anchor.cache import InMemoryCacheBackend
+
+        cache = InMemoryCacheBackend(default_ttl=None)
+        text = " ".join(f"word{i}" for i in range(12))
+        small = DocumentIngester(
+            chunker=FixedSizeChunker(chunk_size=4, overlap=0, tokenizer=fake_tokenizer),
+            tokenizer=fake_tokenizer,
+            chunk_cache=cache,
+        )
+        large = DocumentIngester(
+            chunker=FixedSizeChunker(chunk_size=8, overlap=0, tokenizer=fake_tokenizer),
+            tokenizer=fake_tokenizer,
+            chunk_cache=cache,
+        )
+        assert len(small.ingest_text(text)) != len(large.ingest_text(text))
+
+    def test_cache_key_covers_config_missing_from_repr(
+        self, fake_tokenizer: FakeTokenizer
+    ) -> None:
+        from anchor.cache import InMemoryCacheBackend
+
+        cache = InMemoryCacheBackend(default_ttl=None)
+        text = "a b c d e f g h|i j"
+        chunkers = [
+            RecursiveCharacterChunker(
+                chunk_size=4, overlap=0, separators=("|",), tokenizer=fake_tokenizer
+            ),
+            RecursiveCharacterChunker(chunk_size=4, overlap=0, tokenizer=fake_tokenizer),
+        ]
+        assert repr(chunkers[0]) == repr(chunkers[1])
+        for chunker in chunkers:
+            cached = DocumentIngester(
+                chunker=chunker, tokenizer=fake_tokenizer, chunk_cache=cache
+            ).ingest_text(text)
+            uncached = DocumentIngester(chunker=chunker, tokenizer=fake_tokenizer).ingest_text(
+                text
+            )
+            assert [i.content for i in cached] == [i.content for i in uncached]
+
+    def test_cache_refused_without_cache_identity(self, fake_tokenizer: FakeTokenizer) -> None:
+        from anchor.cache import InMemoryCacheBackend
+
+        class PlainTokenizer:
+            def count_tokens(self, text: str) -> int:
+                return len(text.split())
+
+            def truncate_to_tokens(self, text: str, max_tokens: int) -> str:
+                return " ".join(text.split()[:max_tokens])
+
+        cache = InMemoryCacheBackend(default_ttl=None)
+        with pytest.raises(ValueError, match="cache_identity"):
+            DocumentIngester(
+                chunker=FixedSizeChunker(chunk_size=4, overlap=0, tokenizer=PlainTokenizer()),
+                tokenizer=fake_tokenizer,
+                chunk_cache=cache,
+            )
+        with pytest.raises(ValueError, match="cache_identity"):
+            DocumentIngester(
+                chunker=SemanticChunker(
+                    embed_fn=lambda texts: [[1.0] for _ in texts], tokenizer=fake_tokenizer
+                ),
+                tokenizer=fake_tokenizer,
+                chunk_cache=cache,
+            )
+        # Never-cached chunkers are accepted as before
+        DocumentIngester(
+            chunker=ParentChildChunker(tokenizer=fake_tokenizer),
+            tokenizer=fake_tokenizer,
+            chunk_cache=cache,
+        )
+
+    def test_cache_refused_with_process_pool(self, fake_tokenizer: FakeTokenizer) -> None:
+        from anchor.cache import InMemoryCacheBackend
+
+        with pytest.raises(ValueError, match="max_workers"):
+            DocumentIngester(
+                tokenizer=fake_tokenizer,
+                max_workers=2,
+                chunk_cache=InMemoryCacheBackend(default_ttl=None),
+            )
+
 
 class TestContextItemCompatibility:
     """Verify ingested items are compatible with retriever.index()."""
@@ -239,11 +531,29 @@ class TestMetadataModule:
         assert id1 == id2
         assert len(id1) == 16
 
+    def test_generate_doc_id_is_stable(self) -> None:
+        """IDs are pinned so accidental hash changes are caught."""
+        assert generate_doc_id("hello", "path.txt") == "04b7beb6064b8272"
+
     def test_generate_doc_id_varies_with_content(self) -> None:
         id1 = generate_doc_id("hello")
         id2 = generate_doc_id("world")
         assert id1 != id2
 
+    def test_generate_doc_id_samples_large_text_on_request(self) -> None:
+        from anchor.ingestion.metadata import DOC_ID_SAMPLE_THRESHOLD
+
+        size = DOC_ID_SAMPLE_THRESHOLD * 2
+        base = ["a"] * size
+        edited = base.copy()
+        edited[size // 4] = "b"  # outside the head/middle/tail samples
+        text, other = "".join(base), "".join(edited)
+
+        assert generate_doc_id(text) != generate_doc_id(other)
+        assert generate_doc_id(text, sample=True) == generate_doc_id(other, sample=True)
+        assert generate_doc_id(text, sample=True) != generate_doc_id(text + "a", sample=True)
+        assert generate_doc_id(text, sample=True) != generate_doc_id(text)
+
     def test_generate_doc_id_varies_with_path(self) -> None:
         id1 = generate_doc_id("hello", "a.txt")
         id2 = generate_doc_id("hello", "b.txt")
@@ -277,6 +587,22 @@ class TestMetadataModule:
         result = enricher.enrich("text", 0, 1, {})
         assert result["c"] is True
 
+    def test_metadata_enricher_empty_returns_input(self) -> None:
+        meta = {"a": 1}
+        assert MetadataEnricher().enrich("text", 0, 1, meta) is meta
+
+    def test_metadata_enricher_does_not_mutate_input(self) -> None:
+        def mutate(
+            text: str, idx: int, total: int, meta: dict[str, Any]
+        ) -> dict[str, Any]:
+            meta["mutated"] = True
+            return meta
+
+        meta: dict[str, Any] = {}
+        result = MetadataEnricher(enrichers=[mutate]).enrich("text", 0, 1, meta)
+        assert result == {"mutated": True}
+        assert meta == {}
+
     def test_metadata_enricher_repr(self) -> None:
         enricher = MetadataEnricher()
         assert "MetadataEnricher(enrichers=0)" in repr(enricher)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -44,6 +45,30 @@ class TestPlainTextParser:
         text, _ = parser.parse(latin1_bytes)
         assert "caf" in text
 
+    def test_utf8_bom_is_stripped(self) -> None:
+        text, _ = PlainTextParser().parse(b"\xef\xbb\xbfhello")
+        assert text == "hello"
+
+    def test_utf16_bom_selects_encoding(self) -> None:
+        text, _ = PlainTextParser().parse("naïve text".encode("utf-16"))
+        assert text == "naïve text"
+
+    def test_large_file_is_memory_mapped(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import anchor.ingestion.parsers as parsers_module
+
+        monkeypatch.setattr(parsers_module, "_MMAP_THRESHOLD", 4)
+        utf8 = tmp_path / "big.txt"
+        utf8.write_bytes(b"\xef\xbb\xbfline one\nline two")
+        latin1 = tmp_path / "latin.txt"
+        latin1.write_bytes("café résumé".encode("latin-1"))
+
+        text, meta = PlainTextParser().parse(utf8)
+        assert text == "line one\nline two"
+        assert meta["line_count"] == 2
+        assert PlainTextParser().parse(latin1)[0] == "café résumé"
+
     def test_supported_extensions(self) -> None:
         assert PlainTextParser().supported_extensions == [".txt"]
 
@@ -145,6 +170,29 @@ class TestHTMLParser:
     def test_repr(self) -> None:
         assert repr(HTMLParser()) == "HTMLParser()"
 
+    def test_selectolax_missing_raises(self) -> None:
+        with (
+            patch.dict("sys.modules", {"selectolax": None, "selectolax.lexbor": None}),
+            pytest.raises(ImportError, match="selectolax is required"),
+        ):
+            HTMLParser(use_selectolax=True)
+
+    @pytest.mark.parametrize(
+        "html",
+        [
+            b"<html><head><title> My Page </title><style>x{}</style></head>"
+            b"<body><p>Hello <b>world</b></p><script>bad()</script><div>two</div>"
+            b"tail<br>end</body></html>",
+            b"<p>a<p>b<ul><li>1<li>2</ul>",
+            b"<h1>Head</h1>\n\n\n\n<p>para &amp; more</p>",
+        ],
+    )
+    def test_selectolax_matches_stdlib(self, html: bytes) -> None:
+        pytest.importorskip("selectolax.lexbor")
+        fast = HTMLParser(use_selectolax=True)
+        assert fast.parse(html) == HTMLParser().parse(html)
+        assert repr(fast) == "HTMLParser(use_selectolax=True)"
+
 
 class TestPDFParser:
     """Tests for PDFParser."""
@@ -169,6 +217,27 @@ class TestPDFParser:
             else:
                 sys.modules.pop("pypdf", None)
 
+    def test_joins_non_empty_pages(self) -> None:
+        import types
+
+        class FakePage:
+            def __init__(self, text: str) -> None:
+                self._text = text
+
+            def extract_text(self) -> str:
+                return self._text
+
+        class FakeReader:
+            def __init__(self, _stream: object) -> None:
+                self.pages = [FakePage("page one"), FakePage(""), FakePage("page three")]
+                self.metadata = None
+
+        fake_pypdf = types.SimpleNamespace(PdfReader=FakeReader)
+        with patch.dict("sys.modules", {"pypdf": fake_pypdf}):
+            text, meta = PDFParser().parse(b"%PDF-fake")
+        assert text == "page one\n\npage three"
+        assert meta["page_count"] == 3
+
     def test_supported_extensions(self) -> None:
         assert PDFParser().supported_extensions == [".pdf"]
 
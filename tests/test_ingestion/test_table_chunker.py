@@ -2,6 +2,12 @@
 
 from __future__ import annotations
 
+import re
+import types
+from unittest.mock import patch
+
+import pytest
+
 from anchor.ingestion.chunkers import RecursiveCharacterChunker
 from anchor.ingestion.table_chunker import TableAwareChunker
 from anchor.protocols.ingestion import Chunker
@@ -27,6 +33,17 @@ class TestTableAwareChunker:
         assert len(chunks) >= 1
         assert any("plain text" in c for c in chunks)
 
+    def test_uppercase_html_table_detected(self, fake_tokenizer: FakeTokenizer) -> None:
+        table = "<TABLE><TR><TD>cell one</TD></TR><TR><TD>cell two</TD></TR></TABLE>"
+        chunker = TableAwareChunker(chunk_size=2, tokenizer=fake_tokenizer)
+        chunks = chunker.chunk(f"Before words.\n\n{table}\n\nAfter words.")
+        # Row splitting repeats the preamble and appends its own closing tag
+        assert "<TABLE><TR><TD>cell one</TD></TR></table>" in chunks
+
+    def test_prose_with_few_pipes_passes_through(self, fake_tokenizer: FakeTokenizer) -> None:
+        chunker = TableAwareChunker(chunk_size=50, tokenizer=fake_tokenizer)
+        assert chunker.chunk("  a | b and c | d  ") == ["a | b and c | d"]
+
     def test_markdown_table_preservation(self, fake_tokenizer: FakeTokenizer) -> None:
         chunker = TableAwareChunker(chunk_size=50, tokenizer=fake_tokenizer)
         table = "| Name | Age |\n| ---- | --- |\n| Alice | 30 |\n| Bob | 25 |\n"
@@ -63,6 +80,134 @@ class TestTableAwareChunker:
         for c in chunks:
             assert "Col1" in c
 
+    def test_row_split_counts_each_row_once(self, fake_tokenizer: FakeTokenizer) -> None:
+        calls: list[str] = []
+
+        class CountingTokenizer(FakeTokenizer):
+            def count_tokens(self, text: str) -> int:
+                calls.append(text)
+                return super().count_tokens(text)
+
+        header = "| A | B |\n| - | - |\n"
+        rows = "".join(f"| a{i} | b{i} |\n" for i in range(200))
+        chunker = TableAwareChunker(chunk_size=40, tokenizer=CountingTokenizer())
+        chunks = chunker.chunk(header + rows)
+
+        assert len(calls) < 210  # linear in rows, not quadratic
+        assert all(fake_tokenizer.count_tokens(c) <= 40 for c in chunks)
+        assert sum(c.count("| a") for c in chunks) == 200
+
+    def test_inline_expansion_counts_each_table_once(self) -> None:
+        counted: list[int] = []
+
+        class CountingTokenizer(FakeTokenizer):
+            def count_tokens(self, text: str) -> int:
+                counted.append(len(text))
+                return super().count_tokens(text)
+
+        doc = "\n".join(
+            f"Note {i}.\n\n| A | B |\n| - | - |\n| a{i} | b{i} |\n" for i in range(40)
+        )
+        chunker = TableAwareChunker(chunk_size=10_000, tokenizer=CountingTokenizer())
+        chunks = chunker.chunk(doc)
+
+        assert len(chunks) == 1
+        assert all(f"| a{i} | b{i} |" in chunks[0] for i in range(40))
+        # Linear in the document, not re-counting the growing chunk per table.
+        assert sum(counted) < 3 * len(doc)
+
+    def test_small_tables_skip_token_counting(self) -> None:
+        counted: list[str] = []
+
+        class CountingTokenizer(FakeTokenizer):
+            def count_tokens(self, text: str) -> int:
+                counted.append(text)
+                return super().count_tokens(text)
+
+        table = "| A | B |\n| - | - |\n| 1 | 2 |"
+        chunker = TableAwareChunker(
+            chunk_size=200, tokenizer=CountingTokenizer(), max_tokens_per_byte=1
+        )
+        assert chunker.chunk(f"Intro.\n\n{table}") == [f"Intro.\n\n{table}"]
+        assert chunker.chunk(table) == [table]
+        # Under chunk_size bytes, a table cannot exceed chunk_size tokens.
+        assert not any("| 1 | 2 |" in text for text in counted)
+
+    def test_byte_size_shortcut_is_opt_in(self) -> None:
+        counted: list[str] = []
+
+        class CountingTokenizer(FakeTokenizer):
+            def count_tokens(self, text: str) -> int:
+                counted.append(text)
+                return super().count_tokens(text)
+
+        table = "| A | B |\n| - | - |\n| 1 | 2 |"
+        chunker = TableAwareChunker(chunk_size=200, tokenizer=CountingTokenizer())
+        assert chunker.chunk(table) == [table]
+        # Without a per-byte bound even a tiny table is counted.
+        assert table in counted
+        with pytest.raises(ValueError, match="max_tokens_per_byte"):
+            TableAwareChunker(max_tokens_per_byte=0)
+
+    def test_row_split_balances_chunks(self, fake_tokenizer: FakeTokenizer) -> None:
+        header = "| A | B |\n| - | - |\n"
+        rows = "".join(f"| a{i} | b{i} |\n" for i in range(5))
+        # Header is 10 tokens and each row 5: greedy packing would give
+        # 4 rows + 1 row, the balanced split gives 3 + 2.
+        chunker = TableAwareChunker(chunk_size=30, tokenizer=fake_tokenizer)
+        chunks = chunker.chunk(header + rows)
+        assert [c.count("| a") for c in chunks] == [3, 2]
+
+    def test_row_split_never_emits_header_only_chunk(
+        self, fake_tokenizer: FakeTokenizer
+    ) -> None:
+        header = "| A | B |\n| - | - |\n"
+        rows = "".join(f"| a{i} | b{i} |\n" for i in range(3))
+        chunker = TableAwareChunker(chunk_size=12, tokenizer=fake_tokenizer)
+        chunks = chunker.chunk(header + rows)
+        assert len(chunks) == 3
+        assert all("| a" in c for c in chunks)
+
+    def test_oversized_markdown_row_split_by_columns(
+        self, fake_tokenizer: FakeTokenizer
+    ) -> None:
+        left, right = "a b c d e f", "g h i j k l"
+        table = f"| A | B |\n| - | - |\n| {left} | {right} |\n"
+        chunker = TableAwareChunker(chunk_size=14, tokenizer=fake_tokenizer)
+        assert chunker.chunk(table) == [
+            f"| A |\n| - |\n| {left} |",
+            f"| B |\n| - |\n| {right} |",
+        ]
+
+    def test_html_row_split_closes_table_once(self, fake_tokenizer: FakeTokenizer) -> None:
+        table = "<table><tr><td>a b</td></tr><tr><td>c d</td></tr></table>"
+        chunker = TableAwareChunker(chunk_size=2, tokenizer=fake_tokenizer)
+        assert chunker.chunk(table) == [
+            "<table><tr><td>a b</td></tr></table>",
+            "<table><tr><td>c d</td></tr></table>",
+        ]
+
+    def test_oversized_html_row_split_by_cells(self, fake_tokenizer: FakeTokenizer) -> None:
+        left, right = "<td>a b c d e f</td>", "<td>g h i j k l</td>"
+        table = f"<table><tr>{left}{right}</tr></table>"
+        chunker = TableAwareChunker(chunk_size=10, tokenizer=fake_tokenizer)
+        assert chunker.chunk(table) == [
+            f"<table><tr>{left}</tr></table>",
+            f"<table><tr>{right}</tr></table>",
+        ]
+
+    def test_markdown_before_html_table_no_placeholder_leak(
+        self, fake_tokenizer: FakeTokenizer
+    ) -> None:
+        md = "| A | B |\n| - | - |\n| a0 | b0 |\n| a1 | b1 |\n"
+        html = "<table><tr><td>x0 y</td></tr><tr><td>x1 y</td></tr></table>"
+        chunker = TableAwareChunker(chunk_size=8, tokenizer=fake_tokenizer)
+        chunks = chunker.chunk(f"intro words\n\n{md}\n{html}")
+
+        assert not any("__TABLE_" in c for c in chunks)
+        joined = "\n".join(chunks)
+        assert joined.index("a0") < joined.index("x0")
+
     def test_markdown_header_preserved(self, fake_tokenizer: FakeTokenizer) -> None:
         header = "| Name | Score |\n| ---- | ----- |\n"
         rows = "".join(f"| Student{i} | {i * 10} |\n" for i in range(15))
@@ -100,6 +245,48 @@ class TestTableAwareChunker:
         # The inner chunker should split at 5 words
         assert len(chunks) >= 2
 
+    def test_re2_engine_used(self, fake_tokenizer: FakeTokenizer) -> None:
+        compiled: list[str] = []
+
+        def fake_compile(pattern: str) -> re.Pattern[str]:
+            compiled.append(pattern)
+            return re.compile(pattern)
+
+        with patch.dict("sys.modules", {"re2": types.SimpleNamespace(compile=fake_compile)}):
+            chunker = TableAwareChunker(chunk_size=50, tokenizer=fake_tokenizer, use_re2=True)
+        table = "| A | B |\n| - | - |\n| 1 | 2 |"
+        assert chunker.chunk(f"Intro text.\n\n{table}") == [f"Intro text.\n\n{table}"]
+        assert len(compiled) == 1
+
+    def test_re2_matches_re(self) -> None:
+        re2 = pytest.importorskip("re2")
+        from anchor.ingestion.table_chunker import _TABLE_PATTERN, _TABLE_RE
+
+        pattern = re2.compile(_TABLE_PATTERN)
+        docs = [
+            "Intro\n\n| A | B |\n| - | - |\n| 1 | 2 |\n\nmid <table><tr><td>x</td></tr></table>",
+            "<TABLE class='x'>\n<tr><th>H | I</th></tr>\n</TABLE>\n| a |\n| b |",
+            "  | indented | row |\n\t| tab | row |\nno table | here",
+            "<table\n><tr><td>caf\u00e9</td></tr></table>",
+            "| a |\u00a0\n| b |\n",
+            "unclosed <table> forever",
+            "| only one row |\n",
+        ]
+        for doc in docs:
+            expected = [(m.start(), m.end()) for m in _TABLE_RE.finditer(doc)]
+            assert [(m.start(), m.end()) for m in pattern.finditer(doc)] == expected
+        # Known difference: RE2's \s is ASCII-only and excludes \v
+        for doc in ("<table\v></table>", "<table\u2003></table>"):
+            assert list(_TABLE_RE.finditer(doc))
+            assert not list(pattern.finditer(doc))
+
+    def test_re2_missing_raises(self, fake_tokenizer: FakeTokenizer) -> None:
+        with (
+            patch.dict("sys.modules", {"re2": None}),
+            pytest.raises(ImportError, match="re2"),
+        ):
+            TableAwareChunker(tokenizer=fake_tokenizer, use_re2=True)
+
     def test_repr(self, fake_tokenizer: FakeTokenizer) -> None:
         chunker = TableAwareChunker(chunk_size=256, tokenizer=fake_tokenizer)
         r = repr(chunker)
@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 import math
-from collections.abc import Callable
+import types
+from collections.abc import Callable, Iterator
+from typing import Any
+from unittest.mock import patch
 
-from anchor.memory.consolidator import SimilarityConsolidator
+import pytest
+
+from anchor.memory.consolidator import SimilarityConsolidator, _numba_dot
 from anchor.models.memory import MemoryEntry
 from anchor.protocols.memory import MemoryOperation
 
@@ -111,6 +116,7 @@ class TestSimilarityConsolidatorUpdate:
         assert action == MemoryOperation.UPDATE
         assert merged is not None
         assert merged.content == "this is a longer content string"
+        assert merged.content_hash == new_entry.content_hash
 
     def test_merged_entry_keeps_existing_when_longer(self) -> None:
         consolidator = SimilarityConsolidator(
@@ -125,6 +131,7 @@ class TestSimilarityConsolidatorUpdate:
         assert action == MemoryOperation.UPDATE
         assert merged is not None
         assert merged.content == "existing content that is much longer"
+        assert merged.content_hash == existing.content_hash
 
     def test_merged_entry_combines_tags(self) -> None:
         consolidator = SimilarityConsolidator(
@@ -170,6 +177,26 @@ class TestSimilarityConsolidatorUpdate:
         assert merged is not None
         assert merged.relevance_score == 0.9
 
+    def test_merges_into_first_entry_above_threshold(self) -> None:
+        vectors = {
+            "old one": [0.9, math.sqrt(1 - 0.81)],
+            "old two": [1.0, 0.0],
+            "new": [1.0, 0.0],
+        }
+        consolidator = SimilarityConsolidator(
+            embed_fn=lambda text: vectors[text],
+            similarity_threshold=0.85,
+        )
+        first = MemoryEntry(content="old one")
+        second = MemoryEntry(content="old two")
+
+        (action, merged), = consolidator.consolidate(
+            [MemoryEntry(content="new")], [first, second]
+        )
+        assert action == MemoryOperation.UPDATE
+        assert merged is not None
+        assert merged.id == first.id
+
 
 class TestSimilarityConsolidatorAdd:
     """Low similarity returns 'add'."""
@@ -188,6 +215,74 @@ class TestSimilarityConsolidatorAdd:
         assert action == MemoryOperation.ADD
         assert entry is new_entry
 
+    def test_similarity_ignores_embedding_magnitude(self) -> None:
+        def scaled_embed(text: str) -> list[float]:
+            scale = 10.0 if "again" in text else 0.5
+            return [scale * 3.0, scale * 4.0]
+
+        consolidator = SimilarityConsolidator(embed_fn=scaled_embed, similarity_threshold=0.99)
+        existing = MemoryEntry(content="User likes Python")
+        new_entry = MemoryEntry(content="User likes Python again")
+
+        (action, _), = consolidator.consolidate([new_entry], [existing])
+        assert action == MemoryOperation.UPDATE
+
+    def test_dimension_mismatch_raises(self) -> None:
+        def uneven_embed(text: str) -> list[float]:
+            return [1.0, 0.0, 0.0] if "new" in text else [1.0, 0.0]
+
+        consolidator = SimilarityConsolidator(embed_fn=uneven_embed)
+        with pytest.raises(ValueError, match="dimensionality"):
+            consolidator.consolidate(
+                [MemoryEntry(content="new fact")], [MemoryEntry(content="old fact")]
+            )
+
+    def test_embed_batch_used_when_available(self) -> None:
+        batches: list[list[str]] = []
+
+        class BatchEmbed:
+            def __call__(self, text: str) -> list[float]:
+                raise AssertionError("per-text embedding should not be used")
+
+            def embed_batch(self, texts: list[str]) -> list[list[float]]:
+                batches.append(texts)
+                return [_fake_embed(text) for text in texts]
+
+        consolidator = SimilarityConsolidator(embed_fn=BatchEmbed())
+        existing = [MemoryEntry(content="old one"), MemoryEntry(content="old two")]
+        new = [
+            MemoryEntry(content="new one"),
+            MemoryEntry(content="old one"),  # exact duplicate, never embedded
+            MemoryEntry(content="new two"),
+        ]
+        results = consolidator.consolidate(new, existing)
+
+        assert batches == [["old one", "old two"], ["new one", "new two"]]
+        assert [action for action, _ in results][1] == MemoryOperation.NONE
+
+        consolidator.consolidate([MemoryEntry(content="new three")], existing)
+        assert batches[-1] == ["new three"]  # existing embeddings are cached
+
+    def test_full_cache_drops_deleted_entries_before_clearing(self) -> None:
+        embedded: list[str] = []
+
+        def counting_embed(text: str) -> list[float]:
+            embedded.append(text)
+            return make_orthogonal_embed()(text)
+
+        consolidator = SimilarityConsolidator(embed_fn=counting_embed, max_cache_size=4)
+        a, b, c = (MemoryEntry(content=f"fact {n}") for n in "abc")
+        d = MemoryEntry(content="fact d")
+        consolidator.consolidate([d], [a, b, c])
+        assert embedded == ["fact a", "fact b", "fact c", "fact d"]
+
+        # "a" was deleted from the store; its row is reclaimed instead of
+        # the whole cache being cleared and the store re-embedded.
+        e = MemoryEntry(content="fact e")
+        consolidator.consolidate([e], [b, c, d])
+        consolidator.consolidate([], [b, c, d, e])
+        assert embedded[4:] == ["fact e"]
+
     def test_empty_existing_all_entries_are_add(self) -> None:
         consolidator = SimilarityConsolidator(embed_fn=_fake_embed)
         new_entries = [
@@ -229,17 +324,61 @@ class TestSimilarityConsolidatorMultiple:
         assert results == []
 
 
+class TestSimilarityConsolidatorNumba:
+    """use_numba=True routes similarity through a compiled kernel."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_kernel(self) -> Iterator[None]:
+        # The compiled kernel is memoised per process; isolate each test.
+        _numba_dot.cache_clear()
+        yield
+        _numba_dot.cache_clear()
+
+    def test_numba_kernel_used(self) -> None:
+        pytest.importorskip("numpy")
+        compiled: list[str] = []
+
+        def fake_njit(**_options: Any) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+            def wrap(fn: Callable[..., Any]) -> Callable[..., Any]:
+                compiled.append(fn.__name__)
+                return fn
+
+            return wrap
+
+        with patch.dict("sys.modules", {"numba": types.SimpleNamespace(njit=fake_njit)}):
+            consolidator = SimilarityConsolidator(
+                embed_fn=_identical_embed,
+                similarity_threshold=0.9,
+                use_numba=True,
+            )
+        existing = MemoryEntry(content="User likes Python")
+        (action, merged), = consolidator.consolidate(
+            [MemoryEntry(content="User loves Python")], [existing]
+        )
+        assert compiled == ["_float32_dot"]
+        assert action == MemoryOperation.UPDATE
+        assert merged is not None
+        assert merged.id == existing.id
+
+        with patch.dict("sys.modules", {"numba": types.SimpleNamespace(njit=fake_njit)}):
+            SimilarityConsolidator(embed_fn=_identical_embed, use_numba=True)
+        assert compiled == ["_float32_dot"]
+
+    def test_numba_missing_raises(self) -> None:
+        with (
+            patch.dict("sys.modules", {"numba": None}),
+            pytest.raises(ImportError, match="numba"),
+        ):
+            SimilarityConsolidator(embed_fn=_fake_embed, use_numba=True)
+
+
 class TestSimilarityConsolidatorValidation:
     """Constructor validation."""
 
     def test_invalid_threshold_above_one(self) -> None:
-        import pytest
-
         with pytest.raises(ValueError, match="similarity_threshold"):
             SimilarityConsolidator(embed_fn=_fake_embed, similarity_threshold=1.5)
 
     def test_invalid_threshold_below_zero(self) -> None:
-        import pytest
-
         with pytest.raises(ValueError, match="similarity_threshold"):
             SimilarityConsolidator(embed_fn=_fake_embed, similarity_threshold=-0.1)
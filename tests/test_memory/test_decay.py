@@ -11,6 +11,9 @@ from anchor.memory.decay import (
     ExponentialRecencyScorer,
     LinearDecay,
     LinearRecencyScorer,
+    compute_retention_batch,
+    decayed_indices,
+    recency_scores,
 )
 from anchor.models.memory import MemoryEntry
 
@@ -113,6 +116,76 @@ class TestLinearDecay:
             LinearDecay(half_life_hours=-5)
 
 
+class TestComputeRetentionBatch:
+    """Batch retention scoring against a single reference time."""
+
+    @pytest.mark.parametrize("decay", [EbbinghausDecay(base_strength=10.0), LinearDecay()])
+    def test_batch_matches_scalar_at_fixed_now(
+        self, decay: EbbinghausDecay | LinearDecay
+    ) -> None:
+        now = datetime(2025, 1, 2, tzinfo=UTC)
+        entries = [
+            MemoryEntry(
+                content="x", last_accessed=now - timedelta(hours=h), access_count=h % 3
+            )
+            for h in (0, 5, 50, 500)
+        ]
+        expected = [decay._retention(entry, now) for entry in entries]
+        assert decay.compute_retention_batch(entries, now) == expected
+        assert compute_retention_batch(decay, entries, now) == expected
+        assert expected[0] == 1.0
+
+    def test_helper_falls_back_to_scalar(self) -> None:
+        class ConstantDecay:
+            def compute_retention(self, entry: MemoryEntry) -> float:
+                return 0.25
+
+        entries = [_make_entry(), _make_entry(hours_ago=3.0)]
+        assert compute_retention_batch(ConstantDecay(), entries) == [0.25, 0.25]
+
+    def test_batch_defaults_to_current_time(self) -> None:
+        entries = [_make_entry(hours_ago=0.0), _make_entry(hours_ago=1000.0)]
+        fresh, stale = EbbinghausDecay().compute_retention_batch(entries)
+        assert fresh > 0.95
+        assert stale == 0.0
+
+
+class TestDecayedIndices:
+    """Threshold selection without scoring every entry."""
+
+    @pytest.mark.parametrize(
+        "decay",
+        [EbbinghausDecay(), EbbinghausDecay(base_strength=10.0), LinearDecay(half_life_hours=24)],
+    )
+    @pytest.mark.parametrize("threshold", [-1.0, 0.0, 0.05, 0.1, 0.5, 0.99, 1.0, 1.5])
+    def test_matches_scored_threshold(
+        self, decay: EbbinghausDecay | LinearDecay, threshold: float
+    ) -> None:
+        now = datetime(2025, 1, 2, tzinfo=UTC)
+        entries = [
+            MemoryEntry(
+                content="x", last_accessed=now - timedelta(hours=h), access_count=h % 4
+            )
+            for h in (-2, 0, 1, 3, 7, 20, 40, 60, 500)
+        ]
+        scores = decay.compute_retention_batch(entries, now)
+        expected = [i for i, score in enumerate(scores) if score < threshold]
+        assert decay.decayed_indices(entries, threshold, now) == expected
+        assert decayed_indices(decay, entries, threshold, now) == expected
+
+    def test_helper_falls_back_to_scores(self) -> None:
+        class SplitDecay:
+            def compute_retention(self, entry: MemoryEntry) -> float:
+                return 0.05 if entry.access_count else 0.9
+
+        entries = [_make_entry(), _make_entry(access_count=1), _make_entry()]
+        assert decayed_indices(SplitDecay(), entries, 0.1) == [1]
+
+    def test_huge_strength_never_decays(self) -> None:
+        decay = EbbinghausDecay(base_strength=1e300)
+        assert decay.decayed_indices([_make_entry(hours_ago=1e6)], 1e-300) == []
+
+
 class TestExponentialRecencyScorer:
     """Exponential recency scoring."""
 
@@ -155,6 +228,33 @@ class TestExponentialRecencyScorer:
             assert 0.0 <= s <= 1.0
 
 
+class TestRecencyScoreAll:
+    """Whole-window scoring matches per-position scoring."""
+
+    @pytest.mark.parametrize(
+        "scorer",
+        [ExponentialRecencyScorer(), ExponentialRecencyScorer(1e-9), LinearRecencyScorer(0.2)],
+    )
+    @pytest.mark.parametrize("total", [0, 1, 2, 7])
+    def test_score_all_matches_score(
+        self, scorer: ExponentialRecencyScorer | LinearRecencyScorer, total: int
+    ) -> None:
+        expected = [scorer.score(i, total) for i in range(total)]
+        assert scorer.score_all(total) == pytest.approx(expected)
+        assert recency_scores(scorer, total) == pytest.approx(expected)
+
+    def test_small_rate_is_nearly_linear(self) -> None:
+        scores = ExponentialRecencyScorer(decay_rate=1e-12).score_all(3)
+        assert scores == pytest.approx([0.0, 0.5, 1.0])
+
+    def test_helper_falls_back_to_score(self) -> None:
+        class HalfScorer:
+            def score(self, index: int, total: int) -> float:
+                return 0.5
+
+        assert recency_scores(HalfScorer(), 3) == [0.5, 0.5, 0.5]
+
+
 class TestLinearRecencyScorer:
     """Linear recency scoring."""
 
@@ -128,6 +128,31 @@ class TestImportanceEviction:
         indices = policy.select_for_eviction(turns, tokens_to_free=5)
         assert all(0 <= idx < len(turns) for idx in indices)
 
+    def test_matches_full_sort_on_large_window(self) -> None:
+        turns = [_make_turn("user", f"t{i}", token_count=1 + i % 5) for i in range(300)]
+        policy = ImportanceEviction(importance_fn=lambda t: float(int(t.content[1:]) % 7))
+        for tokens_to_free in (1, 40, 500, 10_000):
+            ranked = sorted(range(len(turns)), key=lambda i: int(turns[i].content[1:]) % 7)
+            expected: list[int] = []
+            freed = 0
+            for idx in ranked:
+                if freed >= tokens_to_free:
+                    break
+                expected.append(idx)
+                freed += turns[idx].token_count
+            assert policy.select_for_eviction(turns, tokens_to_free) == expected
+
+    def test_scores_each_turn_once(self) -> None:
+        calls: list[str] = []
+
+        def importance(turn: ConversationTurn) -> float:
+            calls.append(turn.content)
+            return 0.0
+
+        turns = [_make_turn("user", f"t{i}", token_count=1) for i in range(100)]
+        ImportanceEviction(importance_fn=importance).select_for_eviction(turns, 90)
+        assert len(calls) == 100
+
 
 class TestPairedEviction:
     """PairedEviction evicts user+assistant pairs together."""
@@ -77,6 +77,28 @@ class TestCallbackExtractorOptionalFields:
         entries = extractor.extract(_make_turns())
         assert entries[0].memory_type == MemoryType.EPISODIC
 
+    def test_does_not_mutate_returned_dicts(self) -> None:
+        raw = {
+            "content": "fact",
+            "memory_type": "episodic",
+            "source_turns": ["2024-01-01T00:00:00+00:00"],
+            "tags": ["a"],
+        }
+        snapshot = dict(raw)
+
+        extractor = CallbackExtractor(extract_fn=lambda _turns: [raw])
+        entries = extractor.extract(_make_turns())
+        assert raw == snapshot
+        assert entries[0].tags == ["a"]
+
+    def test_invalid_memory_type_raises(self) -> None:
+        def extract_fn(_turns: list[ConversationTurn]) -> list[dict[str, Any]]:
+            return [{"content": "fact", "memory_type": "unknown"}]
+
+        extractor = CallbackExtractor(extract_fn=extract_fn)
+        with pytest.raises(ValueError, match="unknown"):
+            extractor.extract(_make_turns())
+
     def test_handles_metadata(self) -> None:
         def extract_fn(_turns: list[ConversationTurn]) -> list[dict[str, Any]]:
             return [{"content": "fact", "metadata": {"source": "chat"}}]
@@ -175,6 +197,16 @@ class TestCallbackExtractorEdgeCases:
         for st in entries[0].source_turns:
             assert isinstance(st, str)
 
+    def test_default_source_turns_not_shared_between_entries(self) -> None:
+        def extract_fn(_turns: list[ConversationTurn]) -> list[dict[str, Any]]:
+            return [{"content": "first"}, {"content": "second"}]
+
+        extractor = CallbackExtractor(extract_fn=extract_fn)
+        first, second = extractor.extract(_make_turns(2))
+        assert first.source_turns == second.source_turns
+        first.source_turns.append("extra")
+        assert len(second.source_turns) == 2
+
     def test_explicit_source_turns_preserved(self) -> None:
         def extract_fn(_turns: list[ConversationTurn]) -> list[dict[str, Any]]:
             return [
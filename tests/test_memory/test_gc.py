@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -198,6 +200,51 @@ class TestCollectExpired:
         assert stats.expired_pruned == 2
         assert stats.total_remaining == 1
 
+    def test_streams_entries_when_store_supports_it(self) -> None:
+        class StreamingStore(SimpleStore):
+            def list_all_unfiltered(self) -> list[MemoryEntry]:
+                raise AssertionError("full listing should not be used")
+
+            def iter_all_unfiltered(self) -> Iterator[MemoryEntry]:
+                yield from list(self._entries.values())
+
+        store = StreamingStore()
+        store.add(_make_entry("e1", "expired1", expired=True))
+        store.add(_make_entry("e2", "fresh"))
+        store.add(_make_entry("e3", "weak"))
+
+        stats = MemoryGarbageCollector(store).collect()
+        assert (stats.expired_pruned, stats.total_remaining) == (1, 2)
+
+        gc = MemoryGarbageCollector(store, decay=FixedDecay({"e3": 0.01}))
+        stats = gc.collect(retention_threshold=0.5)
+        assert (stats.decayed_pruned, stats.total_remaining) == (1, 1)
+        assert [e.id for e in gc.collect_expired()] == []
+
+    def test_uses_batch_delete_when_store_supports_it(self) -> None:
+        batches: list[list[str]] = []
+
+        class BatchStore(SimpleStore):
+            def delete(self, entry_id: str) -> bool:
+                raise AssertionError("per-entry delete should not be used")
+
+            def delete_many(self, entry_ids: list[str]) -> int:
+                batches.append(list(entry_ids))
+                return sum(self._entries.pop(eid, None) is not None for eid in entry_ids)
+
+        store = BatchStore()
+        store.add(_make_entry("e1", "expired1", expired=True))
+        store.add(_make_entry("e2", "expired2", expired=True))
+        store.add(_make_entry("e3", "weak"))
+        store.add(_make_entry("e4", "strong"))
+
+        gc = MemoryGarbageCollector(store, decay=FixedDecay({"e3": 0.01}))
+        stats = gc.collect(retention_threshold=0.5)
+
+        assert stats.total_pruned == 3
+        assert batches == [["e1", "e2"], ["e3"]]
+        assert [e.id for e in store.list_all_unfiltered()] == ["e4"]
+
     def test_no_expired_entries(self) -> None:
         store = SimpleStore()
         store.add(_make_entry("e1", "fresh"))
@@ -258,6 +305,36 @@ class TestCollectDecayed:
         assert stats.decayed_pruned == 0
         assert stats.total_remaining == 1
 
+    def test_decay_selection_hook_gets_shared_clock(self) -> None:
+        """Decays exposing ``decayed_indices`` are asked once, with the GC's clock."""
+        calls: list[tuple[int, float, datetime | None]] = []
+
+        class SelectingDecay:
+            def compute_retention(self, entry: MemoryEntry) -> float:
+                raise AssertionError("per-entry scoring should not be used")
+
+            def decayed_indices(
+                self, entries: list[MemoryEntry], threshold: float, now: datetime | None
+            ) -> list[int]:
+                calls.append((len(entries), threshold, now))
+                return [0]
+
+        store = SimpleStore()
+        store.add(_make_entry("e1", "weak"))
+        store.add(_make_entry("e2", "strong"))
+        store.add(_make_entry("e3", "expired", expired=True))
+        before = datetime.now(UTC)
+        stats = MemoryGarbageCollector(store, decay=SelectingDecay()).collect(0.2)
+
+        assert stats.expired_pruned == 1
+        assert stats.decayed_pruned == 1
+        assert {e.id for e in store.list_all_unfiltered()} == {"e2"}
+        ((count, threshold, now),) = calls
+        assert (count, threshold) == (2, 0.2)
+        assert now is not None
+        assert now >= before
+
+
 
 # ---------------------------------------------------------------------------
 # Tests: collect() -- dry_run
@@ -359,6 +436,48 @@ class TestCollectCallbacks:
         assert len(cb.expiry_calls) == 0
         assert len(cb.decay_calls) == 0
 
+    def test_callbacks_deferred_to_executor(self) -> None:
+        submitted: list[tuple[Any, ...]] = []
+
+        class RecordingExecutor(Executor):
+            def submit(self, fn: Any, /, *args: Any, **kwargs: Any) -> Any:
+                submitted.append((fn, *args))
+                return None
+
+        store = SimpleStore()
+        store.add(_make_entry("e1", "expired", expired=True))
+        store.add(_make_entry("e2", "weak"))
+
+        cb = RecordingGCCallback()
+        gc = MemoryGarbageCollector(
+            store,
+            decay=AlwaysLowDecay(score=0.01),
+            callbacks=[cb],
+            callback_executor=RecordingExecutor(),
+        )
+        stats = gc.collect(retention_threshold=0.5)
+
+        assert stats.total_pruned == 2
+        assert cb.expiry_calls == []
+        assert cb.decay_calls == []
+        assert [call[2] for call in submitted] == ["on_expiry_prune", "on_decay_prune"]
+
+        for fn, *args in submitted:
+            fn(*args)
+        assert [e.id for e in cb.expiry_calls[0]] == ["e1"]
+        assert cb.decay_calls[0][1] == 0.5
+
+    def test_callbacks_run_on_thread_pool(self) -> None:
+        store = SimpleStore()
+        store.add(_make_entry("e1", "expired", expired=True))
+
+        cb = RecordingGCCallback()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            gc = MemoryGarbageCollector(store, callbacks=[cb], callback_executor=executor)
+            gc.collect()
+
+        assert [e.id for e in cb.expiry_calls[0]] == ["e1"]
+
 
 # ---------------------------------------------------------------------------
 # Tests: collect_expired()
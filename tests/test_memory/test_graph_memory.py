@@ -209,6 +209,35 @@ class TestGetRelatedEntities:
         related = graph.get_related_entities("alice", max_depth=0)
         assert related == []
 
+    def test_depth_1_excludes_self_loop(self) -> None:
+        graph = SimpleGraphMemory()
+        graph.add_relationship("alice", "likes", "alice")
+        graph.add_relationship("alice", "knows", "bob")
+        assert graph.get_related_entities("alice", max_depth=1) == ["bob"]
+
+    def test_large_graph_snapshot_matches_set_traversal(self) -> None:
+        """Repeated reads on a large graph switch to the integer snapshot."""
+        graph = SimpleGraphMemory()
+        for i in range(300):
+            graph.add_relationship(f"n{i}", "next", f"n{(i + 1) % 300}")
+            graph.add_relationship(f"n{i}", "skip", f"n{(i * 7) % 300}")
+        expected = [graph.get_related_entities(f"n{i}", max_depth=3) for i in range(10)]
+        assert graph._snapshot is not None
+        assert [
+            graph.get_related_entities(f"n{i}", max_depth=3) for i in range(10)
+        ] == expected
+
+        graph.remove_entity("n1")
+        assert graph._snapshot is None
+        for _ in range(5):
+            assert "n1" not in graph.get_related_entities("n0", max_depth=3)
+
+    def test_depth_beyond_graph_diameter(self) -> None:
+        graph = SimpleGraphMemory()
+        graph.add_relationship("a", "r", "b")
+        graph.add_relationship("b", "r", "c")
+        assert graph.get_related_entities("a", max_depth=10) == ["b", "c"]
+
 
 # ===========================================================================
 # TestGetMemoryIdsForEntity
@@ -358,6 +387,44 @@ class TestRemoveEntity:
         graph.remove_entity("alice")
         assert len(graph) == 1
 
+    def test_traversal_after_removal_skips_removed_entity(self) -> None:
+        graph = SimpleGraphMemory()
+        graph.add_relationship("alice", "knows", "bob")
+        graph.add_relationship("bob", "knows", "carol")
+        graph.get_related_entities("carol")
+        graph.remove_entity("bob")
+        assert graph.get_related_entities("alice") == []
+        assert graph.get_related_entities("carol") == []
+
+    def test_remove_entity_with_self_loop(self) -> None:
+        graph = SimpleGraphMemory()
+        graph.add_relationship("alice", "likes", "alice")
+        graph.add_relationship("alice", "knows", "bob")
+        graph.remove_entity("alice")
+        assert graph.relationships == []
+        assert graph.get_related_entities("bob") == []
+
+    def test_remove_entity_after_its_neighbors_drops_edge_index(self) -> None:
+        graph = SimpleGraphMemory()
+        graph.add_relationship("hub", "r", "nX")
+        graph.remove_entity("nX")
+        graph.remove_entity("hub")
+        assert graph._edge_ids == {}
+        assert graph._adjacency == {}
+
+    def test_remaining_edges_keep_insertion_order(self) -> None:
+        graph = SimpleGraphMemory()
+        graph.add_relationship("carol", "knows", "dave")
+        graph.add_relationship("alice", "knows", "bob")
+        graph.add_relationship("bob", "knows", "carol")
+        graph.add_relationship("bob", "knows", "carol")
+        graph.remove_entity("alice")
+        assert graph.relationships == [
+            ("carol", "knows", "dave"),
+            ("bob", "knows", "carol"),
+            ("bob", "knows", "carol"),
+        ]
+
 
 # ===========================================================================
 # TestClear
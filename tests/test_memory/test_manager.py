@@ -137,3 +137,7 @@ class TestMemoryManagerSlots:
         mgr = make_memory_manager()
         with pytest.raises(AttributeError):
             mgr.some_random_attr = "oops"  # type: ignore[attr-defined]
+
+    def test_has_no_instance_dict(self) -> None:
+        mgr = make_memory_manager()
+        assert not hasattr(mgr, "__dict__")
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
 
 import pytest
 
@@ -114,6 +115,92 @@ class TestMemoryManagerAddFact:
         with pytest.raises(StorageError, match="No persistent_store"):
             mgr.add_fact("some fact")
 
+    def test_add_fact_returns_existing_entry_for_same_content(self) -> None:
+        store = InMemoryEntryStore()
+        mgr = _make_manager(persistent_store=store)
+        first = mgr.add_fact("User prefers dark mode")
+        again = mgr.add_fact("User prefers dark mode", tags=["ignored"])
+        assert again.id == first.id
+        assert len(store.list_all_unfiltered()) == 1
+
+    def test_add_fact_dedup_tracks_deletes_and_updates(self) -> None:
+        store = InMemoryEntryStore()
+        mgr = _make_manager(persistent_store=store)
+        first = mgr.add_fact("old fact")
+        mgr.update_fact(first.id, "new fact")
+        assert mgr.add_fact("new fact").id == first.id
+        assert mgr.add_fact("old fact").id != first.id
+
+        mgr.delete_fact(first.id)
+        assert mgr.add_fact("new fact").id != first.id
+
+    def test_add_fact_dedup_ignores_expired_entries(self) -> None:
+        store = InMemoryEntryStore()
+        mgr = _make_manager(persistent_store=store)
+        stale = MemoryEntry(
+            content="fact", expires_at=datetime.now(UTC) - timedelta(hours=1)
+        )
+        store.add(stale)
+        assert mgr.add_fact("fact").id != stale.id
+
+    def test_add_fact_dedup_scans_stores_without_hash_index(self) -> None:
+        class ScanOnlyStore:
+            def __init__(self) -> None:
+                self.entries: list[MemoryEntry] = []
+
+            def add(self, entry: MemoryEntry) -> None:
+                self.entries.append(entry)
+
+            def list_all(self) -> list[MemoryEntry]:
+                return list(self.entries)
+
+        store = ScanOnlyStore()
+        mgr = _make_manager(persistent_store=store)
+        first = mgr.add_fact("fact")
+        assert mgr.add_fact("fact") is first
+        assert len(store.entries) == 1
+
+    def test_update_fact_ignores_expired_entries(self) -> None:
+        store = InMemoryEntryStore()
+        mgr = _make_manager(persistent_store=store)
+        stale = MemoryEntry(
+            content="fact", expires_at=datetime.now(UTC) - timedelta(hours=1)
+        )
+        store.add(stale)
+        assert mgr.update_fact(stale.id, "new fact") is None
+        assert store.get(stale.id) is stale
+
+    def test_update_fact_with_same_content_keeps_hash(self) -> None:
+        store = InMemoryEntryStore()
+        mgr = _make_manager(persistent_store=store)
+        first = mgr.add_fact("fact")
+        with patch("anchor.memory.manager._compute_content_hash") as compute:
+            updated = mgr.update_fact(first.id, "fact")
+        compute.assert_not_called()
+        assert updated is not None
+        assert updated.content_hash == first.content_hash
+        assert updated.updated_at >= first.updated_at
+        assert store.get(first.id) is updated
+
+    def test_update_fact_scans_stores_without_get(self) -> None:
+        class ScanOnlyStore:
+            def __init__(self) -> None:
+                self.entries: dict[str, MemoryEntry] = {}
+
+            def add(self, entry: MemoryEntry) -> None:
+                self.entries[entry.id] = entry
+
+            def list_all(self) -> list[MemoryEntry]:
+                return list(self.entries.values())
+
+        store = ScanOnlyStore()
+        mgr = _make_manager(persistent_store=store)
+        first = mgr.add_fact("fact")
+        updated = mgr.update_fact(first.id, "new fact")
+        assert updated is not None
+        assert store.entries[first.id].content == "new fact"
+        assert mgr.update_fact("missing", "x") is None
+
 
 class TestMemoryManagerGetRelevantFacts:
     """get_relevant_facts searches the persistent store."""
@@ -247,6 +334,77 @@ class TestMemoryManagerGetContextItemsWithPersistent:
         assert items[0].metadata.get("memory_entry_id") is not None
         assert items[1].metadata.get("role") == "user"
 
+    def test_unchanged_facts_are_not_retokenized(self) -> None:
+        counted: list[str] = []
+
+        class CountingTokenizer(FakeTokenizer):
+            def count_tokens(self, text: str) -> int:
+                counted.append(text)
+                return super().count_tokens(text)
+
+        store = InMemoryEntryStore()
+        mgr = MemoryManager(tokenizer=CountingTokenizer(), persistent_store=store)
+        fact = mgr.add_fact("User likes tea")
+        other = mgr.add_fact("User lives in Lisbon")
+
+        first = mgr.get_context_items()
+        counted.clear()
+        second = mgr.get_context_items()
+        assert counted == []
+        assert [i.id for i in second] == [i.id for i in first]
+
+        store.add(fact.touch())
+        mgr.update_fact(other.id, "User lives in Porto")
+        items = mgr.get_context_items()
+        assert counted == ["User lives in Porto"]
+        assert [i.content for i in items] == ["User likes tea", "User lives in Porto"]
+        assert items[0].token_count == 3
+
+    def test_entry_mutated_in_place_is_rebuilt(self) -> None:
+        store = InMemoryEntryStore()
+        mgr = _make_manager(persistent_store=store)
+        entry = mgr.add_fact("the sky is blue")
+        mgr.get_context_items()
+
+        entry.relevance_score = 0.9
+        entry.content = "the sky is blue at noon"
+        entry.memory_type = MemoryType.EPISODIC
+        item = mgr.get_context_items()[0]
+        assert item.content == "the sky is blue at noon"
+        assert item.score == 0.9
+        assert item.token_count == 6
+        assert item.metadata["memory_type"] == str(MemoryType.EPISODIC)
+
+    def test_new_facts_counted_in_one_batch(self) -> None:
+        batches: list[list[str]] = []
+
+        class BatchTokenizer(FakeTokenizer):
+            def count_tokens(self, text: str) -> int:
+                raise AssertionError("per-text counting should not be used")
+
+            def count_tokens_batch(self, texts: list[str]) -> list[int]:
+                batches.append(list(texts))
+                return [len(t.split()) for t in texts]
+
+        store = InMemoryEntryStore()
+        mgr = MemoryManager(tokenizer=BatchTokenizer(), persistent_store=store)
+        store.add(MemoryEntry(content="one fact"))
+        store.add(MemoryEntry(content="another longer fact"))
+
+        items = mgr.get_context_items()
+        assert batches == [["one fact", "another longer fact"]]
+        assert [i.token_count for i in items] == [2, 3]
+
+    def test_single_new_fact_counted_directly(self) -> None:
+        class BatchTokenizer(FakeTokenizer):
+            def count_tokens_batch(self, texts: list[str]) -> list[int]:
+                raise AssertionError("a single fact should not be batched")
+
+        store = InMemoryEntryStore()
+        mgr = MemoryManager(tokenizer=BatchTokenizer(), persistent_store=store)
+        store.add(MemoryEntry(content="one fact"))
+        assert [i.token_count for i in mgr.get_context_items()] == [2]
+
 
 class TestMemoryManagerExpiredEntries:
     """Expired entries are filtered from get_context_items."""
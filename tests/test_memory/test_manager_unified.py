@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import pytest
+
 from anchor.memory.manager import MemoryManager
 from anchor.memory.sliding_window import SlidingWindowMemory
 from anchor.memory.summary_buffer import SummaryBufferMemory
-from anchor.models.context import SourceType
+from anchor.models.context import ContextItem, SourceType
 from anchor.models.memory import ConversationTurn
 from anchor.storage.json_memory_store import InMemoryEntryStore
 from tests.conftest import FakeTokenizer
@@ -338,6 +340,25 @@ class TestConversationMemoryOverrides:
         )
         assert mgr.conversation is window
 
+    def test_unsupported_conversation_memory_raises_on_add(self) -> None:
+        """Custom backends without an append method fail when a message is added."""
+
+        class ReadOnlyMemory:
+            def __init__(self) -> None:
+                self.turns: list[ConversationTurn] = []
+                self.total_tokens = 0
+
+            def to_context_items(self, priority: int = 7) -> list[ContextItem]:
+                return []
+
+            def clear(self) -> None:
+                pass
+
+        mgr = MemoryManager(conversation_memory=ReadOnlyMemory(), tokenizer=FakeTokenizer())
+        assert mgr.get_context_items() == []
+        with pytest.raises(TypeError, match="ReadOnlyMemory"):
+            mgr.add_user_message("Hello")
+
 
 # ---- Progressive SummaryBufferMemory ----
 
@@ -142,6 +142,59 @@ class TestSlidingWindowToContextItems:
         tokenizer = FakeTokenizer()
         assert items[0].token_count == tokenizer.count_tokens("Hello world")
 
+    def test_unchanged_window_reuses_items(self) -> None:
+        mem = _make_memory(max_tokens=1000)
+        mem.add_turn("user", "Hello")
+        first = mem.to_context_items()
+        second = mem.to_context_items()
+        assert first is not second
+        assert [i.id for i in first] == [i.id for i in second]
+        first.clear()
+        assert len(mem.to_context_items()) == 1
+
+    def test_mutation_invalidates_cached_items(self) -> None:
+        mem = _make_memory(max_tokens=1000)
+        mem.add_turn("user", "Hello")
+        before = mem.to_context_items(priority=7)
+        assert mem.to_context_items(priority=8)[0].priority == 8
+
+        mem.add_turn("assistant", "Hi")
+        after = mem.to_context_items(priority=7)
+        assert len(after) == 2
+        assert after[0].id != before[0].id
+        assert after[0].score == 0.5
+
+        mem.clear()
+        assert mem.to_context_items(priority=7) == []
+
+    def test_surviving_turns_keep_item_identity(self) -> None:
+        mem = _make_memory(max_tokens=1000)
+        mem.add_turn("user", "Hello")
+        mem.add_turn("assistant", "Hi")
+        before = mem.to_context_items()
+        assert before[0].score == 0.5
+
+        mem.add_turn("user", "How are you?")
+        after = mem.to_context_items()
+        assert [i.id for i in after[:2]] == [i.id for i in before]
+        assert [i.score for i in after] == [0.5, 0.75, 1.0]
+        assert after[2].id not in {i.id for i in before}
+
+    def test_turn_edited_in_place_is_rebuilt(self) -> None:
+        mem = _make_memory(max_tokens=1000)
+        turn = mem.add_turn("user", "Hello")
+        mem.to_context_items()
+
+        turn.content = "Hello again"
+        turn.metadata["edited"] = True
+        items = mem.to_context_items()
+        assert items[0].content == "Hello again"
+        assert items[0].metadata == {"role": "user", "edited": True}
+
+        mem.add_turn("assistant", "Hi")
+        turn.token_count = 2
+        assert mem.to_context_items()[0].token_count == 2
+
 
 class TestSlidingWindowClear:
     """clear resets state."""
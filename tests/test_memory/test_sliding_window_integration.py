@@ -209,6 +209,55 @@ class TestPairedEvictionPolicy:
         assert "hello there" in remaining
 
 
+# ---- Custom policies ----
+
+
+class _FixedEviction:
+    """Eviction policy that always selects the same indices."""
+
+    def __init__(self, indices: list[int]) -> None:
+        self.indices = indices
+
+    def select_for_eviction(
+        self, turns: list[ConversationTurn], tokens_to_free: int
+    ) -> list[int]:
+        return self.indices
+
+
+class TestCustomEvictionPolicy:
+    """Indices from a policy are applied to the turns it was shown."""
+
+    def test_evicted_turns_reported_oldest_first(self) -> None:
+        evicted: list[list[str]] = []
+        mem = _make_memory(
+            max_tokens=3,
+            eviction_policy=_FixedEviction([2, 0]),
+            on_evict=lambda turns: evicted.append([t.content for t in turns]),
+        )
+        for content in ("a", "b", "c"):
+            mem.add_turn("user", content)
+        mem.add_turn("user", "d")
+
+        assert evicted == [["a", "c"]]
+        assert [t.content for t in mem.turns] == ["b", "d"]
+        assert mem.total_tokens == 2
+
+    def test_negative_index_selects_from_the_end(self) -> None:
+        mem = _make_memory(max_tokens=2, eviction_policy=_FixedEviction([-1]))
+        mem.add_turn("user", "a")
+        mem.add_turn("user", "b")
+        mem.add_turn("user", "c")
+        assert [t.content for t in mem.turns] == ["a", "c"]
+
+    def test_empty_selection_keeps_window(self) -> None:
+        mem = _make_memory(max_tokens=2, eviction_policy=_FixedEviction([]))
+        mem.add_turn("user", "a")
+        mem.add_turn("user", "b")
+        mem.add_turn("user", "c")
+        assert [t.content for t in mem.turns] == ["a", "b", "c"]
+        assert mem.total_tokens == 3
+
+
 # ---- ExponentialRecencyScorer ----
 
 
@@ -158,6 +158,29 @@ class TestSummaryBufferEvictionProducesSummary:
         tokenizer = FakeTokenizer()
         assert buf.summary_tokens == tokenizer.count_tokens(buf.summary)  # type: ignore[arg-type]
 
+    def test_unchanged_summary_is_not_recounted(self) -> None:
+        counted: list[str] = []
+
+        class RecordingTokenizer(FakeTokenizer):
+            def count_tokens(self, text: str) -> int:
+                counted.append(text)
+                return super().count_tokens(text)
+
+        def keep_first(turns: list[ConversationTurn], prev: str | None) -> str:
+            return prev if prev is not None else "Summary: start"
+
+        buf = SummaryBufferMemory(
+            max_tokens=3,
+            progressive_compact_fn=keep_first,
+            tokenizer=RecordingTokenizer(),
+        )
+        for content in ("one two", "three four", "five six", "seven eight"):
+            buf.add_message("user", content)
+
+        assert buf.summary == "Summary: start"
+        assert buf.summary_tokens == 2
+        assert counted.count("Summary: start") == 1
+
 
 class TestSummaryBufferToContextItems:
     """to_context_items returns summary + window items."""
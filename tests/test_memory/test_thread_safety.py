@@ -163,6 +163,26 @@ class TestSlidingWindowThreadSafety:
         expected_tokens = sum(t.token_count for t in turns)
         assert mem.total_tokens == expected_tokens
 
+    def test_lock_free_total_stays_within_budget(self) -> None:
+        """Readers of total_tokens never observe a half-applied eviction."""
+        mem = _make_sliding_window(max_tokens=10)
+        barrier = threading.Barrier(NUM_THREADS)
+        observed: list[int] = []
+
+        def reader() -> None:
+            barrier.wait()
+            for _ in range(TURNS_PER_THREAD * 10):
+                observed.append(mem.total_tokens)
+
+        targets: list[Callable[[], None]] = [
+            lambda tid=t: _sliding_window_writer(mem, barrier, tid)
+            for t in range(NUM_THREADS // 2)
+        ]
+        targets.extend(reader for _ in range(NUM_THREADS // 2))
+        _run_threads(targets)
+
+        assert all(0 <= total <= mem.max_tokens for total in observed)
+
 
 class TestSummaryBufferThreadSafety:
     """Verify SummaryBufferMemory is safe under concurrent access."""
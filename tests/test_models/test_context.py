@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import uuid
+
 import pytest
 from pydantic import ValidationError
 
@@ -52,6 +54,15 @@ class TestContextItemCreation:
             item = ContextItem(content="x", source=src)
             assert item.source == src
 
+    def test_default_ids_are_unique_uuid4_strings(self) -> None:
+        ids = [ContextItem(content="x", source=SourceType.MEMORY).id for _ in range(200)]
+        assert len(set(ids)) == len(ids)
+        for item_id in ids:
+            parsed = uuid.UUID(item_id)
+            assert str(parsed) == item_id
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+
 
 # ---------------------------------------------------------------------------
 # ContextItem is frozen
@@ -176,6 +176,57 @@ class TestSharedExtraMethods:
         entry_store.add(_make_entry(entry_id="y1", user_id="dave"))  # type: ignore[attr-defined]
         assert entry_store.delete_by_user("nobody") == 0
 
+    def test_delete_many_returns_count_of_deleted(
+        self, entry_store: BaseEntryStoreMixin
+    ) -> None:
+        entry_store.add(_make_entry(entry_id="m1"))  # type: ignore[attr-defined]
+        entry_store.add(_make_entry(entry_id="m2"))  # type: ignore[attr-defined]
+        entry_store.add(_make_entry(entry_id="m3"))  # type: ignore[attr-defined]
+
+        assert entry_store.delete_many(["m1", "m3", "missing"]) == 2
+        assert entry_store.get("m1") is None
+        assert entry_store.get("m2") is not None
+        assert entry_store.get("m3") is None
+
+
+# ---------------------------------------------------------------------------
+# find_by_content_hash
+# ---------------------------------------------------------------------------
+
+
+class TestSharedFindByContentHash:
+    """The content-hash index follows every mutation."""
+
+    def test_finds_entry_and_follows_mutations(
+        self, entry_store: BaseEntryStoreMixin
+    ) -> None:
+        entry = _make_entry(entry_id="h1", content="alpha")
+        entry_store.add(entry)  # type: ignore[attr-defined]
+        assert entry_store.find_by_content_hash(entry.content_hash) == entry
+
+        replaced = _make_entry(entry_id="h1", content="beta")
+        entry_store.add(replaced)  # type: ignore[attr-defined]
+        assert entry_store.find_by_content_hash(entry.content_hash) is None
+        assert entry_store.find_by_content_hash(replaced.content_hash) == replaced
+
+        entry_store.delete("h1")  # type: ignore[attr-defined]
+        assert entry_store.find_by_content_hash(replaced.content_hash) is None
+
+        entry_store.add(_make_entry(entry_id="h2", content="gamma"))  # type: ignore[attr-defined]
+        entry_store.clear()  # type: ignore[attr-defined]
+        assert entry_store.find_by_content_hash(
+            _make_entry(content="gamma").content_hash
+        ) is None
+
+    def test_skips_expired_duplicates(self, entry_store: BaseEntryStoreMixin) -> None:
+        past = datetime.now(UTC) - timedelta(hours=1)
+        stale = _make_entry(entry_id="x1", content="same", expires_at=past)
+        fresh = _make_entry(entry_id="x2", content="same")
+        entry_store.add(stale)  # type: ignore[attr-defined]
+        assert entry_store.find_by_content_hash(stale.content_hash) is None
+        entry_store.add(fresh)  # type: ignore[attr-defined]
+        assert entry_store.find_by_content_hash(stale.content_hash) == fresh
+
 
 # ---------------------------------------------------------------------------
 # search_filtered
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -138,6 +139,22 @@ class TestJsonFileStoreDeleteByUserPersistence:
         assert new_store.get("u2") is None
         assert new_store.get("u3") is not None
 
+    def test_delete_many_persists_once(
+        self, store: JsonFileMemoryStore, store_path: Path
+    ) -> None:
+        for eid in ("d1", "d2", "d3"):
+            store.add(_make_entry(entry_id=eid))
+
+        with patch.object(JsonFileMemoryStore, "_maybe_save") as save:
+            assert store.delete_many(["d1", "d2"]) == 2
+        save.assert_called_once()
+        store.save()
+
+        new_store = JsonFileMemoryStore(store_path)
+        assert new_store.get("d1") is None
+        assert new_store.get("d2") is None
+        assert new_store.get("d3") is not None
+
 
 # ---------------------------------------------------------------------------
 # export_user_entries (JsonFileMemoryStore-specific)
@@ -11,7 +11,7 @@ from __future__ import annotations
 from unittest.mock import patch
 
 from anchor.protocols.tokenizer import Tokenizer
-from anchor.tokens.counter import TiktokenCounter
+from anchor.tokens.counter import TiktokenCounter, count_tokens_batch
 from tests.conftest import FakeTokenizer
 
 
@@ -24,6 +24,10 @@ class _MockEncoding:
             return []
         return list(range(len(text.split())))
 
+    def encode_batch(self, texts: list[str]) -> list[list[int]]:
+        """Encode several texts at once."""
+        return [self.encode(text) for text in texts]
+
     def decode(self, tokens: list[int]) -> str:
         """Decode is not perfectly invertible but sufficient for testing truncation."""
         # This is used after encoding then slicing, so we approximate
@@ -62,6 +66,66 @@ class TestTiktokenCounterCountTokens:
         assert counter.count_tokens(text) == counter.count_tokens(text)
 
 
+class TestTiktokenCounterCountTokensBatch:
+    """count_tokens_batch method."""
+
+    def test_matches_single_counts(self) -> None:
+        counter = _make_counter()
+        texts = ["one", "two words", "", "three little words"]
+        assert counter.count_tokens_batch(texts) == [counter.count_tokens(t) for t in texts]
+
+    def test_uses_cache_for_known_strings(self) -> None:
+        counter = _make_counter()
+        counter.count_tokens("cached text")
+        with patch.object(
+            counter._encoding, "encode", wraps=counter._encoding.encode
+        ) as spy:
+            assert counter.count_tokens_batch(["cached text", "new one"]) == [2, 2]
+        spy.assert_called_once_with("new one")
+
+    def test_all_cached_skips_encode(self) -> None:
+        counter = _make_counter()
+        counter.count_tokens("a b")
+        with (
+            patch.object(counter._encoding, "encode") as encode,
+            patch.object(counter._encoding, "encode_batch") as encode_batch,
+        ):
+            assert counter.count_tokens_batch(["a b"]) == [2]
+        encode.assert_not_called()
+        encode_batch.assert_not_called()
+
+    def test_small_batch_never_reaches_encode_batch(self) -> None:
+        # encode_batch starts a thread pool per call; small batches loop instead
+        counter = _make_counter()
+        texts = [f"word {i}" for i in range(20)]
+        with patch.object(counter._encoding, "encode_batch") as encode_batch:
+            assert counter.count_tokens_batch(texts) == [2] * 20
+        encode_batch.assert_not_called()
+
+    def test_large_batch_uses_encode_batch(self) -> None:
+        counter = _make_counter()
+        texts = [f"{i} " + "x " * 20_000 for i in range(8)]
+        with patch.object(
+            counter._encoding, "encode_batch", wraps=counter._encoding.encode_batch
+        ) as encode_batch:
+            assert counter.count_tokens_batch(texts) == [20_001] * 8
+        encode_batch.assert_called_once_with(texts)
+
+
+class TestCountTokensBatchHelper:
+    """count_tokens_batch module-level helper."""
+
+    def test_falls_back_to_count_tokens(self) -> None:
+        assert count_tokens_batch(FakeTokenizer(), ["a b", "c", ""]) == [2, 1, 0]
+
+    def test_prefers_batch_method(self) -> None:
+        class BatchTokenizer(FakeTokenizer):
+            def count_tokens_batch(self, texts: list[str]) -> list[int]:
+                return [7] * len(texts)
+
+        assert count_tokens_batch(BatchTokenizer(), ["x", "y"]) == [7, 7]
+
+
 class TestTiktokenCounterTruncate:
     """truncate_to_tokens method."""
 